@@ -1,17 +1,21 @@
-import time
-import functools
-from typing import Callable, Any, TypeVar, Tuple
+import sys
+import importlib.util
+from pathlib import Path
 
 
-T = TypeVar("T")
+# The implementation lives in Project/backend/utils/timing.py, shared with the backend;
+# it is loaded by path so notebooks here keep `from timed import timed, measure`.
+_TIMING_PATH = Path(__file__).resolve().parents[1] / "Project" / "backend" / "utils" / "timing.py"
+_spec = importlib.util.spec_from_file_location("_shared_timing", _TIMING_PATH)
+_timing = sys.modules.setdefault(_spec.name, importlib.util.module_from_spec(_spec))
+if not hasattr(_timing, "measure"):
+    _spec.loader.exec_module(_timing)
 
+TimingSamples = _timing.TimingSamples
+calibrate_clock = _timing.calibrate_clock
+calibrate_loop = _timing.calibrate_loop
+autorange = _timing.autorange
+measure = _timing.measure
+timed = _timing.timed
 
-def timed(func: Callable[..., T]) -> Callable[..., Tuple[T, float]]:
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Tuple[T, float]:
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        elapsed = time.perf_counter() - start
-        return result, elapsed
-    return wrapper
-
+__all__ = ["TimingSamples", "calibrate_clock", "calibrate_loop", "autorange", "measure", "timed"]
@@ -1,12 +1,38 @@
+import os
+import socket
+import asyncio
+import contextlib
 from fastapi import FastAPI
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from routes.benchmark import router as benchmark_router
+from routes.workloads import router as workloads_router
+from routes.cluster import router as cluster_router, register_with_coordinator
+from utils.metrics import REGISTRY, MetricsMiddleware, probe_event_loop_lag
+
+
+PORT = int(os.getenv("PORT", 8000))
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = [asyncio.create_task(probe_event_loop_lag())]
+    # Worker mode: announce this instance to a coordinator (see routes/cluster.py).
+    if os.getenv("COORDINATOR_URL"):
+        worker_url = os.getenv("WORKER_URL", f"http://{socket.gethostname()}:{PORT}")
+        tasks.append(asyncio.create_task(register_with_coordinator(os.environ["COORDINATOR_URL"], worker_url)))
+    yield
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 app = FastAPI(
     version="1.0.0",
     title="Data Framework Benchmark API",
     description="API for comparing dataclasses, Pydantic, and msgspec performance",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -16,18 +42,24 @@ app.add_middleware(
     allow_credentials=True,
     middleware_class=CORSMiddleware,
 )
+app.add_middleware(middleware_class=MetricsMiddleware)
 
 @app.get(path="/health")
 async def health_check() -> dict:
     return {"status": "healthy"}
 
+@app.get(path="/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=REGISTRY.CONTENT_TYPE)
+
 app.include_router(router=benchmark_router, prefix="/api")
+app.include_router(router=workloads_router, prefix="/api")
+app.include_router(router=cluster_router, prefix="/api")
 
 if __name__ == "__main__":
-    import os
     import uvicorn
 
-    port = 8000
+    port = PORT
     host = "0.0.0.0"
     # host = "0.0.0.0" if os.getenv("DOCKER_ENV") else "127.0.0.1"
     
@@ -1,5 +1,13 @@
 import json
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict
+from dataclasses import dataclass, asdict, fields
+
+import msgspec
+
+
+# Dataclasses never check types or ranges: only missing/unexpected fields fail (TypeError),
+# the hand-written lax path below adds failed casts (ValueError) and missing keys (KeyError).
+DECODE_ERRORS = (TypeError, ValueError, KeyError)
 
 
 @dataclass
@@ -22,3 +30,66 @@ def decode_dataclass(user_dataclass_bytes: bytes) -> UserDataclass:
 
 def measure_dataclass_size(user_dataclass_instance: UserDataclass) -> int:
     return len(encode_dataclass(user_dataclass_instance))
+
+# Dataclasses have no lax mode; coercion has to be written by hand.
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "0", "no", "off"))
+
+def _to_bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Cannot interpret {value!r} as a boolean")
+
+def coerce_dataclass(user_data: dict) -> UserDataclass:
+    return UserDataclass(
+        id=int(user_data['id']),
+        name=str(user_data['name']),
+        email=str(user_data['email']),
+        age=int(user_data['age']),
+        is_active=_to_bool(user_data['is_active']),
+    )
+
+def decode_dataclass_lax(user_dataclass_bytes: bytes) -> UserDataclass:
+    return coerce_dataclass(json.loads(user_dataclass_bytes.decode()))
+
+# Fast paths. asdict recurses into and deep-copies every value; a flat record of scalars needs neither.
+def compile_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    # Source generated once per class: each call is then one dict display of attribute loads.
+    body = ', '.join(f"{field.name!r}: instance.{field.name}" for field in fields(cls))
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(instance):\n    return {{{body}}}", namespace)
+    return namespace['to_dict']
+
+user_dataclass_to_dict = compile_to_dict(UserDataclass)
+
+# json.dumps/json.loads build a fresh encoder/decoder on every call that passes any option.
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+JSON_DECODER = json.JSONDecoder()
+
+def encode_dataclass_compiled(user_dataclass_instance: UserDataclass) -> bytes:
+    return JSON_ENCODER.encode(user_dataclass_to_dict(user_dataclass_instance)).encode()
+
+def encode_dataclass_vars(user_dataclass_instance: UserDataclass) -> bytes:
+    # The instance's own __dict__, not a copy; only available without __slots__.
+    return JSON_ENCODER.encode(vars(user_dataclass_instance)).encode()
+
+def encode_dataclass_reused(user_dataclass_instance: UserDataclass) -> bytes:
+    return JSON_ENCODER.encode(asdict(user_dataclass_instance)).encode()
+
+def decode_dataclass_reused(user_dataclass_bytes: bytes) -> UserDataclass:
+    return UserDataclass(**JSON_DECODER.decode(user_dataclass_bytes.decode()))
+
+# msgspec handles stdlib dataclasses natively; unlike UserDataclass(**data), decoding checks field types.
+MSGSPEC_ENCODER = msgspec.json.Encoder()
+MSGSPEC_DECODER = msgspec.json.Decoder(type=UserDataclass)
+
+def encode_dataclass_msgspec(user_dataclass_instance: UserDataclass) -> bytes:
+    return MSGSPEC_ENCODER.encode(user_dataclass_instance)
+
+def decode_dataclass_msgspec(user_dataclass_bytes: bytes) -> UserDataclass:
+    return MSGSPEC_DECODER.decode(user_dataclass_bytes)
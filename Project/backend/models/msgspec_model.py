@@ -1,4 +1,8 @@
-from msgspec import Struct, json
+from typing import Annotated, List, Type
+from msgspec import Struct, Meta, ValidationError, convert, json, msgpack
+
+
+DECODE_ERRORS = (ValidationError,)
 
 
 class UserMsgspec(Struct, kw_only=True, omit_defaults=True):
@@ -9,14 +13,66 @@ class UserMsgspec(Struct, kw_only=True, omit_defaults=True):
     is_active: bool
 
 
+# Range-checked variant that rejects unknown fields, so the error-path benchmark's
+# out-of-range and extra-field corruptions are actually invalid.
+class UserMsgspecConstrained(UserMsgspec, kw_only=True, omit_defaults=True, forbid_unknown_fields=True):
+    age: Annotated[int, Meta(ge=0, le=150)]
+
+
 def instantiate_msgspec(user_data: dict) -> UserMsgspec:
     return UserMsgspec(**user_data)
 
 def encode_msgspec(user_msgspec_instance: UserMsgspec) -> bytes:
     return json.encode(user_msgspec_instance)
 
-def decode_msgspec(user_msgspec_bytes: bytes) -> UserMsgspec:
-    return json.decode(user_msgspec_bytes, type=UserMsgspec)
+def decode_msgspec(user_msgspec_bytes: bytes, strict: bool = True, model: Type[Struct] = UserMsgspec) -> Struct:
+    return json.decode(user_msgspec_bytes, type=model, strict=strict)
+
+def decode_msgspec_constrained(user_msgspec_bytes: bytes) -> UserMsgspecConstrained:
+    return json.decode(user_msgspec_bytes, type=UserMsgspecConstrained)
+
+def convert_msgspec(user_data: dict, strict: bool = True) -> UserMsgspec:
+    return convert(user_data, type=UserMsgspec, strict=strict)
 
 def measure_msgspec_size(user_msgspec_instance: UserMsgspec) -> int:
     return len(encode_msgspec(user_msgspec_instance))
+
+def convert_msgspec_batch(users_data: List[dict], strict: bool = True) -> List[UserMsgspec]:
+    return convert(users_data, type=List[UserMsgspec], strict=strict)
+
+
+# Reusable codec objects: type lookup and encoder state are paid once, not per call.
+ENCODER = json.Encoder()
+DECODER = json.Decoder(type=UserMsgspec)
+
+def encode_msgspec_uncached(user_msgspec_instance: UserMsgspec) -> bytes:
+    return json.Encoder().encode(user_msgspec_instance)
+
+def decode_msgspec_uncached(user_msgspec_bytes: bytes) -> UserMsgspec:
+    return json.Decoder(type=UserMsgspec).decode(user_msgspec_bytes)
+
+def encode_msgspec_cached(user_msgspec_instance: UserMsgspec) -> bytes:
+    return ENCODER.encode(user_msgspec_instance)
+
+def decode_msgspec_cached(user_msgspec_bytes: bytes) -> UserMsgspec:
+    return DECODER.decode(user_msgspec_bytes)
+
+def encode_msgspec_batch_into(user_msgspec_instances: List[UserMsgspec], buffer: bytearray) -> bytearray:
+    # Newline-delimited records appended to one caller-owned buffer, no per-object bytes.
+    buffer.clear()
+    for user_msgspec_instance in user_msgspec_instances:
+        ENCODER.encode_into(user_msgspec_instance, buffer, -1)
+        buffer.append(10)
+    return buffer
+
+def decode_msgspec_lines(user_msgspec_lines: bytes) -> List[UserMsgspec]:
+    return DECODER.decode_lines(user_msgspec_lines)
+
+MSGPACK_ENCODER = msgpack.Encoder()
+MSGPACK_DECODER = msgpack.Decoder(type=UserMsgspec)
+
+def encode_msgspec_msgpack(user_msgspec_instance: UserMsgspec) -> bytes:
+    return MSGPACK_ENCODER.encode(user_msgspec_instance)
+
+def decode_msgspec_msgpack(user_msgspec_bytes: bytes) -> UserMsgspec:
+    return MSGPACK_DECODER.decode(user_msgspec_bytes)
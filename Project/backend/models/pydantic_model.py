@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import Dict, List, Type
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+
+DECODE_ERRORS = (ValidationError,)
 
 
 class UserPydantic(BaseModel):
@@ -9,14 +13,89 @@ class UserPydantic(BaseModel):
     is_active: bool
 
 
+# Range-checked variant that rejects unknown fields, so the error-path benchmark's
+# out-of-range and extra-field corruptions are actually invalid.
+class UserPydanticConstrained(UserPydantic):
+    model_config = ConfigDict(extra='forbid')
+
+    age: int = Field(ge=0, le=150)
+
+
 def instantiate_pydantic(user_data: dict) -> UserPydantic:
     return UserPydantic(**user_data)
 
 def encode_pydantic(user_pydantic_instance: UserPydantic) -> bytes:
     return user_pydantic_instance.model_dump_json(exclude_defaults=True).encode()
 
-def decode_pydantic(user_pydantic_bytes: bytes) -> UserPydantic:
-    return UserPydantic.model_validate_json(user_pydantic_bytes.decode())
+def decode_pydantic(user_pydantic_bytes: bytes, strict: bool = False, model: Type[BaseModel] = UserPydantic) -> BaseModel:
+    return model.model_validate_json(user_pydantic_bytes.decode(), strict=strict)
+
+def decode_pydantic_constrained(user_pydantic_bytes: bytes) -> UserPydanticConstrained:
+    return UserPydanticConstrained.model_validate_json(user_pydantic_bytes)
+
+def validate_pydantic(user_data: dict, strict: bool = False) -> UserPydantic:
+    return UserPydantic.model_validate(user_data, strict=strict)
 
 def measure_pydantic_size(user_pydantic_instance: UserPydantic) -> int:
     return len(encode_pydantic(user_pydantic_instance))
+
+USER_ADAPTER = TypeAdapter(UserPydantic)
+USERS_ADAPTER = TypeAdapter(List[UserPydantic])
+
+def validate_pydantic_adapter(user_data: dict) -> UserPydantic:
+    return USER_ADAPTER.validate_python(user_data)
+
+def validate_pydantic_batch(users_data: List[dict]) -> List[UserPydantic]:
+    # One call into pydantic-core for the whole list instead of one per record.
+    return USERS_ADAPTER.validate_python(users_data)
+
+def dump_pydantic_batch(user_pydantic_instances: List[UserPydantic]) -> List[dict]:
+    return USERS_ADAPTER.dump_python(user_pydantic_instances)
+
+def encode_pydantic_uncached(user_pydantic_instance: UserPydantic) -> bytes:
+    return TypeAdapter(UserPydantic).dump_json(user_pydantic_instance, exclude_defaults=True)
+
+def decode_pydantic_uncached(user_pydantic_bytes: bytes) -> UserPydantic:
+    return TypeAdapter(UserPydantic).validate_json(user_pydantic_bytes)
+
+def encode_pydantic_cached(user_pydantic_instance: UserPydantic) -> bytes:
+    return USER_ADAPTER.dump_json(user_pydantic_instance, exclude_defaults=True)
+
+def decode_pydantic_cached(user_pydantic_bytes: bytes) -> UserPydantic:
+    return USER_ADAPTER.validate_json(user_pydantic_bytes)
+
+def encode_pydantic_batch(user_pydantic_instances: List[UserPydantic]) -> bytes:
+    return USERS_ADAPTER.dump_json(user_pydantic_instances, exclude_defaults=True)
+
+def decode_pydantic_batch(users_pydantic_bytes: bytes) -> List[UserPydantic]:
+    return USERS_ADAPTER.validate_json(users_pydantic_bytes)
+
+# Fast paths. model_construct trusts its input: no validation, no coercion, no defaults checked.
+def construct_pydantic(user_data: dict) -> UserPydantic:
+    return UserPydantic.model_construct(**user_data)
+
+def decode_pydantic_bytes(user_pydantic_bytes: bytes, strict: bool = False) -> UserPydantic:
+    # pydantic-core parses bytes itself; decode_pydantic's .decode() is an extra copy.
+    return UserPydantic.model_validate_json(user_pydantic_bytes, strict=strict)
+
+def dump_pydantic_python(user_pydantic_instance: UserPydantic) -> dict:
+    return user_pydantic_instance.model_dump()
+
+def dump_pydantic_json_mode(user_pydantic_instance: UserPydantic) -> dict:
+    return user_pydantic_instance.model_dump(mode='json')
+
+# cache_strings decides which JSON strings pydantic-core interns while parsing (default 'all').
+class UserPydanticCacheKeys(UserPydantic):
+    model_config = ConfigDict(cache_strings='keys')
+
+class UserPydanticCacheNone(UserPydantic):
+    model_config = ConfigDict(cache_strings='none')
+
+CACHE_STRINGS_MODELS: Dict[str, Type[UserPydantic]] = {
+    'all': UserPydantic,
+    'keys': UserPydanticCacheKeys,
+    'none': UserPydanticCacheNone,
+}
+
+def decode_pydantic_cache_strings(user_pydantic_bytes: bytes, cache_strings: str = 'all') -> UserPydantic:
+    return CACHE_STRINGS_MODELS[cache_strings].model_validate_json(user_pydantic_bytes)
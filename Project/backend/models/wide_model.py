@@ -0,0 +1,81 @@
+import json
+from functools import lru_cache, partial
+from dataclasses import make_dataclass
+from typing import Any, Callable, Dict, Tuple, Type
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, create_model
+
+from models.dataclass_model import encode_dataclass, measure_dataclass_size
+from models.pydantic_model import encode_pydantic, decode_pydantic, measure_pydantic_size
+from models.msgspec_model import encode_msgspec, decode_msgspec, measure_msgspec_size
+
+
+Schema = Tuple[Tuple[str, str], ...]
+
+PYTHON_TYPES: Dict[str, type] = {
+    'int': int,
+    'float': float,
+    'str': str,
+    'bool': bool,
+}
+
+
+# Models are built from the same schema the generator uses, cached per (name, schema).
+@lru_cache(maxsize=64)
+def build_msgspec_model(name: str, schema: Schema, raw: bool = False) -> Type[msgspec.Struct]:
+    # raw=True keeps every value as undecoded msgspec.Raw bytes, to be decoded on access.
+    return msgspec.defstruct(
+        name,
+        [(field, msgspec.Raw if raw else PYTHON_TYPES[type_name]) for field, type_name in schema],
+        kw_only=True,
+    )
+
+@lru_cache(maxsize=64)
+def build_pydantic_model(name: str, schema: Schema) -> Type[BaseModel]:
+    return create_model(
+        name,
+        __config__=ConfigDict(extra='ignore'),
+        **{field: (PYTHON_TYPES[type_name], ...) for field, type_name in schema},
+    )
+
+@lru_cache(maxsize=64)
+def build_dataclass_model(name: str, schema: Schema) -> type:
+    return make_dataclass(name, [(field, PYTHON_TYPES[type_name]) for field, type_name in schema])
+
+@lru_cache(maxsize=None)
+def raw_value_decoder(type_name: str) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(type=PYTHON_TYPES[type_name])
+
+def decode_raw_value(value: msgspec.Raw, type_name: str) -> Any:
+    return raw_value_decoder(type_name).decode(value)
+
+
+def wide_functions(framework: str, schema: Schema) -> Dict[str, Callable]:
+    # Same shape as the FRAMEWORKS registry in routes/benchmark.py, for a model of this schema.
+    # The encoders and size functions are the user model's own; decoding only swaps the type.
+    if framework == 'dataclass':
+        model = build_dataclass_model('WideDataclass', schema)
+        return {
+            'function_instantiate': lambda data: model(**data),
+            'function_encode': encode_dataclass,
+            'function_decode': lambda payload: model(**json.loads(payload.decode())),
+            'function_measure_size': measure_dataclass_size,
+        }
+    if framework == 'pydantic':
+        model = build_pydantic_model('WidePydantic', schema)
+        return {
+            'function_instantiate': lambda data: model(**data),
+            'function_encode': encode_pydantic,
+            'function_decode': partial(decode_pydantic, model=model),
+            'function_measure_size': measure_pydantic_size,
+        }
+    if framework == 'msgspec':
+        model = build_msgspec_model('WideMsgspec', schema)
+        return {
+            'function_instantiate': lambda data: model(**data),
+            'function_encode': encode_msgspec,
+            'function_decode': partial(decode_msgspec, model=model),
+            'function_measure_size': measure_msgspec_size,
+        }
+    raise ValueError(f"Unknown framework '{framework}'")
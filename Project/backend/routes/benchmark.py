@@ -1,14 +1,33 @@
+import time
+import random
 import logging
 import asyncio
+import itertools
+import statistics
+import multiprocessing
 from copy import deepcopy
-from typing import List, Dict, Any, Callable
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, List, Dict, Any, Callable, Optional, Sequence, ContextManager, Iterator
 from fastapi import Query, APIRouter, HTTPException
+import psutil
 
 from models.dataclass_model import instantiate_dataclass, encode_dataclass, decode_dataclass, measure_dataclass_size
 from models.pydantic_model import instantiate_pydantic, encode_pydantic, decode_pydantic, measure_pydantic_size
 from models.msgspec_model import instantiate_msgspec, encode_msgspec, decode_msgspec, measure_msgspec_size
 from utils.data_generator import generate_users_batch
 from utils.benchmarking import BenchmarkResults
+from utils.latency import calibrate_timer_overhead, sampled_map
+from utils.timing import measure
+from utils.isolation import IsolationSettings
+from utils.profiling import PhaseProfiler
+from utils.allocations import AllocationTracer
+from utils.metrics import BENCHMARK_RUNS, BENCHMARK_RUNS_IN_FLIGHT, observe_benchmark_results
+from utils.environment import fingerprint, calibrate_machine
+from utils.adaptive import SequentialStopping
+from utils.matrix import OPERATIONS as MATRIX_OPERATIONS, MatrixDatasets, parse_shape
+from utils.run_options import RunOptions
+from utils.columnar import USER_FIELDS
 
 
 logging.basicConfig(level=logging.INFO)
@@ -20,6 +39,37 @@ router = APIRouter(
     tags=["Benchmarks"],
 )
 
+FRAMEWORKS: Dict[str, Dict[str, Callable]] = {
+    'dataclass': {
+        'function_encode': encode_dataclass,
+        'function_decode': decode_dataclass,
+        'function_instantiate': instantiate_dataclass,
+        'function_measure_size': measure_dataclass_size,
+    },
+    'pydantic': {
+        'function_encode': encode_pydantic,
+        'function_decode': decode_pydantic,
+        'function_instantiate': instantiate_pydantic,
+        'function_measure_size': measure_pydantic_size,
+    },
+    'msgspec': {
+        'function_encode': encode_msgspec,
+        'function_decode': decode_msgspec,
+        'function_instantiate': instantiate_msgspec,
+        'function_measure_size': measure_msgspec_size,
+    },
+}
+
+MAX_MATRIX_CELLS = 2_000
+
+
+def measurement_hooks(
+        profiler: Optional[PhaseProfiler],
+        tracer: Optional[AllocationTracer],
+) -> List[Callable[[str, str], ContextManager]]:
+    # The tracer wraps the profiler: its snapshots happen outside the profiled span,
+    # so the profiler never reports tracemalloc's work.
+    return [hook.phase for hook in (tracer, profiler) if hook]
 
 async def benchmark(
         data: List[dict],
@@ -28,198 +78,642 @@ async def benchmark(
         function_decode: Callable,
         function_instantiate: Callable,
         function_measure_size: Callable,
+        sample_every: int = 0,
+        timer_overhead_ns: int = 0,
+        between_phases: Optional[Callable[[], None]] = None,
+        phase_hooks: Sequence[Callable[[str, str], ContextManager]] = (),
 ) -> None:
-    
-    import time
+
+    between_phases = between_phases or (lambda: None)
+
+    @contextmanager
+    def phase(name: str) -> Iterator[None]:
+        between_phases()
+        with ExitStack() as stack:
+            for hook in phase_hooks:
+                stack.enter_context(hook(results.framework_name, name))
+            yield
+
+    def sample(phase: str, function: Callable, items: List[Any]) -> None:
+        # Per-record timings come from a separate pass after the timed one, so the
+        # clock reads and histogram updates never show up in the phase totals.
+        if sample_every:
+            sampled_map(
+                function=function,
+                items=items,
+                sample_every=sample_every,
+                histogram=results.get_latency_histogram(phase),
+                timer_overhead_ns=timer_overhead_ns,
+            )
+
+    # Phase totals get the same clock-read correction as the per-record samples:
+    overhead = timer_overhead_ns / 1e9
+
     # Instantiate
-    start_time = time.perf_counter()
-    instances = [function_instantiate(user_data) for user_data in data]
-    instantiation_time = time.perf_counter() - start_time
-    results.add_instantiation_time(instantiation_time)
+    with phase('instantiation'):
+        start_time = time.perf_counter()
+        instances = [function_instantiate(item) for item in data]
+        instantiation_time = time.perf_counter() - start_time
+    results.add_instantiation_time(max(instantiation_time - overhead, 0.0))
+    sample('instantiation', function_instantiate, data)
 
     # Serialize
-    start_time = time.perf_counter()
-    serialized = [function_encode(instance) for instance in instances]
-    serialization_time = time.perf_counter() - start_time
-    results.add_serialization_time(serialization_time)
+    with phase('serialization'):
+        start_time = time.perf_counter()
+        serialized = [function_encode(instance) for instance in instances]
+        serialization_time = time.perf_counter() - start_time
+    results.add_serialization_time(max(serialization_time - overhead, 0.0))
+    sample('serialization', function_encode, instances)
 
     # Deserialize
-    start_time = time.perf_counter()
-    _ = [function_decode(item) for item in serialized]
-    deserialization_time = time.perf_counter() - start_time
-    results.add_deserialization_time(deserialization_time)
+    with phase('deserialization'):
+        start_time = time.perf_counter()
+        _ = [function_decode(item) for item in serialized]
+        deserialization_time = time.perf_counter() - start_time
+    results.add_deserialization_time(max(deserialization_time - overhead, 0.0))
+    sample('deserialization', function_decode, serialized)
 
     # Measure size
     total_size = sum(function_measure_size(instance) for instance in instances)
     results.add_memory_usage(total_size)
 
-@router.post(path="/run", response_model=Dict[str, Any])
-async def run_banchmark(
-    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of objects to benchmark"),
-    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging")
+def compile_response(
+        results: Dict[str, BenchmarkResults],
+        parameters: Dict[str, Any],
+        distributions: bool = False,
+        histogram_bins: int = 50,
+        max_points: int = 1_000,
+        calibration: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
 
-    try:
-        # 1. Generate base data:
-        raw_data = generate_users_batch(batch_size=batch_size)
+    benchmark_response = {
+        'parameters': parameters,
+        'environment': {**fingerprint(), 'calibration': calibration},
+        'results': {
+            framework: result.to_dict(calibration=calibration)
+            for framework, result in results.items()
+        },
+        'summary': {
+            'fastest_instantiation': min(results.items(), key=lambda item: item[1].get_avg_instantiation_time())[0],
+            'fastest_serialization': min(results.items(), key=lambda item: item[1].get_avg_serialization_time())[0],
+            'fastest_deserialization': min(results.items(), key=lambda item: item[1].get_avg_deserialization_time())[0],
+            'lowest_memory_usage': min(results.items(), key=lambda item: item[1].get_avg_memory_usage())[0],
+        }
+    }
 
-        # 2. Initialize results storage:
-        results = {
-            'dataclass': BenchmarkResults('dataclass'),
-            'pydantic': BenchmarkResults('pydantic'),
-            'msgspec': BenchmarkResults('msgspec'),
+    # Samples are binned and downsampled here so the dashboard never receives raw series:
+    if distributions:
+        benchmark_response['distributions'] = {
+            framework: result.get_distributions(bins=histogram_bins, max_points=max_points)
+            for framework, result in results.items()
         }
 
-        # 3. Run benchmarks for each iteration:
-        for iteration in range(iterations):
-            logger.info(f"Starting iteration {iteration + 1}/{iterations}")
+    return benchmark_response
 
-            # Create fresh copies of data for each framework to avoid cross-contamination
-            dataclass_data = deepcopy(raw_data)
-            pydantic_data = deepcopy(raw_data)
-            msgspec_data = deepcopy(raw_data)
+async def run_iteration(
+        raw_data: List[dict],
+        results: Dict[str, BenchmarkResults],
+        isolation: IsolationSettings,
+        parallel: bool = False,
+        sample_every: int = 0,
+        timer_overhead_ns: int = 0,
+        phase_hooks: Sequence[Callable[[str, str], ContextManager]] = (),
+) -> None:
 
-            # Benchmarking
-            await benchmark(
-                data=dataclass_data,
-                results=results['dataclass'],
-                function_encode=encode_dataclass,
-                function_decode=decode_dataclass,
-                function_instantiate=instantiate_dataclass,
-                function_measure_size=measure_dataclass_size
-            )
+    # Create fresh copies of data for each framework to avoid cross-contamination
+    runs = [
+        benchmark(
+            data=deepcopy(raw_data),
+            results=results[framework],
+            sample_every=sample_every,
+            timer_overhead_ns=timer_overhead_ns,
+            between_phases=isolation.between_phases,
+            phase_hooks=phase_hooks,
+            **FRAMEWORKS[framework],
+        )
+        for framework in isolation.framework_order(list(results))
+    ]
 
-            await benchmark(
-                data=pydantic_data,
-                results=results['pydantic'],
-                function_encode=encode_pydantic,
-                function_decode=decode_pydantic,
-                function_instantiate=instantiate_pydantic,
-                function_measure_size=measure_pydantic_size
+    if parallel:
+        await asyncio.gather(*runs)
+    else:
+        for run in runs:
+            await run
+
+    isolation.between_iterations()
+
+async def run_adaptive(
+        raw_data: List[dict],
+        results: Dict[str, BenchmarkResults],
+        isolation: IsolationSettings,
+        stopping: SequentialStopping,
+        parallel: bool = False,
+        sample_every: int = 0,
+        timer_overhead_ns: int = 0,
+        phase_hooks: Sequence[Callable[[str, str], ContextManager]] = (),
+) -> None:
+
+    stopping.start(list(results), BenchmarkResults.PHASES)
+    while (active := stopping.active()) and not stopping.exhaust_budget():
+        # Frameworks that have converged drop out; only the noisy ones keep spending time.
+        await run_iteration(
+            raw_data=raw_data,
+            results={framework: results[framework] for framework in active},
+            isolation=isolation,
+            parallel=parallel,
+            sample_every=sample_every,
+            timer_overhead_ns=timer_overhead_ns,
+            phase_hooks=phase_hooks,
+        )
+        for framework in active:
+            stopping.update(framework, {phase: results[framework].get_phase_samples(phase) for phase in BenchmarkResults.PHASES})
+        await asyncio.sleep(0)
+
+    for framework, result in results.items():
+        result.adaptive = stopping.state[framework]
+
+def run_framework_isolated(
+        framework: str,
+        raw_data: List[dict],
+        iterations: int,
+        isolation_settings: Dict[str, Any],
+        sample_every: int = 0,
+        timer_overhead_ns: int = 0,
+        profiler_settings: Optional[Dict[str, Any]] = None,
+        allocation_settings: Optional[Dict[str, Any]] = None,
+) -> BenchmarkResults:
+
+    # Entry point of the fresh subprocess: only this framework is exercised here.
+    isolation = IsolationSettings.from_dict({**isolation_settings, 'shuffle': False, 'subprocess': False})
+    profiler = PhaseProfiler(**profiler_settings) if profiler_settings else None
+    tracer = AllocationTracer(**allocation_settings) if allocation_settings else None
+    results = BenchmarkResults(framework)
+
+    with ExitStack() as stack:
+        stack.enter_context(isolation.applied())
+        if profiler:
+            stack.enter_context(profiler.profiling())
+        if tracer:
+            stack.enter_context(tracer.tracing())
+        for _ in range(iterations):
+            asyncio.run(benchmark(
+                data=deepcopy(raw_data),
+                results=results,
+                sample_every=sample_every,
+                timer_overhead_ns=timer_overhead_ns,
+                between_phases=isolation.between_phases,
+                phase_hooks=measurement_hooks(profiler, tracer),
+                **FRAMEWORKS[framework],
+            ))
+            isolation.between_iterations()
+
+    if profiler:
+        results.profiles = profiler.reports(framework)
+    if tracer:
+        results.allocations = tracer.reports(framework)
+    return results
+
+async def run_in_subprocesses(
+        raw_data: List[dict],
+        results: Dict[str, BenchmarkResults],
+        isolation: IsolationSettings,
+        iterations: int,
+        parallel: bool = False,
+        sample_every: int = 0,
+        timer_overhead_ns: int = 0,
+        profiler_settings: Optional[Dict[str, Any]] = None,
+        allocation_settings: Optional[Dict[str, Any]] = None,
+) -> None:
+
+    loop = asyncio.get_running_loop()
+    context = multiprocessing.get_context('spawn')
+
+    async def run_one(framework: str) -> None:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[framework] = await loop.run_in_executor(
+                executor,
+                run_framework_isolated,
+                framework,
+                raw_data,
+                iterations,
+                isolation.to_dict(),
+                sample_every,
+                timer_overhead_ns,
+                profiler_settings,
+                allocation_settings,
             )
 
+    order = isolation.framework_order(list(results))
+    if parallel:
+        await asyncio.gather(*(run_one(framework) for framework in order))
+    else:
+        for framework in order:
+            await run_one(framework)
+
+async def run_chunked(
+        batch_size: int,
+        chunk_size: int,
+        results: Dict[str, BenchmarkResults],
+        isolation: IsolationSettings,
+) -> int:
+
+    process = psutil.Process()
+    peak_rss = process.memory_info().rss
+    order = isolation.framework_order(list(results))
+    chunks = {framework: BenchmarkResults(framework) for framework in results}
+
+    for start in range(0, batch_size, chunk_size):
+        # Only one chunk is alive at a time: generated outside the timed phases, dropped after them.
+        chunk = generate_users_batch(batch_size=min(chunk_size, batch_size - start), start_id=start + 1)
+        for framework in order:
             await benchmark(
-                data=msgspec_data,
-                results=results['msgspec'],
-                function_encode=encode_msgspec,
-                function_decode=decode_msgspec,
-                function_instantiate=instantiate_msgspec,
-                function_measure_size=measure_msgspec_size
+                data=deepcopy(chunk),
+                results=chunks[framework],
+                between_phases=isolation.between_phases,
+                **FRAMEWORKS[framework],
             )
+        del chunk
+        peak_rss = max(peak_rss, process.memory_info().rss)
+        # Long runs would otherwise starve the event loop (health checks, /metrics scrapes):
+        await asyncio.sleep(0)
+
+    for framework, chunk_results in chunks.items():
+        results[framework].add_chunk_totals(chunk_results)
+    isolation.between_iterations()
+    return peak_rss
+
+def chunking_effect(
+        chunked: Dict[str, BenchmarkResults],
+        chunked_size: int,
+        unchunked: Dict[str, BenchmarkResults],
+        unchunked_size: int,
+) -> Dict[str, Dict[str, Any]]:
+
+    effect = {}
+    for framework, result in chunked.items():
+        effect[framework] = {}
+        for phase in BenchmarkResults.PHASES:
+            chunked_ns = getattr(result, f'get_avg_{phase}_time')() / chunked_size * 1e9
+            unchunked_ns = getattr(unchunked[framework], f'get_avg_{phase}_time')() / unchunked_size * 1e9
+            effect[framework][phase] = {
+                'chunked_ns_per_record': chunked_ns,
+                'unchunked_ns_per_record': unchunked_ns,
+                'ratio': chunked_ns / unchunked_ns if unchunked_ns else None,
+            }
+    return effect
+
+async def execute_run(options: RunOptions, parallel: bool = False) -> Dict[str, Any]:
+
+    # Distributions are built from per-record timings; without an explicit stride every record is timed.
+    sample_every = options.sample_every or (1 if options.distributions else 0)
+
+    try:
+        isolation = IsolationSettings(gc_mode=options.gc_mode, cpu=options.cpu, shuffle=options.shuffle, subprocess=options.subprocess, seed=options.seed)
+        stopping = None
+        if options.adaptive:
+            if options.subprocess:
+                raise ValueError("Adaptive iterations run in-process and cannot be combined with subprocess=true")
+            stopping = SequentialStopping(target=options.target_precision, time_budget=options.time_budget, min_iterations=options.min_iterations, max_iterations=options.max_iterations)
+        profiler_settings = {'mode': options.profiler, 'top': options.profile_top} if options.profile else None
+        phase_profiler = PhaseProfiler(**profiler_settings) if profiler_settings else None
+        allocation_settings = {'objects_per_phase': options.batch_size, 'top': options.allocation_top} if options.trace_allocations else None
+        tracer = AllocationTracer(**allocation_settings) if allocation_settings else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    BENCHMARK_RUNS_IN_FLIGHT.inc()
+    try:
+        # 1. Generate base data and calibrate this machine, so results can be normalized across hosts:
+        raw_data = generate_users_batch(batch_size=options.batch_size)
+        calibration = calibrate_machine(recalibrate=options.recalibrate)
+        timer_overhead_ns = calibrate_timer_overhead()
+
+        # 2. Initialize results storage:
+        results = {framework: BenchmarkResults(framework) for framework in FRAMEWORKS}
+
+        # 3. Run benchmarks for each iteration:
+        with ExitStack() as stack:
+            stack.enter_context(isolation.applied())
+            if phase_profiler and not isolation.subprocess:
+                stack.enter_context(phase_profiler.profiling())
+            if tracer and not isolation.subprocess:
+                stack.enter_context(tracer.tracing())
+
+            if isolation.subprocess:
+                logger.info(f"Running {options.iterations} iterations per framework in fresh subprocesses")
+                await run_in_subprocesses(
+                    raw_data=raw_data,
+                    results=results,
+                    isolation=isolation,
+                    iterations=options.iterations,
+                    parallel=parallel,
+                    sample_every=sample_every,
+                    timer_overhead_ns=timer_overhead_ns,
+                    profiler_settings=profiler_settings,
+                    allocation_settings=allocation_settings,
+                )
+            elif stopping:
+                logger.info(f"Running adaptive iterations until ±{stopping.target:.1%} or {stopping.time_budget}s")
+                await run_adaptive(
+                    raw_data=raw_data,
+                    results=results,
+                    isolation=isolation,
+                    stopping=stopping,
+                    parallel=parallel,
+                    sample_every=sample_every,
+                    timer_overhead_ns=timer_overhead_ns,
+                    phase_hooks=measurement_hooks(phase_profiler, tracer),
+                )
+            else:
+                for iteration in range(options.iterations):
+                    logger.info(f"Starting iteration {iteration + 1}/{options.iterations}")
+                    await run_iteration(
+                        raw_data=raw_data,
+                        results=results,
+                        isolation=isolation,
+                        parallel=parallel,
+                        sample_every=sample_every,
+                        timer_overhead_ns=timer_overhead_ns,
+                        phase_hooks=measurement_hooks(phase_profiler, tracer),
+                    )
+                    logger.info(f"Completed iteration {iteration + 1}/{options.iterations}")
+
+            if not isolation.subprocess:
+                for framework, result in results.items():
+                    if phase_profiler:
+                        result.profiles = phase_profiler.reports(framework)
+                    if tracer:
+                        result.allocations = tracer.reports(framework)
+
+        observe_benchmark_results(results)
+        BENCHMARK_RUNS.inc('success')
 
         # 4. Compile final results:
-        benchmark_response = {
-            'parameters': {
-                'batch_size': batch_size,
-                'iterations': iterations,
+        return compile_response(
+            results=results,
+            parameters={
+                'batch_size': options.batch_size,
+                'iterations': max(stopping.to_dict()['iterations'].values()) if stopping else options.iterations,
+                'adaptive': stopping.to_dict() if stopping else None,
+                'sample_every': sample_every,
+                'timer_overhead_ns': timer_overhead_ns,
+                'isolation': isolation.to_dict(),
+                'profile': profiler_settings,
+                'trace_allocations': options.trace_allocations,
             },
-            'results': {
-                framework: results[framework].to_dict()
-                for framework, result in results.items()
-            },
-            'summary': {
-                'fastest_instantiation': min(results.items(), key=lambda item: item[1].get_avg_instantiation_time())[0],
-                'fastest_serialization': min(results.items(), key=lambda item: item[1].get_avg_serialization_time())[0],
-                'fastest_deserialization': min(results.items(), key=lambda item: item[1].get_avg_deserialization_time())[0],
-                'lowest_memory_usage': min(results.items(), key=lambda item: item[1].get_avg_memory_usage())[0],
-            }
-        }
-
-        return benchmark_response
+            distributions=options.distributions,
+            histogram_bins=options.histogram_bins,
+            max_points=options.max_points,
+            calibration=calibration,
+        )
 
     except Exception as e:
         logger.error(f"Benchmarking failed: {e}")
+        BENCHMARK_RUNS.inc('failure')
         raise HTTPException(
             status_code=500, 
             detail=f"Benchmarking process failed: {str(e)}",
         )
+    finally:
+        BENCHMARK_RUNS_IN_FLIGHT.dec()
+
+@router.post(path="/run", response_model=Dict[str, Any])
+async def run_banchmark(options: Annotated[RunOptions, Query()]) -> Dict[str, Any]:
+    return await execute_run(options=options)
 
 @router.post(path="/run-parallel", response_model=Dict[str, Any])
-async def run_banchmark(
-    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of objects to benchmark"),
-    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging")
+async def run_banchmark_parallel(options: Annotated[RunOptions, Query()]) -> Dict[str, Any]:
+    return await execute_run(options=options, parallel=True)
+ 
+@router.post(path="/run-chunked", response_model=Dict[str, Any])
+async def run_banchmark_chunked(
+    batch_size: int = Query(default=1_000_000, ge=1, le=10_000_000, description="Total number of objects per iteration"),
+    iterations: int = Query(default=3, ge=1, le=100, description="Number of iterations for averaging"),
+    chunk_size: int = Query(default=10_000, ge=100, le=100_000, description="Objects generated, processed and dropped at a time; bounds memory"),
+    gc_mode: str = Query(default='enabled', pattern="^(enabled|disabled|collect)$", description="GC policy: leave enabled, disable during the run, or collect before every phase"),
+    shuffle: bool = Query(default=False, description="Randomize the framework order on every iteration"),
+    seed: Optional[int] = Query(default=None, description="Seed for the framework order randomization"),
+    compare_unchunked: bool = Query(default=True, description="Also run the first min(batch_size, 100000) objects in one piece and report the per-record ratio"),
+    recalibrate: bool = Query(default=False, description="Re-measure the calibration unit instead of reusing this process's cached one"),
 ) -> Dict[str, Any]:
 
     try:
-        # 1. Generate base data:
-        raw_data = generate_users_batch(batch_size=batch_size)
+        isolation = IsolationSettings(gc_mode=gc_mode, shuffle=shuffle, seed=seed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # 2. Initialize results storage:
-        results = {
-            'dataclass': BenchmarkResults('dataclass'),
-            'pydantic': BenchmarkResults('pydantic'),
-            'msgspec': BenchmarkResults('msgspec'),
+    BENCHMARK_RUNS_IN_FLIGHT.inc()
+    try:
+        results = {framework: BenchmarkResults(framework) for framework in FRAMEWORKS}
+        calibration = calibrate_machine(recalibrate=recalibrate)
+        peak_rss = 0
+        with isolation.applied():
+            for iteration in range(iterations):
+                logger.info(f"Starting chunked iteration {iteration + 1}/{iterations}")
+                peak_rss = max(peak_rss, await run_chunked(batch_size, chunk_size, results, isolation))
+
+            effect = None
+            if compare_unchunked:
+                # Reference: the same records processed as one in-memory batch, the way /run does it.
+                reference_size = min(batch_size, 100_000)
+                reference_data = generate_users_batch(batch_size=reference_size)
+                reference = {framework: BenchmarkResults(framework) for framework in FRAMEWORKS}
+                for _ in range(min(iterations, 3)):
+                    await run_iteration(raw_data=reference_data, results=reference, isolation=isolation)
+                del reference_data
+                effect = chunking_effect(results, batch_size, reference, reference_size)
+
+        observe_benchmark_results(results)
+        BENCHMARK_RUNS.inc('success')
+
+        response = compile_response(
+            results=results,
+            parameters={
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'chunk_size': chunk_size,
+                'chunks': -(-batch_size // chunk_size),
+                'isolation': isolation.to_dict(),
+            },
+            calibration=calibration,
+        )
+        response['chunking'] = {
+            'peak_rss_bytes': peak_rss,
+            'effect': effect,
         }
+        return response
 
-        # 3. Run benchmarks for each iteration:
-        for iteration in range(iterations):
-            logger.info(f"Starting iteration {iteration + 1}/{iterations}")
-
-            # Create fresh copies of data for each framework to avoid cross-contamination
-            dataclass_data = deepcopy(raw_data)
-            pydantic_data = deepcopy(raw_data)
-            msgspec_data = deepcopy(raw_data)
-
-            # Benchmarking
-            await asyncio.gather(
-                benchmark(
-                    data=dataclass_data,
-                    results=results['dataclass'],
-                    function_encode=encode_dataclass,
-                    function_decode=decode_dataclass,
-                    function_instantiate=instantiate_dataclass,
-                    function_measure_size=measure_dataclass_size,
-                ),
-                benchmark(
-                    data=pydantic_data,
-                    results=results['pydantic'],
-                    function_encode=encode_pydantic,
-                    function_decode=decode_pydantic,
-                    function_instantiate=instantiate_pydantic,
-                    function_measure_size=measure_pydantic_size,
-                ),
-                benchmark(
-                    data=msgspec_data,
-                    results=results['msgspec'],
-                    function_encode=encode_msgspec,
-                    function_decode=decode_msgspec,
-                    function_instantiate=instantiate_msgspec,
-                    function_measure_size=measure_msgspec_size,
-                ),
-            )
-
-            logger.info(f"Completed iteration {iteration + 1}/{iterations}")
+    except Exception as e:
+        logger.error(f"Chunked benchmarking failed: {e}")
+        BENCHMARK_RUNS.inc('failure')
+        raise HTTPException(
+            status_code=500,
+            detail=f"Chunked benchmarking failed: {str(e)}",
+        )
+    finally:
+        BENCHMARK_RUNS_IN_FLIGHT.dec()
+
+@router.post(path="/matrix", response_model=Dict[str, Any])
+async def run_benchmark_matrix(
+    frameworks: List[str] = Query(default=['dataclass', 'pydantic', 'msgspec'], description="Frameworks of the matrix"),
+    batch_sizes: List[int] = Query(default=[100, 1_000, 10_000], description="Batch sizes of the matrix (1-100000)"),
+    shapes: List[str] = Query(default=['user', 'wide_50'], description="Record shapes: 'user' or 'wide_<fields>' (1-400 mixed-type fields)"),
+    operations: List[str] = Query(default=['instantiation', 'serialization', 'deserialization'], description="Operations timed in every cell"),
+    iterations: int = Query(default=5, ge=1, le=50, description="Samples per cell"),
+    gc_mode: str = Query(default='enabled', pattern="^(enabled|disabled|collect)$", description="GC policy: leave enabled, disable during the run, or collect before every sample"),
+    shuffle: bool = Query(default=False, description="Randomize the cell order in every round of samples"),
+    seed: Optional[int] = Query(default=None, description="Seed for the cell order randomization"),
+    include_samples: bool = Query(default=True, description="Return one row per sample, not only one per cell"),
+) -> Dict[str, Any]:
 
-        # 4. Compile final results:
-        benchmark_response = {
-            'parameters': {
+    frameworks, batch_sizes, shapes, operations = (
+        list(dict.fromkeys(values)) for values in (frameworks, batch_sizes, shapes, operations)
+    )
+    try:
+        isolation = IsolationSettings(gc_mode=gc_mode)
+        for framework in frameworks:
+            if framework not in FRAMEWORKS:
+                raise ValueError(f"Unknown framework '{framework}', expected one of {', '.join(FRAMEWORKS)}")
+        for operation in operations:
+            if operation not in MATRIX_OPERATIONS:
+                raise ValueError(f"Unknown operation '{operation}', expected one of {', '.join(MATRIX_OPERATIONS)}")
+        for batch_size in batch_sizes:
+            if not 1 <= batch_size <= 100_000:
+                raise ValueError(f"Batch size {batch_size} is outside 1-100000")
+        schemas = {shape: parse_shape(shape) for shape in shapes}
+        cells = list(itertools.product(shapes, frameworks, sorted(batch_sizes), operations))
+        if not cells:
+            raise ValueError("The matrix is empty: every list needs at least one value")
+        if len(cells) > MAX_MATRIX_CELLS:
+            raise ValueError(f"The matrix has {len(cells)} cells, more than {MAX_MATRIX_CELLS}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    BENCHMARK_RUNS_IN_FLIGHT.inc()
+    try:
+        start_time = time.perf_counter()
+        datasets = MatrixDatasets(FRAMEWORKS, max_batch_size=max(batch_sizes))
+        # Everything a cell reads is generated before the first sample, once per shape and framework:
+        for shape, framework, _, _ in cells:
+            datasets.prepared(framework, shape)
+
+        order = list(range(len(cells)))
+        randomizer = random.Random(seed)
+        samples: List[List[float]] = [[] for _ in cells]
+        with isolation.applied():
+            for _ in range(iterations):
+                # Round-robin over the cells, so drift spreads over all of them instead of the last ones:
+                if shuffle:
+                    randomizer.shuffle(order)
+                for index in order:
+                    shape, framework, batch_size, operation = cells[index]
+                    function, items = datasets.cell(framework, shape, operation, batch_size)
+                    isolation.between_phases()
+                    # Outputs are kept in a list as in benchmark(), and freed only after the timer stops:
+                    sample_start = time.perf_counter()
+                    outputs = [function(item) for item in items]
+                    samples[index].append(time.perf_counter() - sample_start)
+                    del outputs
+                isolation.between_iterations()
+                await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start_time
+
+        cell_rows, sample_rows = [], []
+        for index, (shape, framework, batch_size, operation) in enumerate(cells):
+            columns = {
+                'cell': index,
+                'framework': framework,
+                'shape': shape,
+                'fields': len(schemas[shape]) if schemas[shape] else len(USER_FIELDS),
                 'batch_size': batch_size,
+                'operation': operation,
+            }
+            values = samples[index]
+            mean = statistics.fmean(values)
+            cell_rows.append({
+                **columns,
+                'samples': len(values),
+                'mean_seconds': mean,
+                'median_seconds': statistics.median(values),
+                'min_seconds': min(values),
+                'stdev_seconds': statistics.stdev(values) if len(values) > 1 else 0.0,
+                'ns_per_record': mean / batch_size * 1e9,
+            })
+            if include_samples:
+                sample_rows.extend(
+                    {**columns, 'sample': sample, 'seconds': value, 'ns_per_record': value / batch_size * 1e9}
+                    for sample, value in enumerate(values)
+                )
+
+        BENCHMARK_RUNS.inc('success')
+        return {
+            'parameters': {
+                'frameworks': frameworks,
+                'batch_sizes': sorted(batch_sizes),
+                'shapes': shapes,
+                'operations': operations,
                 'iterations': iterations,
+                'cells': len(cells),
+                'isolation': {'gc_mode': gc_mode, 'shuffle': shuffle, 'seed': seed},
             },
-            'results': {
-                framework: results[framework].to_dict()
-                for framework, result in results.items()
+            'environment': fingerprint(),
+            'timing': {
+                'elapsed': elapsed,
+                'setup_time': datasets.setup_time,
+                'measured_time': sum(sum(values) for values in samples),
+                'datasets': len(shapes),
             },
-            'summary': {
-                'fastest_instantiation': min(results.items(), key=lambda item: item[1].get_avg_instantiation_time())[0],
-                'fastest_serialization': min(results.items(), key=lambda item: item[1].get_avg_serialization_time())[0],
-                'fastest_deserialization': min(results.items(), key=lambda item: item[1].get_avg_deserialization_time())[0],
-                'lowest_memory_usage': min(results.items(), key=lambda item: item[1].get_avg_memory_usage())[0],
-            }
+            'cells': cell_rows,
+            'samples': sample_rows,
         }
 
-        return benchmark_response
-
     except Exception as e:
-        logger.error(f"Benchmarking failed: {e}")
+        logger.error(f"Matrix benchmarking failed: {e}")
+        BENCHMARK_RUNS.inc('failure')
         raise HTTPException(
-            status_code=500, 
-            detail=f"Benchmarking process failed: {str(e)}",
+            status_code=500,
+            detail=f"Matrix benchmarking failed: {str(e)}",
         )
- 
+    finally:
+        BENCHMARK_RUNS_IN_FLIGHT.dec()
+
 @router.get(path="/quick", response_model=Dict[str, Any])
 async def run_quick_benchmark() -> Dict[str, Any]:
-    return await run_banchmark(batch_size=100, iterations=5)
+    return await execute_run(options=RunOptions(batch_size=100, iterations=5))
+
+@router.get(path="/single", response_model=Dict[str, Any])
+async def run_single_object_benchmark(
+    repeat: int = Query(default=5, ge=1, le=50, description="Number of timed repeats per operation"),
+    min_duration: float = Query(default=0.2, gt=0, le=5.0, description="Minimum duration (s) of each repeat; the loop count auto-ranges to reach it"),
+) -> Dict[str, Any]:
+
+    try:
+        user_data = generate_users_batch(batch_size=1)[0]
+
+        results = {}
+        for framework, functions in FRAMEWORKS.items():
+            instance = functions['function_instantiate'](user_data)
+            encoded = functions['function_encode'](instance)
+            results[framework] = {
+                'instantiation': measure(functions['function_instantiate'], user_data, repeat=repeat, min_duration=min_duration).to_dict(),
+                'serialization': measure(functions['function_encode'], instance, repeat=repeat, min_duration=min_duration).to_dict(),
+                'deserialization': measure(functions['function_decode'], encoded, repeat=repeat, min_duration=min_duration).to_dict(),
+            }
+
+        return {
+            'parameters': {
+                'repeat': repeat,
+                'min_duration': min_duration,
+            },
+            'results': results,
+        }
+
+    except Exception as e:
+        logger.error(f"Single-object benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Single-object benchmarking failed: {str(e)}",
+        )
 
 @router.get(path="/frameworks", response_model=List[Dict[str, Any]])
 async def get_available_frameworks() -> List[Dict[str, Any]]:
@@ -0,0 +1,337 @@
+import os
+import time
+import asyncio
+import logging
+import itertools
+import statistics
+from typing import List, Dict, Any, Optional, Tuple
+from fastapi import Query, APIRouter, HTTPException
+import httpx
+
+from routes.benchmark import FRAMEWORKS, MAX_MATRIX_CELLS
+from utils.benchmarking import BenchmarkResults
+from utils.matrix import OPERATIONS as MATRIX_OPERATIONS, parse_shape
+from utils.environment import environment_info
+
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter(
+    prefix="/cluster",
+    tags=["Cluster"],
+)
+
+# Registered worker base URLs -> environment reported at registration. Workers listed in
+# CLUSTER_WORKERS are registered lazily on their first run.
+WORKERS: Dict[str, Optional[Dict[str, Any]]] = {
+    url.strip().rstrip('/'): None
+    for url in os.getenv('CLUSTER_WORKERS', '').split(',')
+    if url.strip()
+}
+
+MAX_CONSECUTIVE_FAILURES = 2
+
+# Worker endpoint -> (max batch size, max iterations), mirroring the Query/RunOptions
+# bounds of routes/benchmark.py so out-of-range grids never reach a worker.
+ENDPOINT_LIMITS: Dict[str, Tuple[int, int]] = {
+    'run': (100_000, 20),
+    'run-chunked': (10_000_000, 100),
+    'matrix': (100_000, 50),
+}
+
+
+async def fetch_environment(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    response = await client.get(f"{url}/api/cluster/environment")
+    response.raise_for_status()
+    return response.json()
+
+async def dispatch_cells(
+        cells: List[Dict[str, Any]],
+        workers: List[str],
+        max_retries: int,
+        cell_timeout: float,
+) -> None:
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for cell in cells:
+        queue.put_nowait(cell)
+    pending = [len(cells)]
+
+    async def worker_loop(client: httpx.AsyncClient, url: str) -> None:
+        # One cell in flight per worker, so cells never compete for the same CPU.
+        failures = 0
+        while pending[0] and failures < MAX_CONSECUTIVE_FAILURES:
+            try:
+                cell = await asyncio.wait_for(queue.get(), timeout=0.1)
+            except asyncio.TimeoutError:
+                continue
+
+            cell['attempts'] += 1
+            start_time = time.perf_counter()
+            try:
+                response = await client.post(f"{url}/api/benchmark/{cell['endpoint']}", params=cell['parameters'])
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                cell['errors'].append({'worker': url, 'error': f"{type(e).__name__}: {e}"})
+                logger.warning(f"Cell {cell['cell']} failed on {url} (attempt {cell['attempts']}): {e}")
+                # A 4xx is the cell's fault (e.g. parameters out of range), not the worker's: never retried.
+                rejected = isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500
+                if not rejected:
+                    failures += 1
+                if not rejected and cell['attempts'] <= max_retries:
+                    # Back on the queue: whichever worker is free next (usually another one) retries it.
+                    queue.put_nowait(cell)
+                    continue
+                cell['status'] = 'failed'
+            else:
+                failures = 0
+                cell.update(status='ok', worker=url, elapsed=time.perf_counter() - start_time, response=response.json())
+            pending[0] -= 1
+
+        if failures >= MAX_CONSECUTIVE_FAILURES:
+            logger.warning(f"Worker {url} dropped from this run after {failures} consecutive failures")
+
+    async with httpx.AsyncClient(timeout=cell_timeout) as client:
+        await asyncio.gather(*(worker_loop(client, url) for url in workers))
+
+    # Cells still queued were abandoned because every worker dropped out:
+    for cell in cells:
+        if cell['status'] == 'pending':
+            cell['status'] = 'failed'
+
+async def register_with_coordinator(coordinator_url: str, worker_url: str, attempts: int = 30, delay: float = 2.0) -> None:
+    # Runs in the background on a worker: the coordinator calls back into /environment,
+    # which only answers once this server is accepting connections, hence the retries.
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        for _ in range(attempts):
+            await asyncio.sleep(delay)
+            try:
+                response = await client.post(f"{coordinator_url.rstrip('/')}/api/cluster/workers", params={'url': worker_url})
+                response.raise_for_status()
+                logger.info(f"Registered as {worker_url} with coordinator {coordinator_url}")
+                return
+            except httpx.HTTPError as e:
+                logger.info(f"Coordinator registration pending: {e}")
+    logger.error(f"Could not register with coordinator {coordinator_url}")
+
+def build_cells(
+        endpoint: str,
+        iterations: int,
+        repeats: int,
+        batch_sizes: List[int],
+        frameworks: List[str],
+        shapes: List[str],
+        operations: List[str],
+) -> List[Dict[str, Any]]:
+    # Matrix cells cover one framework × shape × operation × batch size each and are
+    # forwarded to the worker's /matrix as single-valued lists; /run and /run-chunked
+    # always time every framework, so their grid is batch sizes only.
+    if endpoint == 'matrix':
+        grid = [
+            {
+                'frameworks': [framework],
+                'shapes': [shape],
+                'operations': [operation],
+                'batch_sizes': [batch_size],
+                'iterations': iterations,
+                'include_samples': False,
+            }
+            for framework, shape, operation, batch_size in itertools.product(frameworks, shapes, operations, batch_sizes)
+        ]
+    else:
+        grid = [{'batch_size': batch_size, 'iterations': iterations} for batch_size in batch_sizes]
+
+    return [
+        {
+            'cell': index,
+            'endpoint': endpoint,
+            'parameters': parameters,
+            'status': 'pending',
+            'attempts': 0,
+            'errors': [],
+        }
+        for index, (parameters, _) in enumerate(itertools.product(grid, range(repeats)))
+    ]
+
+def cell_results(cell: Dict[str, Any]) -> Any:
+    return cell['response']['cells'] if cell['endpoint'] == 'matrix' else cell['response']['results']
+
+def aggregate_matrix_cells(cells: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for cell in cells:
+        if cell['status'] != 'ok':
+            continue
+        for result in cell_results(cell):
+            key = (result['framework'], result['shape'], result['operation'], result['batch_size'], cell['worker'])
+            groups.setdefault(key, []).append(result)
+
+    rows = []
+    for (framework, shape, operation, batch_size, worker), results in sorted(groups.items()):
+        values = [result['mean_seconds'] for result in results]
+        mean = statistics.fmean(values)
+        rows.append({
+            'framework': framework,
+            'shape': shape,
+            'operation': operation,
+            'batch_size': batch_size,
+            'worker': worker,
+            'cells': len(results),
+            'mean_seconds': mean,
+            'stdev_seconds': statistics.stdev(values) if len(values) > 1 else 0.0,
+            'ns_per_record': mean / batch_size * 1e9,
+        })
+    return rows
+
+def aggregate_cells(cells: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if any(cell['endpoint'] == 'matrix' for cell in cells):
+        return aggregate_matrix_cells(cells)
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for cell in cells:
+        if cell['status'] != 'ok':
+            continue
+        for framework, result in cell_results(cell).items():
+            groups.setdefault((cell['parameters']['batch_size'], framework, cell['worker']), []).append(result)
+
+    rows = []
+    for (batch_size, framework, worker), results in sorted(groups.items()):
+        row = {'batch_size': batch_size, 'framework': framework, 'worker': worker, 'cells': len(results)}
+        for phase in BenchmarkResults.PHASES:
+            values = [result[f'avg_{phase}_time'] for result in results]
+            row[f'avg_{phase}_time'] = statistics.fmean(values)
+            row[f'{phase}_stdev'] = statistics.stdev(values) if len(values) > 1 else 0.0
+            # Calibration units make rows from different machines directly comparable:
+            if all('normalized' in result for result in results):
+                row[f'avg_{phase}_normalized'] = statistics.fmean(result['normalized'][f'avg_{phase}_time'] for result in results)
+        rows.append(row)
+    return rows
+
+
+@router.get(path="/environment", response_model=Dict[str, Any])
+async def get_environment() -> Dict[str, Any]:
+    return environment_info()
+
+@router.get(path="/workers", response_model=Dict[str, Any])
+async def get_workers() -> Dict[str, Any]:
+    return {'workers': [{'url': url, 'environment': environment} for url, environment in WORKERS.items()]}
+
+@router.post(path="/workers", response_model=Dict[str, Any])
+async def register_worker(
+    url: str = Query(description="Base URL of a backend instance, e.g. http://localhost:8001"),
+) -> Dict[str, Any]:
+
+    url = url.rstrip('/')
+    try:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            environment = await fetch_environment(client, url)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=400, detail=f"Worker {url} is not reachable: {e}")
+
+    WORKERS[url] = environment
+    logger.info(f"Registered worker {url} ({environment['hostname']})")
+    return {'url': url, 'environment': environment}
+
+@router.delete(path="/workers", response_model=Dict[str, Any])
+async def unregister_worker(
+    url: str = Query(description="Base URL of a registered worker"),
+) -> Dict[str, Any]:
+
+    if WORKERS.pop(url.rstrip('/'), False) is False:
+        raise HTTPException(status_code=404, detail=f"Worker {url} is not registered")
+    return {'url': url, 'status': 'removed'}
+
+@router.post(path="/run", response_model=Dict[str, Any])
+async def run_distributed_benchmark(
+    batch_sizes: List[int] = Query(default=[1_000, 10_000], description="Batch sizes of the grid (1-100000 for run and matrix, 1-10000000 for run-chunked)"),
+    frameworks: List[str] = Query(default=['dataclass', 'pydantic', 'msgspec'], description="Frameworks of the grid (endpoint=matrix)"),
+    shapes: List[str] = Query(default=['user'], description="Record shapes of the grid, 'user' or 'wide_<fields>' (endpoint=matrix)"),
+    operations: List[str] = Query(default=['instantiation', 'serialization', 'deserialization'], description="Operations of the grid (endpoint=matrix)"),
+    iterations: int = Query(default=10, ge=1, le=100, description="Iterations (samples) per cell (at most 20 for run, 50 for matrix, 100 for run-chunked)"),
+    repeats: int = Query(default=1, ge=1, le=100, description="Copies of every grid point; spread over the workers"),
+    endpoint: str = Query(default='matrix', pattern="^(matrix|run|run-chunked)$", description="Worker endpoint every cell calls: matrix splits frameworks × shapes × operations × batch sizes into cells, run/run-chunked only batch sizes"),
+    max_retries: int = Query(default=2, ge=0, le=10, description="Re-dispatches of a failed cell"),
+    cell_timeout: float = Query(default=600.0, gt=0, le=7_200, description="Seconds before a cell request is abandoned"),
+) -> Dict[str, Any]:
+
+    batch_sizes, frameworks, shapes, operations = (
+        list(dict.fromkeys(values)) for values in (sorted(batch_sizes), frameworks, shapes, operations)
+    )
+    try:
+        # Rejected here rather than by every worker, where each cell would fail with a 4xx:
+        max_batch_size, max_iterations = ENDPOINT_LIMITS[endpoint]
+        if iterations > max_iterations:
+            raise ValueError(f"/{endpoint} allows at most {max_iterations} iterations, got {iterations}")
+        for batch_size in batch_sizes:
+            if not 1 <= batch_size <= max_batch_size:
+                raise ValueError(f"Batch size {batch_size} is outside 1-{max_batch_size} for /{endpoint}")
+        if endpoint == 'matrix':
+            for framework in frameworks:
+                if framework not in FRAMEWORKS:
+                    raise ValueError(f"Unknown framework '{framework}', expected one of {', '.join(FRAMEWORKS)}")
+            for operation in operations:
+                if operation not in MATRIX_OPERATIONS:
+                    raise ValueError(f"Unknown operation '{operation}', expected one of {', '.join(MATRIX_OPERATIONS)}")
+            for shape in shapes:
+                parse_shape(shape)
+        cells = build_cells(endpoint, iterations, repeats, batch_sizes, frameworks, shapes, operations)
+        if not cells:
+            raise ValueError("The grid is empty: every list needs at least one value")
+        if len(cells) > MAX_MATRIX_CELLS:
+            raise ValueError(f"The grid has {len(cells)} cells, more than {MAX_MATRIX_CELLS}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not WORKERS:
+        raise HTTPException(status_code=400, detail="No workers registered; POST /api/cluster/workers?url=... first")
+
+    # Refresh every worker's environment; unreachable ones sit this run out.
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        environments = await asyncio.gather(
+            *(fetch_environment(client, url) for url in WORKERS),
+            return_exceptions=True,
+        )
+    unreachable = {}
+    for url, environment in zip(list(WORKERS), environments):
+        if isinstance(environment, Exception):
+            unreachable[url] = str(environment)
+        else:
+            WORKERS[url] = environment
+    workers = [url for url in WORKERS if url not in unreachable]
+    if not workers:
+        raise HTTPException(status_code=502, detail=f"No registered worker is reachable: {unreachable}")
+
+    start_time = time.perf_counter()
+    await dispatch_cells(cells, workers, max_retries=max_retries, cell_timeout=cell_timeout)
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        'parameters': {
+            'batch_sizes': batch_sizes,
+            'frameworks': frameworks if endpoint == 'matrix' else list(FRAMEWORKS),
+            'shapes': shapes if endpoint == 'matrix' else None,
+            'operations': operations if endpoint == 'matrix' else None,
+            'iterations': iterations,
+            'cells': len(cells),
+            'repeats': repeats,
+            'endpoint': endpoint,
+            'max_retries': max_retries,
+        },
+        'workers': {url: WORKERS[url] for url in workers},
+        'unreachable_workers': unreachable,
+        'elapsed': elapsed,
+        'cells': [
+            {
+                'cell': cell['cell'],
+                'parameters': cell['parameters'],
+                'status': cell['status'],
+                'worker': cell.get('worker'),
+                'attempts': cell['attempts'],
+                'errors': cell['errors'],
+                'elapsed': cell.get('elapsed'),
+                'results': cell_results(cell) if cell['status'] == 'ok' else None,
+            }
+            for cell in cells
+        ],
+        'results': aggregate_cells(cells),
+    }
@@ -0,0 +1,1082 @@
+import sys
+import json
+import time
+import asyncio
+import logging
+import statistics
+from pathlib import Path
+from functools import partial
+from dataclasses import asdict
+from operator import attrgetter, itemgetter
+from collections import Counter
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+import msgspec
+import psutil
+from fastapi import Query, APIRouter, HTTPException, Request
+
+from models.dataclass_model import (
+    instantiate_dataclass, encode_dataclass, decode_dataclass, coerce_dataclass, decode_dataclass_lax,
+    user_dataclass_to_dict, encode_dataclass_compiled, encode_dataclass_vars, encode_dataclass_reused, decode_dataclass_reused,
+    encode_dataclass_msgspec, decode_dataclass_msgspec,
+    DECODE_ERRORS as DATACLASS_DECODE_ERRORS,
+)
+from models.pydantic_model import (
+    instantiate_pydantic, validate_pydantic, validate_pydantic_adapter, validate_pydantic_batch, dump_pydantic_batch,
+    encode_pydantic, decode_pydantic, encode_pydantic_uncached, decode_pydantic_uncached,
+    encode_pydantic_cached, decode_pydantic_cached, encode_pydantic_batch, decode_pydantic_batch,
+    construct_pydantic, decode_pydantic_bytes, dump_pydantic_python, dump_pydantic_json_mode, decode_pydantic_cache_strings,
+    decode_pydantic_constrained,
+    DECODE_ERRORS as PYDANTIC_DECODE_ERRORS,
+)
+from models.msgspec_model import (
+    instantiate_msgspec, convert_msgspec, convert_msgspec_batch,
+    encode_msgspec, decode_msgspec, encode_msgspec_uncached, decode_msgspec_uncached,
+    encode_msgspec_cached, decode_msgspec_cached, encode_msgspec_batch_into, decode_msgspec_lines,
+    encode_msgspec_msgpack, decode_msgspec_msgpack, decode_msgspec_constrained,
+    DECODE_ERRORS as MSGSPEC_DECODE_ERRORS,
+)
+from models.wide_model import build_msgspec_model, build_pydantic_model, decode_raw_value, wide_functions
+from routes.benchmark import FRAMEWORKS, benchmark
+from utils.benchmarking import BenchmarkResults
+from utils.timing import measure, repeat_times
+from utils.cold_start import VARIANTS as COLD_START_VARIANTS
+from utils.streaming import SPLITTERS, frame_record
+from utils.compression import codec_levels
+from utils.columnar import (
+    USER_FIELDS,
+    dicts_to_arrow,
+    tuples_to_arrow,
+    tuples_to_numpy,
+    arrow_to_dicts,
+    numpy_to_dicts,
+    held_bytes,
+    peak_memory,
+)
+from utils.data_generator import (
+    GeneratorInvalidUser,
+    GeneratorStringlyUser,
+    generate_users_batch,
+    generate_users_batch_with_errors,
+    GeneratorWideRecord,
+    generate_wide_batch,
+)
+
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+router = APIRouter(
+    prefix="/workloads",
+    tags=["Workloads"],
+)
+
+ERRORS: Dict[str, Tuple[type, ...]] = {
+    'dataclass': DATACLASS_DECODE_ERRORS,
+    'pydantic': PYDANTIC_DECODE_ERRORS,
+    'msgspec': MSGSPEC_DECODE_ERRORS,
+}
+
+# The shared models carry no range checks; the error path decodes into range-checked
+# variants so out-of-range ages are rejectable.
+ERROR_PATH_DECODERS: Dict[str, Callable] = {
+    'dataclass': decode_dataclass,
+    'pydantic': decode_pydantic_constrained,
+    'msgspec': decode_msgspec_constrained,
+}
+
+# framework -> mode -> input format -> function. Dataclasses have no strict mode:
+# "strict" is plain construction, which checks nothing and accepts strings as they are.
+COERCION_MODES: Dict[str, Dict[str, Dict[str, Callable]]] = {
+    'dataclass': {
+        'strict': {'dict': instantiate_dataclass, 'json': decode_dataclass},
+        'lax': {'dict': coerce_dataclass, 'json': decode_dataclass_lax},
+    },
+    'pydantic': {
+        'strict': {'dict': partial(validate_pydantic, strict=True), 'json': partial(decode_pydantic, strict=True)},
+        'lax': {'dict': validate_pydantic, 'json': decode_pydantic},
+    },
+    'msgspec': {
+        'strict': {'dict': convert_msgspec, 'json': decode_msgspec},
+        'lax': {'dict': partial(convert_msgspec, strict=False), 'json': partial(decode_msgspec, strict=False)},
+    },
+}
+
+def each(function: Callable) -> Callable[[List[Any]], List[Any]]:
+    return lambda items: [function(item) for item in items]
+
+# framework -> conversion path -> (single-record function, whole-batch function)
+CONVERSION_PATHS: Dict[str, Dict[str, Tuple[Callable, Callable]]] = {
+    'dataclass': {
+        'kwargs': (instantiate_dataclass, each(instantiate_dataclass)),
+    },
+    'pydantic': {
+        'kwargs': (instantiate_pydantic, each(instantiate_pydantic)),
+        'model_validate': (validate_pydantic, each(validate_pydantic)),
+        'type_adapter': (validate_pydantic_adapter, validate_pydantic_batch),
+    },
+    'msgspec': {
+        'kwargs': (instantiate_msgspec, each(instantiate_msgspec)),
+        'convert': (convert_msgspec, convert_msgspec_batch),
+    },
+}
+
+# framework -> codec variant -> (encode a list of instances, decode what that produced).
+# 'per_call' builds the encoder/decoder/adapter on every call, 'default' is the models'
+# regular path, 'cached' reuses one codec object, the last variant handles the batch in one call.
+CODEC_VARIANTS: Dict[str, Dict[str, Tuple[Callable, Callable]]] = {
+    'pydantic': {
+        'per_call': (each(encode_pydantic_uncached), each(decode_pydantic_uncached)),
+        'default': (each(encode_pydantic), each(decode_pydantic)),
+        'cached': (each(encode_pydantic_cached), each(decode_pydantic_cached)),
+        'batch': (encode_pydantic_batch, decode_pydantic_batch),
+    },
+    'msgspec': {
+        'per_call': (each(encode_msgspec_uncached), each(decode_msgspec_uncached)),
+        'default': (each(encode_msgspec), each(decode_msgspec)),
+        'cached': (each(encode_msgspec_cached), each(decode_msgspec_cached)),
+        'encode_into': (partial(encode_msgspec_batch_into, buffer=bytearray()), decode_msgspec_lines),
+    },
+}
+CODEC_INSTANTIATE: Dict[str, Callable] = {
+    'pydantic': instantiate_pydantic,
+    'msgspec': instantiate_msgspec,
+}
+
+
+def projection_variants(schema: Tuple[Tuple[str, str], ...], used: int) -> Dict[Tuple[str, str], Callable[[bytes], Any]]:
+    # Every variant decodes one record and reads the first `used` fields, so the work done is comparable.
+    projected = schema[:used]
+    names = [name for name, _ in projected]
+    read = attrgetter(*names)
+
+    full_msgspec = msgspec.json.Decoder(type=build_msgspec_model('WideMsgspec', schema))
+    projected_msgspec = msgspec.json.Decoder(type=build_msgspec_model(f'WideMsgspecProjected{used}', projected))
+    raw_msgspec = msgspec.json.Decoder(type=build_msgspec_model('WideMsgspecRaw', schema, raw=True))
+    full_pydantic = build_pydantic_model('WidePydantic', schema)
+    projected_pydantic = build_pydantic_model(f'WidePydanticProjected{used}', projected)
+
+    def read_raw(payload: bytes) -> List[Any]:
+        record = raw_msgspec.decode(payload)
+        return [decode_raw_value(getattr(record, name), type_name) for name, type_name in projected]
+
+    return {
+        ('msgspec', 'full'): lambda payload: read(full_msgspec.decode(payload)),
+        ('msgspec', 'projected'): lambda payload: read(projected_msgspec.decode(payload)),
+        ('msgspec', 'raw'): read_raw,
+        ('pydantic', 'full'): lambda payload: read(full_pydantic.model_validate_json(payload)),
+        ('pydantic', 'projected'): lambda payload: read(projected_pydantic.model_validate_json(payload)),
+    }
+
+# framework -> row extractor -> (row shape, function turning a list of objects into rows)
+COLUMNAR_EXTRACTORS: Dict[str, Dict[str, Tuple[str, Callable]]] = {
+    'dict': {
+        'as_is': ('dicts', lambda rows: rows),
+        'itemgetter': ('tuples', each(itemgetter(*USER_FIELDS))),
+    },
+    'dataclass': {
+        'asdict': ('dicts', each(asdict)),
+        'attrgetter': ('tuples', each(attrgetter(*USER_FIELDS))),
+    },
+    'pydantic': {
+        'model_dump': ('dicts', each(lambda instance: instance.model_dump())),
+        'dump_python': ('dicts', dump_pydantic_batch),
+        'attrgetter': ('tuples', each(attrgetter(*USER_FIELDS))),
+    },
+    'msgspec': {
+        'to_builtins': ('dicts', msgspec.to_builtins),
+        'astuple': ('tuples', each(msgspec.structs.astuple)),
+    },
+}
+COLUMNAR_INSTANTIATE: Dict[str, Callable] = {
+    'dict': lambda rows: rows,
+    'dataclass': each(instantiate_dataclass),
+    'pydantic': validate_pydantic_batch,
+    'msgspec': convert_msgspec_batch,
+}
+COLUMNAR_EXPORTERS: Dict[Tuple[str, str], Callable] = {
+    ('arrow', 'dicts'): dicts_to_arrow,
+    ('arrow', 'tuples'): tuples_to_arrow,
+    ('numpy', 'tuples'): tuples_to_numpy,
+}
+COLUMNAR_IMPORTERS: Dict[str, Callable] = {
+    'arrow': arrow_to_dicts,
+    'numpy': numpy_to_dicts,
+}
+
+# format -> framework -> function decoding one framed record. MessagePack has no dataclass
+# or pydantic decoder of its own, so those parse to builtins with msgspec first.
+INGEST_DECODERS: Dict[str, Dict[str, Callable[[bytes], Any]]] = {
+    'ndjson': {
+        'dataclass': decode_dataclass,
+        'pydantic': decode_pydantic,
+        'msgspec': decode_msgspec_cached,
+    },
+    'msgpack': {
+        'dataclass': lambda payload: instantiate_dataclass(msgspec.msgpack.decode(payload)),
+        'pydantic': lambda payload: validate_pydantic(msgspec.msgpack.decode(payload)),
+        'msgspec': decode_msgspec_msgpack,
+    },
+}
+
+# format -> framework -> (encode one instance, decode one record), for the wire-cost benchmark.
+WIRE_FORMATS: Dict[str, Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]] = {
+    'ndjson': {
+        'dataclass': (encode_dataclass, decode_dataclass),
+        'pydantic': (encode_pydantic, decode_pydantic),
+        'msgspec': (encode_msgspec_cached, decode_msgspec_cached),
+    },
+    'msgpack': {
+        'dataclass': (lambda instance: msgspec.msgpack.encode(asdict(instance)), INGEST_DECODERS['msgpack']['dataclass']),
+        'pydantic': (lambda instance: msgspec.msgpack.encode(instance.model_dump()), INGEST_DECODERS['msgpack']['pydantic']),
+        'msgspec': (encode_msgspec_msgpack, decode_msgspec_msgpack),
+    },
+}
+
+# operation -> variant -> (input it consumes, what it produces, function over the whole input).
+# 'default' is what FRAMEWORKS['pydantic'] runs; every operation ends with its msgspec reference.
+PYDANTIC_FAST_PATHS: Dict[str, Dict[str, Tuple[str, str, Callable[[Any], Any]]]] = {
+    'instantiation': {
+        'default': ('dicts', 'instances', each(instantiate_pydantic)),
+        'model_validate': ('dicts', 'instances', each(validate_pydantic)),
+        'model_validate_strict': ('dicts', 'instances', each(partial(validate_pydantic, strict=True))),
+        'model_construct': ('dicts', 'instances', each(construct_pydantic)),
+        'type_adapter_list': ('dicts', 'instances', validate_pydantic_batch),
+        'msgspec': ('dicts', 'instances', each(instantiate_msgspec)),
+    },
+    'serialization': {
+        'default': ('instances', 'bytes', each(encode_pydantic)),
+        'type_adapter_list_json': ('instances', 'bytes', encode_pydantic_batch),
+        'model_dump_python': ('instances', 'dicts', each(dump_pydantic_python)),
+        'model_dump_json_mode': ('instances', 'dicts', each(dump_pydantic_json_mode)),
+        'type_adapter_list_python': ('instances', 'dicts', dump_pydantic_batch),
+        'msgspec': ('msgspec_instances', 'bytes', each(encode_msgspec)),
+    },
+    'deserialization': {
+        'default': ('records', 'instances', each(decode_pydantic)),
+        'validate_json_bytes': ('records', 'instances', each(decode_pydantic_bytes)),
+        'validate_json_bytes_strict': ('records', 'instances', each(partial(decode_pydantic_bytes, strict=True))),
+        'cache_strings_keys': ('records', 'instances', each(partial(decode_pydantic_cache_strings, cache_strings='keys'))),
+        'cache_strings_none': ('records', 'instances', each(partial(decode_pydantic_cache_strings, cache_strings='none'))),
+        'type_adapter_list': ('array', 'instances', decode_pydantic_batch),
+        'msgspec': ('records', 'instances', each(decode_msgspec)),
+    },
+}
+
+# Same layout for stdlib dataclasses; 'msgspec_native' hands the dataclass itself to msgspec.
+DATACLASS_FAST_PATHS: Dict[str, Dict[str, Tuple[str, str, Callable[[Any], Any]]]] = {
+    'serialization': {
+        'default': ('instances', 'bytes', each(encode_dataclass)),
+        'reused_encoder': ('instances', 'bytes', each(encode_dataclass_reused)),
+        'compiled_getter': ('instances', 'bytes', each(encode_dataclass_compiled)),
+        'vars': ('instances', 'bytes', each(encode_dataclass_vars)),
+        'msgspec_native': ('instances', 'bytes', each(encode_dataclass_msgspec)),
+        'asdict_only': ('instances', 'dicts', each(asdict)),
+        'compiled_getter_only': ('instances', 'dicts', each(user_dataclass_to_dict)),
+        'msgspec': ('msgspec_instances', 'bytes', each(encode_msgspec)),
+    },
+    'deserialization': {
+        'default': ('records', 'instances', each(decode_dataclass)),
+        'reused_decoder': ('records', 'instances', each(decode_dataclass_reused)),
+        'msgspec_native': ('records', 'instances', each(decode_dataclass_msgspec)),
+        'msgspec': ('records', 'instances', each(decode_msgspec)),
+    },
+}
+
+
+async def run_cold_start_process(variant: str, model_count: int, field_count: int, steady_loops: int) -> Dict[str, Any]:
+    # A brand-new interpreter, not a fork or spawn of this one: nothing is imported or compiled yet.
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, '-m', 'utils.cold_start',
+        '--variant', variant,
+        '--model-count', str(model_count),
+        '--field-count', str(field_count),
+        '--steady-loops', str(steady_loops),
+        cwd=BACKEND_DIR,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(f"Cold-start process for '{variant}' failed: {stderr.decode().strip()}")
+    return json.loads(stdout)
+
+
+def apply_with_errors(
+        function: Callable,
+        errors: Tuple[type, ...],
+        items: List[Any],
+) -> Tuple[float, List[bool]]:
+    # Rejections are part of the workload, so the except branch stays inside the timed loop.
+    accepted = []
+    start_time = time.perf_counter()
+    for item in items:
+        try:
+            function(item)
+        except errors:
+            accepted.append(False)
+        else:
+            accepted.append(True)
+    return time.perf_counter() - start_time, accepted
+
+def measure_fast_paths(
+        framework: str,
+        paths: Dict[str, Dict[str, Tuple[str, str, Callable[[Any], Any]]]],
+        inputs: Dict[str, Any],
+        operations: List[str],
+        variants: List[str],
+        iterations: int,
+        batch_size: int,
+) -> List[Dict[str, Any]]:
+
+    rows = []
+    for operation in operations:
+        for variant, (input_kind, output_kind, function) in paths[operation].items():
+            if variants and variant not in variants and variant not in ('default', 'msgspec'):
+                continue
+            times = repeat_times(function, inputs[input_kind], iterations=iterations)
+            avg_time = sum(times) / len(times)
+            rows.append({
+                'operation': operation,
+                'variant': variant,
+                'framework': 'msgspec' if variant == 'msgspec' else framework,
+                'input': input_kind,
+                'output': output_kind,
+                'avg_time': avg_time,
+                'min_time': min(times),
+                'ns_per_record': avg_time / batch_size * 1e9,
+            })
+
+    # How far each variant moves from the default path, and how close it gets to msgspec:
+    default = {row['operation']: row for row in rows if row['variant'] == 'default'}
+    reference = {row['operation']: row for row in rows if row['variant'] == 'msgspec'}
+    for row in rows:
+        row['speedup_over_default'] = default[row['operation']]['avg_time'] / row['avg_time'] if row['avg_time'] else None
+        row['times_msgspec'] = row['avg_time'] / reference[row['operation']]['avg_time'] if reference[row['operation']]['avg_time'] else None
+    return rows
+
+def summarize_error_path(
+        timings: Dict[str, List[float]],
+        counts: Dict[str, int],
+        labels: List[Optional[str]],
+        accepted: List[bool],
+) -> Dict[str, Any]:
+    avg = {subset: sum(samples) / len(samples) for subset, samples in timings.items()}
+    per_record_ns = {
+        subset: avg[subset] / counts[subset] * 1e9 if counts[subset] else None
+        for subset in timings
+    }
+    split_time = avg['valid'] + avg['invalid']
+
+    return {
+        'avg_mixed_time': avg['mixed'],
+        'avg_valid_time': avg['valid'],
+        'avg_invalid_time': avg['invalid'],
+        'records_per_second': counts['mixed'] / avg['mixed'] if avg['mixed'] else 0.0,
+        'valid_ns_per_record': per_record_ns['valid'],
+        'invalid_ns_per_record': per_record_ns['invalid'],
+        'error_path_share': avg['invalid'] / split_time if counts['invalid'] and split_time else 0.0,
+        'invalid_cost_ratio': (
+            per_record_ns['invalid'] / per_record_ns['valid']
+            if per_record_ns['valid'] and per_record_ns['invalid'] is not None else None
+        ),
+        'rejected': dict(Counter(label for label, ok in zip(labels, accepted) if label and not ok)),
+        'accepted_invalid': dict(Counter(label for label, ok in zip(labels, accepted) if label and ok)),
+        'rejected_valid': sum(1 for label, ok in zip(labels, accepted) if not label and not ok),
+    }
+
+@router.post(path="/error-path", response_model=Dict[str, Any])
+async def run_error_path_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of JSON messages to decode"),
+    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging"),
+    invalid_ratio: float = Query(default=0.05, ge=0.0, le=1.0, description="Fraction of messages corrupted with a wrong type, missing field, extra field or out-of-range value"),
+) -> Dict[str, Any]:
+
+    try:
+        users, labels = generate_users_batch_with_errors(batch_size=batch_size, invalid_ratio=invalid_ratio)
+        # Framework independent wire format, so every decoder sees byte-identical messages:
+        payloads = [json.dumps(user).encode() for user in users]
+        subsets = {
+            'mixed': payloads,
+            'valid': [payload for payload, label in zip(payloads, labels) if label is None],
+            'invalid': [payload for payload, label in zip(payloads, labels) if label is not None],
+        }
+        counts = {subset: len(items) for subset, items in subsets.items()}
+
+        results = {}
+        for framework, function_decode in ERROR_PATH_DECODERS.items():
+            timings: Dict[str, List[float]] = {subset: [] for subset in subsets}
+            accepted: List[bool] = []
+            # One untimed pass per subset, so the first timed one does not pay for warm-up:
+            for items in subsets.values():
+                apply_with_errors(function_decode, ERRORS[framework], items)
+            for _ in range(iterations):
+                for subset, items in subsets.items():
+                    elapsed, subset_accepted = apply_with_errors(function_decode, ERRORS[framework], items)
+                    timings[subset].append(elapsed)
+                    if subset == 'mixed':
+                        accepted = subset_accepted
+            results[framework] = summarize_error_path(timings, counts, labels, accepted)
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'invalid_ratio': invalid_ratio,
+                'invalid_records': counts['invalid'],
+                'invalid_kinds': dict(Counter(label for label in labels if label)),
+                'kinds': list(GeneratorInvalidUser.KINDS),
+            },
+            'results': results,
+        }
+
+    except Exception as e:
+        logger.error(f"Error-path benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error-path benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/coercion", response_model=Dict[str, Any])
+async def run_coercion_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of records per input variant"),
+    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging"),
+) -> Dict[str, Any]:
+
+    try:
+        typed = generate_users_batch(batch_size=batch_size)
+        inputs = {
+            ('dict', 'typed'): typed,
+            ('dict', 'stringly'): [GeneratorStringlyUser.stringify_user(user) for user in typed],
+        }
+        inputs[('json', 'typed')] = [json.dumps(user).encode() for user in inputs[('dict', 'typed')]]
+        inputs[('json', 'stringly')] = [json.dumps(user).encode() for user in inputs[('dict', 'stringly')]]
+
+        rows = []
+        for framework, modes in COERCION_MODES.items():
+            for mode, functions in modes.items():
+                for (input_format, input_types), items in inputs.items():
+                    timings = []
+                    apply_with_errors(functions[input_format], ERRORS[framework], items)
+                    for _ in range(iterations):
+                        elapsed, accepted = apply_with_errors(functions[input_format], ERRORS[framework], items)
+                        timings.append(elapsed)
+                    avg_time = sum(timings) / len(timings)
+                    rows.append({
+                        'framework': framework,
+                        'mode': mode,
+                        'input_format': input_format,
+                        'input_types': input_types,
+                        'avg_time': avg_time,
+                        'ns_per_record': avg_time / batch_size * 1e9,
+                        'records_per_second': batch_size / avg_time if avg_time else 0.0,
+                        'accepted': sum(accepted),
+                        'rejected': batch_size - sum(accepted),
+                    })
+
+        # Price of coercion: lax decoding of strings vs strict decoding of already typed input.
+        by_key = {(row['framework'], row['mode'], row['input_format'], row['input_types']): row for row in rows}
+        coercion_overhead = {
+            framework: {
+                input_format: (
+                    by_key[(framework, 'lax', input_format, 'stringly')]['avg_time']
+                    / by_key[(framework, 'strict', input_format, 'typed')]['avg_time']
+                )
+                for input_format in ('dict', 'json')
+            }
+            for framework in COERCION_MODES
+        }
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+            },
+            'results': rows,
+            'coercion_overhead': coercion_overhead,
+        }
+
+    except Exception as e:
+        logger.error(f"Coercion benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Coercion benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/conversion", response_model=Dict[str, Any])
+async def run_conversion_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of dicts converted per batch"),
+    iterations: int = Query(default=10, ge=1, le=20, description="Number of batch iterations for averaging"),
+    repeat: int = Query(default=5, ge=1, le=50, description="Number of timed repeats for the single-object measurement"),
+    min_duration: float = Query(default=0.2, gt=0, le=5.0, description="Minimum duration (s) of each single-object repeat"),
+) -> Dict[str, Any]:
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+
+        rows = []
+        for framework, paths in CONVERSION_PATHS.items():
+            for path, (function_single, function_batch) in paths.items():
+                timings = repeat_times(function_batch, users, iterations=iterations)
+                avg_time = sum(timings) / len(timings)
+                rows.append({
+                    'framework': framework,
+                    'path': path,
+                    'single': measure(function_single, users[0], repeat=repeat, min_duration=min_duration).to_dict(),
+                    'avg_batch_time': avg_time,
+                    'batch_ns_per_record': avg_time / batch_size * 1e9,
+                    'records_per_second': batch_size / avg_time if avg_time else 0.0,
+                })
+
+        # Speedup of every path over the Model(**data) baseline of the same framework:
+        baselines = {row['framework']: row for row in rows if row['path'] == 'kwargs'}
+        for row in rows:
+            baseline = baselines[row['framework']]
+            row['single_speedup'] = baseline['single']['median_ns'] / row['single']['median_ns'] if row['single']['median_ns'] else None
+            row['batch_speedup'] = baseline['avg_batch_time'] / row['avg_batch_time'] if row['avg_batch_time'] else None
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'repeat': repeat,
+                'min_duration': min_duration,
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Conversion benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Conversion benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/codecs", response_model=Dict[str, Any])
+async def run_codec_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of objects encoded and decoded per iteration"),
+    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging"),
+) -> Dict[str, Any]:
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+
+        rows = []
+        for framework, variants in CODEC_VARIANTS.items():
+            instances = [CODEC_INSTANTIATE[framework](user) for user in users]
+            for variant, (function_encode, function_decode) in variants.items():
+                encoded = function_encode(instances)
+                encode_times = repeat_times(function_encode, instances, iterations=iterations)
+                decode_times = repeat_times(function_decode, encoded, iterations=iterations)
+
+                avg_encode_time = sum(encode_times) / len(encode_times)
+                avg_decode_time = sum(decode_times) / len(decode_times)
+                rows.append({
+                    'framework': framework,
+                    'variant': variant,
+                    'avg_encode_time': avg_encode_time,
+                    'avg_decode_time': avg_decode_time,
+                    'encode_ns_per_record': avg_encode_time / batch_size * 1e9,
+                    'decode_ns_per_record': avg_decode_time / batch_size * 1e9,
+                })
+
+        # Gain of every variant over constructing the codec on each call:
+        per_call = {row['framework']: row for row in rows if row['variant'] == 'per_call'}
+        for row in rows:
+            baseline = per_call[row['framework']]
+            row['encode_speedup'] = baseline['avg_encode_time'] / row['avg_encode_time'] if row['avg_encode_time'] else None
+            row['decode_speedup'] = baseline['avg_decode_time'] / row['avg_decode_time'] if row['avg_decode_time'] else None
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Codec benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Codec benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/projection", response_model=Dict[str, Any])
+async def run_projection_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of wide records decoded per iteration"),
+    iterations: int = Query(default=10, ge=1, le=20, description="Number of iterations for averaging"),
+    field_count: int = Query(default=60, ge=1, le=400, description="Number of fields in every record"),
+    fields_used: List[int] = Query(default=[1, 3, 10], description="How many fields the consumer reads; the full width is always added"),
+) -> Dict[str, Any]:
+
+    try:
+        schema = GeneratorWideRecord.schema(field_count)
+        payloads = [json.dumps(record).encode() for record in generate_wide_batch(batch_size=batch_size, schema=schema)]
+        used_counts = sorted({min(max(used, 1), field_count) for used in fields_used} | {field_count})
+
+        rows = []
+        for used in used_counts:
+            for (framework, variant), function in projection_variants(schema, used).items():
+                timings = repeat_times(each(function), payloads, iterations=iterations)
+                avg_time = sum(timings) / len(timings)
+                rows.append({
+                    'framework': framework,
+                    'variant': variant,
+                    'fields_used': used,
+                    'avg_time': avg_time,
+                    'ns_per_record': avg_time / batch_size * 1e9,
+                })
+
+        # Cost relative to decoding the full record and reading the same fields:
+        full = {(row['framework'], row['fields_used']): row['avg_time'] for row in rows if row['variant'] == 'full'}
+        for row in rows:
+            baseline = full[(row['framework'], row['fields_used'])]
+            row['relative_to_full'] = row['avg_time'] / baseline if baseline else None
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'field_count': field_count,
+                'fields_used': used_counts,
+                'payload_bytes': sum(len(payload) for payload in payloads) / batch_size,
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Projection benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Projection benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/width", response_model=Dict[str, Any])
+async def run_width_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of records per width"),
+    iterations: int = Query(default=5, ge=1, le=20, description="Number of iterations for averaging"),
+    widths: List[int] = Query(default=[5, 25, 100, 400], description="Field counts to benchmark"),
+    type_mix: List[str] = Query(default=list(GeneratorWideRecord.TYPES), description="Field types assigned round-robin: int, float, str, bool"),
+) -> Dict[str, Any]:
+
+    try:
+        schemas = {width: GeneratorWideRecord.schema(width, type_mix=type_mix) for width in sorted(set(widths)) if 1 <= width <= 400}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not schemas:
+        raise HTTPException(status_code=400, detail="At least one width between 1 and 400 is required")
+
+    try:
+        rows = []
+        for width, schema in schemas.items():
+            raw_data = generate_wide_batch(batch_size=batch_size, schema=schema)
+            for framework in FRAMEWORKS:
+                # Models for every framework come from the same schema description:
+                functions = wide_functions(framework, schema)
+                # The warm-up run is recorded into a throwaway results object:
+                await benchmark(data=raw_data, results=BenchmarkResults(framework), **functions)
+                results = BenchmarkResults(framework)
+                for _ in range(iterations):
+                    await benchmark(data=raw_data, results=results, **functions)
+
+                row = {'framework': framework, 'field_count': width, **results.to_dict()}
+                for phase in BenchmarkResults.PHASES:
+                    avg_time = row[f'avg_{phase}_time']
+                    row[f'{phase}_ns_per_record'] = avg_time / batch_size * 1e9
+                    row[f'{phase}_ns_per_field'] = avg_time / batch_size / width * 1e9
+                rows.append(row)
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'widths': list(schemas),
+                'type_mix': type_mix,
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Width benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Width benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/cold-start", response_model=Dict[str, Any])
+async def run_cold_start_benchmark(
+    model_count: int = Query(default=100, ge=1, le=2_000, description="Number of models defined in each fresh process"),
+    field_count: int = Query(default=10, ge=1, le=400, description="Fields per model"),
+    repeat: int = Query(default=3, ge=1, le=20, description="Fresh processes per variant; the median is reported"),
+    steady_loops: int = Query(default=20, ge=1, le=1_000, description="Round trips per model after the first one, for the steady-state figure"),
+    variants: List[str] = Query(default=list(COLD_START_VARIANTS), description="Variants: dataclass, pydantic, pydantic_defer_build, msgspec"),
+) -> Dict[str, Any]:
+
+    unknown = [variant for variant in variants if variant not in COLD_START_VARIANTS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown variants: {', '.join(unknown)}")
+
+    try:
+        results = {}
+        for variant in variants:
+            runs = [
+                await run_cold_start_process(variant, model_count, field_count, steady_loops)
+                for _ in range(repeat)
+            ]
+            results[variant] = {
+                key: statistics.median(run[key] for run in runs) if isinstance(value, (int, float)) else value
+                for key, value in runs[0].items()
+            }
+            results[variant]['processes'] = repeat
+
+        return {
+            'parameters': {
+                'model_count': model_count,
+                'field_count': field_count,
+                'repeat': repeat,
+                'steady_loops': steady_loops,
+            },
+            'results': results,
+        }
+
+    except Exception as e:
+        logger.error(f"Cold-start benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Cold-start benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/columnar", response_model=Dict[str, Any])
+async def run_columnar_benchmark(
+    batch_size: int = Query(default=10_000, ge=1, le=100_000, description="Number of objects converted per iteration"),
+    iterations: int = Query(default=5, ge=1, le=20, description="Number of iterations for averaging"),
+) -> Dict[str, Any]:
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+
+        rows = []
+        for framework, extractors in COLUMNAR_EXTRACTORS.items():
+            instances = COLUMNAR_INSTANTIATE[framework](users)
+            for extractor, (shape, function_extract) in extractors.items():
+                for (target, exporter_shape), function_export in COLUMNAR_EXPORTERS.items():
+                    if exporter_shape != shape:
+                        continue
+                    function_import = COLUMNAR_IMPORTERS[target]
+                    function_instantiate = COLUMNAR_INSTANTIATE[framework]
+                    export = lambda objects: function_export(function_extract(objects))
+                    back = lambda columnar: function_instantiate(function_import(columnar))
+
+                    columnar = export(instances)
+                    export_times = repeat_times(export, instances, iterations=iterations)
+                    import_times = repeat_times(back, columnar, iterations=iterations)
+
+                    # Memory is measured in a separate pass, so tracing never slows the timed ones:
+                    export_peak, export_arrow = peak_memory(export, instances)
+                    import_peak, import_arrow = peak_memory(back, columnar)
+                    avg_export_time = sum(export_times) / len(export_times)
+                    avg_import_time = sum(import_times) / len(import_times)
+                    rows.append({
+                        'framework': framework,
+                        'extractor': extractor,
+                        'target': target,
+                        'avg_export_time': avg_export_time,
+                        'avg_import_time': avg_import_time,
+                        'export_records_per_second': batch_size / avg_export_time if avg_export_time else 0.0,
+                        'import_records_per_second': batch_size / avg_import_time if avg_import_time else 0.0,
+                        'export_peak_python_bytes': export_peak,
+                        'export_arrow_bytes': export_arrow,
+                        'import_peak_python_bytes': import_peak,
+                        'columnar_bytes': held_bytes(columnar),
+                    })
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Columnar benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Columnar benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/ingest", response_model=Dict[str, Any])
+async def run_ingest_upload(
+    request: Request,
+    framework: str = Query(default='msgspec', pattern="^(dataclass|pydantic|msgspec)$", description="Framework decoding every record"),
+    format: str = Query(default='ndjson', pattern="^(ndjson|msgpack)$", description="NDJSON lines or 4-byte big-endian length-prefixed MessagePack"),
+    mode: str = Query(default='stream', pattern="^(stream|buffered)$", description="Decode chunks as they arrive, or read the whole body first"),
+) -> Dict[str, Any]:
+
+    splitter = SPLITTERS[format]()
+    decode = INGEST_DECODERS[format][framework]
+    errors = ERRORS[framework] + (msgspec.DecodeError,)
+    process = psutil.Process()
+    rss_start = process.memory_info().rss
+    peak_rss = rss_start
+    counts = Counter()
+    received = 0
+    chunks = 0
+    decode_time = 0.0
+
+    def consume(records: List[bytes], retained: Optional[List[Any]] = None) -> None:
+        nonlocal decode_time
+        start_time = time.perf_counter()
+        for record in records:
+            try:
+                instance = decode(record)
+            except errors:
+                counts['rejected'] += 1
+                continue
+            counts['decoded'] += 1
+            if retained is not None:
+                retained.append(instance)
+        decode_time += time.perf_counter() - start_time
+
+    try:
+        start_time = time.perf_counter()
+        if mode == 'stream':
+            # Each instance is dropped once decoded, so memory is bounded by one chunk plus a partial record.
+            async for chunk in request.stream():
+                received += len(chunk)
+                chunks += 1
+                consume(splitter.feed(chunk))
+                peak_rss = max(peak_rss, process.memory_info().rss)
+            consume(splitter.close())
+        else:
+            # What a `List[Model]` body parameter does: the whole body, then every instance, held at once.
+            body = await request.body()
+            received = len(body)
+            chunks = 1
+            peak_rss = max(peak_rss, process.memory_info().rss)
+            instances: List[Any] = []
+            consume(splitter.feed(body) + splitter.close(), retained=instances)
+            peak_rss = max(peak_rss, process.memory_info().rss)
+            del body, instances
+        elapsed = time.perf_counter() - start_time
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Ingest upload failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ingest upload failed: {str(e)}",
+        )
+
+    return {
+        'parameters': {
+            'framework': framework,
+            'format': format,
+            'mode': mode,
+        },
+        'records': counts['decoded'],
+        'rejected': counts['rejected'],
+        'bytes': received,
+        'chunks': chunks,
+        'elapsed': elapsed,
+        'decode_time': decode_time,
+        'records_per_second': counts['decoded'] / elapsed if elapsed else 0.0,
+        'megabytes_per_second': received / elapsed / 1e6 if elapsed else 0.0,
+        # Sampled after every chunk; RSS rarely shrinks, so compare modes on a fresh server each.
+        'rss_start_bytes': rss_start,
+        'peak_rss_bytes': peak_rss,
+        'peak_rss_delta_bytes': peak_rss - rss_start,
+    }
+
+@router.post(path="/compression", response_model=Dict[str, Any])
+async def run_compression_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of records sent per iteration"),
+    iterations: int = Query(default=3, ge=1, le=20, description="Number of iterations for averaging"),
+    codecs: List[str] = Query(default=['zlib', 'bz2', 'lzma'], description="Stdlib codecs (zlib, bz2, lzma), each at its default levels; 'none' is always included"),
+    formats: List[str] = Query(default=['ndjson', 'msgpack'], description="Wire formats: ndjson, msgpack"),
+) -> Dict[str, Any]:
+
+    try:
+        variants = codec_levels(tuple(codecs))
+        unknown = set(formats) - set(WIRE_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown formats {sorted(unknown)}, expected {', '.join(WIRE_FORMATS)}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+
+        rows = []
+        for format in dict.fromkeys(formats):
+            for framework, (function_encode, function_decode) in WIRE_FORMATS[format].items():
+                instances = [FRAMEWORKS[framework]['function_instantiate'](user) for user in users]
+                for (codec, level), (compress, decompress) in variants.items():
+                    # Per record: every message compressed on its own, as in one request per object.
+                    def send_records(objects: List[Any]) -> List[bytes]:
+                        return [compress(function_encode(instance)) for instance in objects]
+
+                    def receive_records(messages: List[bytes]) -> List[Any]:
+                        return [function_decode(decompress(message)) for message in messages]
+
+                    # Whole batch: records framed into one payload, compressed once.
+                    def send_batch(objects: List[Any]) -> List[bytes]:
+                        return [compress(b''.join(frame_record(function_encode(instance), format) for instance in objects))]
+
+                    def receive_batch(messages: List[bytes]) -> List[Any]:
+                        splitter = SPLITTERS[format]()
+                        return [function_decode(record) for record in splitter.feed(decompress(messages[0])) + splitter.close()]
+
+                    for framing, send, receive in (('per_record', send_records, receive_records), ('batch', send_batch, receive_batch)):
+                        messages = send(instances)
+                        send_times = repeat_times(send, instances, iterations=iterations)
+                        receive_times = repeat_times(receive, messages, iterations=iterations)
+
+                        avg_send_time = sum(send_times) / len(send_times)
+                        avg_receive_time = sum(receive_times) / len(receive_times)
+                        wire_bytes = sum(len(message) for message in messages)
+                        rows.append({
+                            'format': format,
+                            'framework': framework,
+                            'framing': framing,
+                            'codec': codec,
+                            'level': level,
+                            'wire_bytes': wire_bytes,
+                            'bytes_per_record': wire_bytes / batch_size,
+                            'avg_encode_compress_time': avg_send_time,
+                            'avg_decompress_decode_time': avg_receive_time,
+                            'encode_compress_records_per_second': batch_size / avg_send_time if avg_send_time else 0.0,
+                            'decompress_decode_records_per_second': batch_size / avg_receive_time if avg_receive_time else 0.0,
+                        })
+
+        # What the smaller payload costs: extra CPU per kilobyte saved against the uncompressed row.
+        uncompressed = {(row['format'], row['framework'], row['framing']): row for row in rows if row['codec'] == 'none'}
+        for row in rows:
+            baseline = uncompressed[(row['format'], row['framework'], row['framing'])]
+            saved = baseline['wire_bytes'] - row['wire_bytes']
+            extra_time = row['avg_encode_compress_time'] + row['avg_decompress_decode_time'] \
+                - baseline['avg_encode_compress_time'] - baseline['avg_decompress_decode_time']
+            row['compression_ratio'] = baseline['wire_bytes'] / row['wire_bytes'] if row['wire_bytes'] else None
+            row['bytes_saved'] = saved
+            row['extra_microseconds_per_kb_saved'] = extra_time / saved * 1e3 * 1e6 if saved > 0 else None
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'codecs': sorted({codec for codec, _ in variants}),
+                'formats': list(dict.fromkeys(formats)),
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Compression benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Compression benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/pydantic-fast-paths", response_model=Dict[str, Any])
+async def run_pydantic_fast_path_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of records per iteration"),
+    iterations: int = Query(default=10, ge=1, le=50, description="Number of iterations for averaging"),
+    operations: List[str] = Query(default=list(PYDANTIC_FAST_PATHS), description="Operations to measure"),
+    variants: List[str] = Query(default=[], description="Variants to measure (all when empty); 'default' and 'msgspec' are always included"),
+) -> Dict[str, Any]:
+
+    known = {variant for paths in PYDANTIC_FAST_PATHS.values() for variant in paths}
+    unknown = sorted(set(operations) - set(PYDANTIC_FAST_PATHS)) + sorted(set(variants) - known)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown operations or variants {unknown}; variants are {', '.join(sorted(known))}")
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+        instances = [instantiate_pydantic(user) for user in users]
+        inputs = {
+            'dicts': users,
+            'instances': instances,
+            'msgspec_instances': [instantiate_msgspec(user) for user in users],
+            'records': [encode_pydantic(instance) for instance in instances],
+            'array': encode_pydantic_batch(instances),
+        }
+
+        rows = measure_fast_paths(
+            framework='pydantic',
+            paths=PYDANTIC_FAST_PATHS,
+            inputs=inputs,
+            operations=list(dict.fromkeys(operations)),
+            variants=variants,
+            iterations=iterations,
+            batch_size=batch_size,
+        )
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'operations': list(dict.fromkeys(operations)),
+                'variants': variants or sorted(known),
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Pydantic fast-path benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Pydantic fast-path benchmarking failed: {str(e)}",
+        )
+
+@router.post(path="/dataclass-fast-paths", response_model=Dict[str, Any])
+async def run_dataclass_fast_path_benchmark(
+    batch_size: int = Query(default=1_000, ge=1, le=100_000, description="Number of records per iteration"),
+    iterations: int = Query(default=10, ge=1, le=50, description="Number of iterations for averaging"),
+    operations: List[str] = Query(default=list(DATACLASS_FAST_PATHS), description="Operations to measure"),
+    variants: List[str] = Query(default=[], description="Variants to measure (all when empty); 'default' and 'msgspec' are always included"),
+) -> Dict[str, Any]:
+
+    known = {variant for paths in DATACLASS_FAST_PATHS.values() for variant in paths}
+    unknown = sorted(set(operations) - set(DATACLASS_FAST_PATHS)) + sorted(set(variants) - known)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown operations or variants {unknown}; variants are {', '.join(sorted(known))}")
+
+    try:
+        users = generate_users_batch(batch_size=batch_size)
+        instances = [instantiate_dataclass(user) for user in users]
+        inputs = {
+            'instances': instances,
+            'msgspec_instances': [instantiate_msgspec(user) for user in users],
+            'records': [encode_dataclass(instance) for instance in instances],
+        }
+
+        rows = measure_fast_paths(
+            framework='dataclass',
+            paths=DATACLASS_FAST_PATHS,
+            inputs=inputs,
+            operations=list(dict.fromkeys(operations)),
+            variants=variants,
+            iterations=iterations,
+            batch_size=batch_size,
+        )
+
+        return {
+            'parameters': {
+                'batch_size': batch_size,
+                'iterations': iterations,
+                'operations': list(dict.fromkeys(operations)),
+                'variants': variants or sorted(known),
+            },
+            'results': rows,
+        }
+
+    except Exception as e:
+        logger.error(f"Dataclass fast-path benchmarking failed: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Dataclass fast-path benchmarking failed: {str(e)}",
+        )
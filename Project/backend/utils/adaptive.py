@@ -0,0 +1,103 @@
+import math
+import time
+import statistics
+from typing import Self, Any, Dict, List, Optional, Sequence
+
+
+# Two-sided 95% Student t critical values for 1..30 degrees of freedom; the normal
+# value is close enough beyond that.
+T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+Z_CRITICAL_95 = 1.960
+
+
+def relative_half_width(samples: Sequence[float]) -> Optional[float]:
+    # Half-width of the 95% confidence interval of the mean, as a fraction of the mean.
+    n = len(samples)
+    if n < 2:
+        return None
+    mean = statistics.fmean(samples)
+    if mean <= 0:
+        return None
+    critical = T_CRITICAL_95[n - 2] if n - 1 <= len(T_CRITICAL_95) else Z_CRITICAL_95
+    return critical * statistics.stdev(samples) / math.sqrt(n) / mean
+
+
+class SequentialStopping:
+
+    def __init__(
+            self: Self,
+            target: float = 0.02,
+            time_budget: float = 60.0,
+            min_iterations: int = 3,
+            max_iterations: int = 1_000,
+    ) -> None:
+        if not 0 < target < 1:
+            raise ValueError(f"Target precision must be between 0 and 1, got {target}")
+        if min_iterations < 2:
+            raise ValueError("Adaptive runs need at least 2 iterations to estimate a confidence interval")
+        if max_iterations < min_iterations:
+            raise ValueError(f"max_iterations ({max_iterations}) is below min_iterations ({min_iterations})")
+        self.target = target
+        self.time_budget = time_budget
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.start_time = time.perf_counter()
+        self.state: Dict[str, Dict[str, Any]] = {}
+
+    def start(self: Self, frameworks: List[str], phases: Sequence[str]) -> None:
+        self.start_time = time.perf_counter()
+        self.state = {
+            framework: {
+                'iterations': 0,
+                'stop_reason': None,
+                'phases': {phase: {'relative_half_width': None, 'converged_at': None} for phase in phases},
+            }
+            for framework in frameworks
+        }
+
+    def elapsed(self: Self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def active(self: Self) -> List[str]:
+        return [framework for framework, state in self.state.items() if state['stop_reason'] is None]
+
+    def update(self: Self, framework: str, samples: Dict[str, Sequence[float]]) -> None:
+        state = self.state[framework]
+        state['iterations'] += 1
+        for phase, values in samples.items():
+            width = relative_half_width(values)
+            phase_state = state['phases'][phase]
+            phase_state['relative_half_width'] = width
+            # First iteration at which the phase met the target (it may drift back out later):
+            if width is not None and width <= self.target and phase_state['converged_at'] is None:
+                phase_state['converged_at'] = state['iterations']
+
+        # A framework stops once every phase is within the target at the same time.
+        if state['iterations'] >= self.min_iterations and all(
+            phase_state['relative_half_width'] is not None and phase_state['relative_half_width'] <= self.target
+            for phase_state in state['phases'].values()
+        ):
+            state['stop_reason'] = 'converged'
+        elif state['iterations'] >= self.max_iterations:
+            state['stop_reason'] = 'max_iterations'
+
+    def exhaust_budget(self: Self) -> bool:
+        if self.elapsed() < self.time_budget:
+            return False
+        for framework in self.active():
+            self.state[framework]['stop_reason'] = 'time_budget'
+        return True
+
+    def to_dict(self: Self) -> Dict[str, Any]:
+        return {
+            'target_precision': self.target,
+            'time_budget': self.time_budget,
+            'min_iterations': self.min_iterations,
+            'max_iterations': self.max_iterations,
+            'elapsed': self.elapsed(),
+            'iterations': {framework: state['iterations'] for framework, state in self.state.items()},
+        }
@@ -0,0 +1,112 @@
+import os
+import cProfile
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Self, Any, List, Dict, Tuple, Iterator
+
+from utils import profiling
+
+
+class AllocationTracer:
+
+    SNAPSHOT_FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+        # Profiler bookkeeping when profile=true runs alongside:
+        tracemalloc.Filter(False, cProfile.__file__),
+        tracemalloc.Filter(False, profiling.__file__),
+    )
+
+    def __init__(self: Self, objects_per_phase: int, top: int = 10) -> None:
+        self.objects_per_phase = max(objects_per_phase, 1)
+        self.top = top
+        self._started_tracing = False
+        # (framework, phase) -> accumulated totals and per-site (blocks, bytes) over all iterations
+        self._totals: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._sites: Dict[Tuple[str, str], Dict[str, List[int]]] = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+
+    @contextmanager
+    def tracing(self: Self) -> Iterator[None]:
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def phase(self: Self, framework: str, phase: str) -> Iterator[None]:
+        # Snapshots are taken outside the timed span; the phase itself still pays
+        # tracemalloc's per-allocation hook, so timings are inflated in this mode.
+        before = tracemalloc.take_snapshot().filter_traces(self.SNAPSHOT_FILTERS)
+        current_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(self.SNAPSHOT_FILTERS)
+            self._record((framework, phase), before, after, current_before, current_after, peak)
+
+    def _record(
+            self: Self,
+            key: Tuple[str, str],
+            before: tracemalloc.Snapshot,
+            after: tracemalloc.Snapshot,
+            current_before: int,
+            current_after: int,
+            peak: int,
+    ) -> None:
+        totals = self._totals[key]
+        totals['iterations'] += 1
+        totals['net_bytes'] += current_after - current_before
+        totals['peak_bytes'] += peak - current_before
+        # Whatever was allocated and released inside the phase (temporaries) only shows up in the peak:
+        totals['transient_peak_bytes'] += peak - current_after
+
+        # Snapshots only hold live memory, so sites are those of what the phase retained
+        # (its outputs); temporaries freed inside the phase only show up in the peak.
+        retained_blocks = retained_bytes = 0
+        for diff in after.compare_to(before, 'lineno'):
+            if diff.count_diff <= 0 and diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            site = self._sites[key][f"{os.path.basename(frame.filename)}:{frame.lineno}"]
+            site[0] += max(diff.count_diff, 0)
+            site[1] += max(diff.size_diff, 0)
+            retained_blocks += max(diff.count_diff, 0)
+            retained_bytes += max(diff.size_diff, 0)
+
+        totals['retained_blocks'] += retained_blocks
+        totals['retained_bytes'] += retained_bytes
+
+    def reports(self: Self, framework: str) -> Dict[str, Dict[str, Any]]:
+        reports = {}
+        for (traced_framework, phase), totals in self._totals.items():
+            if traced_framework != framework:
+                continue
+            iterations = totals['iterations']
+            average = {name: value / iterations for name, value in totals.items() if name != 'iterations'}
+            sites = sorted(self._sites[(framework, phase)].items(), key=lambda item: -item[1][1])[:self.top]
+            reports[phase] = {
+                'iterations': iterations,
+                **average,
+                'retained_blocks_per_object': average['retained_blocks'] / self.objects_per_phase,
+                'retained_bytes_per_object': average['retained_bytes'] / self.objects_per_phase,
+                'peak_bytes_per_object': average['peak_bytes'] / self.objects_per_phase,
+                'top_retained_sites': [
+                    {
+                        'site': site,
+                        'blocks': blocks / iterations,
+                        'bytes': size / iterations,
+                        'bytes_per_object': size / iterations / self.objects_per_phase,
+                    }
+                    for site, (blocks, size) in sites
+                ],
+            }
+        return reports
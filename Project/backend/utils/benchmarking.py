@@ -1,14 +1,24 @@
-from typing import Self, Any, List, Dict
+from typing import Self, Any, List, Dict, Optional
+
+from utils.latency import LatencyHistogram
+from utils.distributions import summarize_samples, summarize_records
+from utils.environment import normalize
 
 
 class BenchmarkResults:
 
+    PHASES = ('instantiation', 'serialization', 'deserialization')
+
     def __init__(self: Self, framework_name: str) -> None:
         self.framework_name = framework_name
         self.instantiation_times: List[float] = []
         self.serialization_times: List[float] = []
         self.deserialization_times: List[float] = []
         self.memory_usage: List[int] = []
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.allocations: Dict[str, Dict[str, Any]] = {}
+        self.adaptive: Dict[str, Any] = {}
 
     def add_instantiation_time(self: Self, time_elapsed: float) -> None:
         self.instantiation_times.append(time_elapsed)
@@ -22,6 +32,13 @@ class BenchmarkResults:
     def add_memory_usage(self: Self, memory_bytes: int) -> None:
         self.memory_usage.append(memory_bytes)
     
+    def add_chunk_totals(self: Self, chunks: 'BenchmarkResults') -> None:
+        # One pass over the whole batch, run chunk by chunk: the pass takes the sum of its chunks.
+        self.add_instantiation_time(sum(chunks.instantiation_times))
+        self.add_serialization_time(sum(chunks.serialization_times))
+        self.add_deserialization_time(sum(chunks.deserialization_times))
+        self.add_memory_usage(sum(chunks.memory_usage))
+
     def get_avg_instantiation_time(self: Self) -> float:
         return sum(self.instantiation_times) / len(self.instantiation_times) if self.instantiation_times else 0.0
 
@@ -34,8 +51,27 @@ class BenchmarkResults:
     def get_avg_memory_usage(self: Self) -> float:
         return sum(self.memory_usage) / len(self.memory_usage) if self.memory_usage else 0.0
         
-    def to_dict(self: Self) -> Dict[str, Any]:
-        return {
+    def get_latency_histogram(self: Self, phase: str) -> LatencyHistogram:
+        if phase not in self.latency:
+            self.latency[phase] = LatencyHistogram()
+        return self.latency[phase]
+
+    def get_phase_samples(self: Self, phase: str) -> List[float]:
+        return getattr(self, f'{phase}_times')
+
+    def get_distributions(self: Self, bins: int = 50, max_points: int = 1_000) -> Dict[str, Dict[str, Any]]:
+        # Per-record timings when the run sampled them, with the per-iteration totals alongside:
+        distributions = {}
+        for phase in self.PHASES:
+            iterations = summarize_samples(self.get_phase_samples(phase), bins=bins, max_points=max_points)
+            if self.latency.get(phase) and self.latency[phase].total_count:
+                distributions[phase] = {**summarize_records(self.latency[phase], bins=bins, max_points=max_points), 'iterations': iterations}
+            else:
+                distributions[phase] = {**iterations, 'iterations': iterations}
+        return distributions
+
+    def to_dict(self: Self, calibration: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        result = {
             'framework': self.framework_name,
             'avg_instantiation_time': self.get_avg_instantiation_time(),
             'avg_serialization_time': self.get_avg_serialization_time(),
@@ -43,3 +79,17 @@ class BenchmarkResults:
             'avg_memory_usage': self.get_avg_memory_usage(),
             'total_operations': len(self.serialization_times)
         }
+        if calibration:
+            result['normalized'] = {
+                f'avg_{phase}_time': normalize(result[f'avg_{phase}_time'], calibration)
+                for phase in self.PHASES
+            }
+        if self.latency:
+            result['latency'] = {phase: histogram.to_dict() for phase, histogram in self.latency.items()}
+        if self.profiles:
+            result['profile'] = self.profiles
+        if self.allocations:
+            result['allocations'] = self.allocations
+        if self.adaptive:
+            result['adaptive'] = self.adaptive
+        return result
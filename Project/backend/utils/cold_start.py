@@ -0,0 +1,113 @@
+import sys
+import time
+import argparse
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+import psutil
+
+from utils.data_generator import GeneratorWideRecord
+
+
+# Run as `python -m utils.cold_start ...` in a fresh interpreter: nothing here may import
+# pydantic or msgspec at module level, or the measured import/definition would be warm.
+VARIANTS = ('dataclass', 'pydantic', 'pydantic_defer_build', 'msgspec')
+LIBRARIES = {
+    'dataclass': ['dataclasses', 'json'],
+    'pydantic': ['pydantic'],
+    'pydantic_defer_build': ['pydantic'],
+    'msgspec': ['msgspec', 'msgspec.json'],
+}
+
+Schema = Tuple[Tuple[str, str], ...]
+PYTHON_TYPES = {'int': int, 'float': float, 'str': str, 'bool': bool}
+
+
+def definer(variant: str) -> Callable[[str, Schema], type]:
+    if variant == 'dataclass':
+        from dataclasses import make_dataclass
+        return lambda name, schema: make_dataclass(name, [(field, PYTHON_TYPES[type_name]) for field, type_name in schema])
+    if variant in ('pydantic', 'pydantic_defer_build'):
+        from pydantic import ConfigDict, create_model
+        config = ConfigDict(defer_build=variant == 'pydantic_defer_build')
+        return lambda name, schema: create_model(
+            name, __config__=config, **{field: (PYTHON_TYPES[type_name], ...) for field, type_name in schema},
+        )
+    import msgspec
+    return lambda name, schema: msgspec.defstruct(name, [(field, PYTHON_TYPES[type_name]) for field, type_name in schema], kw_only=True)
+
+def round_tripper(variant: str) -> Callable[[type, Dict[str, Any]], Any]:
+    # Instantiate, encode and decode once: the first call pays any lazy schema compilation.
+    if variant == 'dataclass':
+        import json
+        from dataclasses import asdict
+        return lambda model, record: model(**json.loads(json.dumps(asdict(model(**record)))))
+    if variant in ('pydantic', 'pydantic_defer_build'):
+        return lambda model, record: model.model_validate_json(model(**record).model_dump_json())
+    import msgspec
+    return lambda model, record: msgspec.json.decode(msgspec.json.encode(model(**record)), type=model)
+
+def run(variant: str, model_count: int, field_count: int, steady_loops: int) -> Dict[str, Any]:
+    process = psutil.Process()
+    schema = GeneratorWideRecord.schema(field_count)
+    record = GeneratorWideRecord.generate_record(schema)
+
+    start_time = time.perf_counter()
+    for library in LIBRARIES[variant]:
+        importlib.import_module(library)
+    import_time = time.perf_counter() - start_time
+
+    define = definer(variant)
+    round_trip = round_tripper(variant)
+    rss_before = process.memory_info().rss
+
+    start_time = time.perf_counter()
+    models: List[type] = [define(f"ColdModel{index}", schema) for index in range(model_count)]
+    define_time = time.perf_counter() - start_time
+    rss_defined = process.memory_info().rss
+
+    first_use_times = []
+    for model in models:
+        start_time = time.perf_counter()
+        round_trip(model, record)
+        first_use_times.append(time.perf_counter() - start_time)
+    rss_used = process.memory_info().rss
+
+    # Steady state on the same models, for comparison with the first call:
+    start_time = time.perf_counter()
+    for _ in range(steady_loops):
+        for model in models:
+            round_trip(model, record)
+    steady_time = (time.perf_counter() - start_time) / (steady_loops * model_count)
+
+    return {
+        'variant': variant,
+        'import_time': import_time,
+        'define_time': define_time,
+        'define_time_per_model': define_time / model_count,
+        'first_use_time': first_use_times[0],
+        'first_use_total_time': sum(first_use_times),
+        'first_use_time_per_model': sum(first_use_times) / model_count,
+        'steady_round_trip_time': steady_time,
+        'first_use_over_steady': first_use_times[0] / steady_time if steady_time else None,
+        'memory_defined_bytes': rss_defined - rss_before,
+        'memory_defined_bytes_per_model': (rss_defined - rss_before) / model_count,
+        'memory_after_first_use_bytes': rss_used - rss_before,
+        'python_version': sys.version.split()[0],
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure model definition and first-use cost in this (fresh) process")
+    parser.add_argument('--variant', choices=VARIANTS, required=True)
+    parser.add_argument('--model-count', type=int, default=100)
+    parser.add_argument('--field-count', type=int, default=10)
+    parser.add_argument('--steady-loops', type=int, default=20)
+    arguments = parser.parse_args()
+    result = run(arguments.variant, arguments.model_count, arguments.field_count, arguments.steady_loops)
+    # Imported only after the measured imports: 'json' is one of the dataclass variant's libraries.
+    import json
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+
+USER_FIELDS = ('id', 'name', 'email', 'age', 'is_active')
+
+USER_ARROW_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('name', pa.string()),
+    ('email', pa.string()),
+    ('age', pa.int64()),
+    ('is_active', pa.bool_()),
+])
+
+# Structured arrays need fixed-width strings; generated names and emails fit comfortably.
+USER_NUMPY_DTYPE = np.dtype([
+    ('id', np.int64),
+    ('name', 'U16'),
+    ('email', 'U64'),
+    ('age', np.int64),
+    ('is_active', np.bool_),
+])
+
+
+def dicts_to_arrow(rows: List[Dict[str, Any]]) -> pa.Table:
+    return pa.Table.from_pylist(rows, schema=USER_ARROW_SCHEMA)
+
+def tuples_to_arrow(rows: List[Tuple[Any, ...]]) -> pa.Table:
+    # Transposing in Python first lets Arrow build every column from one homogeneous list:
+    columns = zip(*rows) if rows else [[] for _ in USER_FIELDS]
+    return pa.Table.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, USER_ARROW_SCHEMA)],
+        schema=USER_ARROW_SCHEMA,
+    )
+
+def tuples_to_numpy(rows: List[Tuple[Any, ...]]) -> np.ndarray:
+    return np.array(rows, dtype=USER_NUMPY_DTYPE)
+
+def arrow_to_dicts(table: pa.Table) -> List[Dict[str, Any]]:
+    return table.to_pylist()
+
+def numpy_to_dicts(array: np.ndarray) -> List[Dict[str, Any]]:
+    names = array.dtype.names
+    return [dict(zip(names, row)) for row in array.tolist()]
+
+def held_bytes(value: Any) -> int:
+    if isinstance(value, pa.Table):
+        return value.nbytes
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return 0
+
+def peak_memory(function: Callable[..., Any], *args: Any) -> Tuple[int, int]:
+    # (Python-heap peak seen by tracemalloc, bytes allocated from Arrow's own memory pool).
+    # Arrow buffers bypass tracemalloc, so they are read from the pool counter instead.
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.reset_peak()
+    current_before, _ = tracemalloc.get_traced_memory()
+    try:
+        result = function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        arrow_allocated = pa.total_allocated_bytes() - arrow_before
+        del result
+    finally:
+        if started:
+            tracemalloc.stop()
+    return peak - current_before, arrow_allocated
@@ -0,0 +1,25 @@
+import bz2
+import lzma
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+
+# codec -> (levels measured by default, compress(data, level), decompress(data)).
+# 'none' is always measured: every other row is compared against it.
+CODECS: Dict[str, Tuple[Tuple[Optional[int], ...], Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]] = {
+    'none': ((None,), lambda data, level: data, lambda data: data),
+    'zlib': ((1, 6, 9), lambda data, level: zlib.compress(data, level), zlib.decompress),
+    'bz2': ((1, 9), lambda data, level: bz2.compress(data, level), bz2.decompress),
+    'lzma': ((0, 6), lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+
+
+def codec_levels(codecs: Tuple[str, ...]) -> Dict[Tuple[str, Optional[int]], Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    variants = {}
+    for codec in ('none',) + tuple(codec for codec in codecs if codec != 'none'):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', expected one of {', '.join(CODECS)}")
+        levels, compress, decompress = CODECS[codec]
+        for level in levels:
+            variants[(codec, level)] = (lambda data, compress=compress, level=level: compress(data, level), decompress)
+    return variants
@@ -1,5 +1,5 @@
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Sequence
 
 
 class GeneratorUser:
@@ -41,11 +41,110 @@ class GeneratorUser:
             'is_active': random.choice([True, False]),
         }
 
+class GeneratorInvalidUser:
+
+    KINDS = (
+        "wrong_type",
+        "missing_field",
+        "extra_field",
+        "out_of_range",
+    )
+    WRONG_TYPES = {
+        'id': "not-a-number",
+        'name': 12345,
+        'age': "forty",
+        'is_active': "maybe",
+    }
+    OUT_OF_RANGE_AGES = [-5, 250]
+
+    @staticmethod
+    def corrupt_user(user: Dict[str, Any], kind: str) -> Dict[str, Any]:
+        user = dict(user)
+        if kind == "wrong_type":
+            field = random.choice(list(GeneratorInvalidUser.WRONG_TYPES))
+            user[field] = GeneratorInvalidUser.WRONG_TYPES[field]
+        elif kind == "missing_field":
+            del user[random.choice(list(user))]
+        elif kind == "extra_field":
+            user['unexpected'] = "surprise"
+        elif kind == "out_of_range":
+            user['age'] = random.choice(GeneratorInvalidUser.OUT_OF_RANGE_AGES)
+        else:
+            raise ValueError(f"Unknown invalid record kind '{kind}'")
+        return user
+
+class GeneratorStringlyUser:
+
+    # What a CSV row or a querystring delivers: every value is a string.
+    @staticmethod
+    def stringify_user(user: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+            for key, value in user.items()
+        }
+
+class GeneratorWideRecord:
+
+    # Shared schema description: ((field name, type name), ...), turned into models in models/wide_model.py
+    TYPES = (
+        "int",
+        "float",
+        "str",
+        "bool",
+    )
+    WORDS = [
+        "alpha",
+        "bravo",
+        "charlie",
+        "delta",
+        "echo",
+        "foxtrot",
+    ]
+
+    @staticmethod
+    def schema(field_count: int, type_mix: Sequence[str] = TYPES) -> Tuple[Tuple[str, str], ...]:
+        for type_name in type_mix:
+            if type_name not in GeneratorWideRecord.TYPES:
+                raise ValueError(f"Unknown field type '{type_name}', expected one of {', '.join(GeneratorWideRecord.TYPES)}")
+        return tuple((f"field_{index:03d}", type_mix[index % len(type_mix)]) for index in range(field_count))
+
+    @staticmethod
+    def generate_value(type_name: str) -> Any:
+        if type_name == "int":
+            return random.randint(0, 1_000_000)
+        if type_name == "float":
+            return round(random.uniform(0, 1_000), 4)
+        if type_name == "str":
+            return f"{random.choice(GeneratorWideRecord.WORDS)}-{random.randint(0, 9_999)}"
+        return random.choice([True, False])
+
+    @staticmethod
+    def generate_record(schema: Sequence[Tuple[str, str]]) -> Dict[str, Any]:
+        return {name: GeneratorWideRecord.generate_value(type_name) for name, type_name in schema}
+
 class Generator:
 
     @staticmethod
     def generate_user(user_id: int) -> Dict[str, Any]:
         return GeneratorUser.generate_random_user(user_id=user_id)
 
-def generate_users_batch(batch_size: int) -> List[Dict[str, Any]]:
-    return [Generator.generate_user(user_id=i) for i in range(1, batch_size + 1)]
+def generate_users_batch(batch_size: int, start_id: int = 1) -> List[Dict[str, Any]]:
+    return [Generator.generate_user(user_id=i) for i in range(start_id, start_id + batch_size)]
+
+def generate_users_batch_with_errors(
+        batch_size: int,
+        invalid_ratio: float,
+        kinds: Sequence[str] = GeneratorInvalidUser.KINDS,
+) -> Tuple[List[Dict[str, Any]], List[Optional[str]]]:
+    users = generate_users_batch(batch_size=batch_size)
+    labels: List[Optional[str]] = [None] * batch_size
+
+    for index in random.sample(range(batch_size), k=round(batch_size * invalid_ratio)):
+        kind = random.choice(kinds)
+        users[index] = GeneratorInvalidUser.corrupt_user(users[index], kind=kind)
+        labels[index] = kind
+
+    return users, labels
+
+def generate_wide_batch(batch_size: int, schema: Sequence[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    return [GeneratorWideRecord.generate_record(schema) for _ in range(batch_size)]
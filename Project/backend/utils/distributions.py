@@ -0,0 +1,134 @@
+from typing import Any, List, Dict, Tuple, Sequence, Optional
+
+from utils.latency import LatencyHistogram
+
+
+def histogram(values: Sequence[float], bins: int = 50, weights: Optional[Sequence[int]] = None) -> Dict[str, List[float]]:
+    if not values:
+        return {'edges': [], 'counts': []}
+    weights = weights if weights is not None else [1] * len(values)
+
+    low, high = min(values), max(values)
+    if low == high:
+        return {'edges': [low, high], 'counts': [sum(weights)]}
+
+    width = (high - low) / bins
+    counts = [0] * bins
+    for value, weight in zip(values, weights):
+        # The maximum value belongs to the last (closed) bin:
+        counts[min(int((value - low) / width), bins - 1)] += weight
+
+    return {
+        'edges': [low + width * i for i in range(bins + 1)],
+        'counts': counts,
+    }
+
+def ecdf(values: Sequence[float], max_points: int = 1_000) -> Dict[str, List[float]]:
+    if not values:
+        return {'x': [], 'y': []}
+
+    ordered = sorted(values)
+    n = len(ordered)
+    if n <= max_points:
+        indices = range(n)
+    else:
+        # Evenly spaced ranks, always keeping the minimum and maximum:
+        step = (n - 1) / (max_points - 1)
+        indices = sorted({round(i * step) for i in range(max_points)})
+
+    return {
+        'x': [ordered[i] for i in indices],
+        'y': [(i + 1) / n for i in indices],
+    }
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> Tuple[List[float], List[float]]:
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(x), list(y)
+
+    # Largest-Triangle-Three-Buckets: first and last points are kept, every
+    # bucket in between contributes the point forming the largest triangle
+    # with the previous pick and the average of the next bucket.
+    every = (n - 2) / (threshold - 2)
+    sampled_x, sampled_y = [x[0]], [y[0]]
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_length = avg_end - avg_start
+        avg_x = sum(x[avg_start:avg_end]) / avg_length
+        avg_y = sum(y[avg_start:avg_end]) / avg_length
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        point_ax, point_ay = x[a], y[a]
+
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((point_ax - avg_x) * (y[j] - point_ay) - (point_ax - x[j]) * (avg_y - point_ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled_x.append(x[next_a])
+        sampled_y.append(y[next_a])
+        a = next_a
+
+    sampled_x.append(x[-1])
+    sampled_y.append(y[-1])
+    return sampled_x, sampled_y
+
+def summarize_samples(values: Sequence[float], bins: int = 50, max_points: int = 1_000) -> Dict[str, Any]:
+    series_x, series_y = lttb(range(len(values)), values, threshold=max_points)
+    return {
+        'source': 'iterations',
+        'count': len(values),
+        'min': min(values) if values else None,
+        'max': max(values) if values else None,
+        'histogram': histogram(values, bins=bins),
+        'ecdf': ecdf(values, max_points=max_points),
+        'series': {'x': series_x, 'y': series_y},
+    }
+
+def weighted_ecdf(values: Sequence[float], weights: Sequence[int], max_points: int = 1_000) -> Dict[str, List[float]]:
+    # values are sorted bucket midpoints, weights the number of records in each bucket.
+    total = sum(weights)
+    if not total:
+        return {'x': [], 'y': []}
+
+    cumulative, seen = [], 0
+    for weight in weights:
+        seen += weight
+        cumulative.append(seen / total)
+    n = len(values)
+    if n <= max_points:
+        indices = range(n)
+    else:
+        step = (n - 1) / (max_points - 1)
+        indices = sorted({round(i * step) for i in range(max_points)})
+
+    return {
+        'x': [values[i] for i in indices],
+        'y': [cumulative[i] for i in indices],
+    }
+
+def summarize_records(latency: LatencyHistogram, bins: int = 50, max_points: int = 1_000) -> Dict[str, Any]:
+    # Every timed record, from the HDR buckets (histogram, ECDF) and the thinned raw series;
+    # nanoseconds are converted to seconds to match the per-iteration summaries.
+    buckets = latency.buckets()
+    values = [midpoint / 1e9 for midpoint, _ in buckets]
+    weights = [count for _, count in buckets]
+    series_y = [value / 1e9 for value in latency.series]
+    series_x = [index * latency.series_stride for index in range(len(series_y))]
+    series_x, series_y = lttb(series_x, series_y, threshold=max_points)
+    return {
+        'source': 'records',
+        'count': latency.total_count,
+        'min': values[0] if values else None,
+        'max': latency.max_value / 1e9 if buckets else None,
+        'histogram': histogram(values, bins=bins, weights=weights),
+        'ecdf': weighted_ecdf(values, weights, max_points=max_points),
+        'series': {'x': series_x, 'y': series_y},
+    }
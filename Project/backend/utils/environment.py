@@ -0,0 +1,115 @@
+import os
+import sys
+import json
+import time
+import socket
+import hashlib
+import functools
+import platform
+from typing import Any, Dict, Optional
+
+import psutil
+import fastapi
+import msgspec
+import pydantic
+import pydantic_core
+
+
+def cpu_model() -> Optional[str]:
+    # platform.processor() is empty on most Linux builds; /proc/cpuinfo has the marketing name.
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or None
+
+def frequency_governor() -> Optional[str]:
+    try:
+        with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor') as governor:
+            return governor.read().strip()
+    except OSError:
+        return None
+
+def cpu_frequency_mhz() -> Optional[float]:
+    try:
+        frequency = psutil.cpu_freq()
+    except (NotImplementedError, OSError):
+        return None
+    return frequency.current if frequency else None
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        'hostname': socket.gethostname(),
+        'pid': os.getpid(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_model': cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'cpu_available': len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count(),
+        'memory_total_bytes': psutil.virtual_memory().total,
+        'cpu_frequency_mhz': cpu_frequency_mhz(),
+        'frequency_governor': frequency_governor(),
+        'python_version': sys.version.split()[0],
+        'python_implementation': platform.python_implementation(),
+        'python_build': ' '.join(platform.python_build()),
+        'python_compiler': platform.python_compiler(),
+        'docker': bool(os.getenv('DOCKER_ENV')),
+        'libraries': {
+            'fastapi': fastapi.__version__,
+            'pydantic': pydantic.VERSION,
+            'pydantic_core': pydantic_core.__version__,
+            'msgspec': msgspec.__version__,
+        },
+    }
+
+def fingerprint() -> Dict[str, Any]:
+    environment = environment_info()
+    # Only what changes the numbers goes into the id; pid, hostname and current clock do not.
+    stable = {
+        key: environment[key]
+        for key in ('machine', 'cpu_model', 'cpu_count', 'frequency_governor', 'python_version',
+                    'python_implementation', 'python_build', 'python_compiler', 'libraries')
+    }
+    return {
+        'id': hashlib.sha1(json.dumps(stable, sort_keys=True).encode()).hexdigest()[:12],
+        **environment,
+    }
+
+
+def _calibration_workload(records: int = 2_000) -> int:
+    # Stdlib only (dicts, f-strings, arithmetic, json), so the unit tracks the machine
+    # and the interpreter but not the versions of the libraries being compared.
+    total = 0
+    batch = []
+    for index in range(records):
+        record = {'id': index, 'name': f"user{index}", 'email': f"user{index}@example.com", 'age': index % 80, 'is_active': index % 2 == 0}
+        batch.append(record)
+        total += record['age'] * 3 + len(record['name'])
+    return total + len(json.loads(json.dumps(batch)))
+
+@functools.lru_cache(maxsize=None)
+def _calibrate_machine(rounds: int) -> Dict[str, Any]:
+    timings = []
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        _calibration_workload()
+        timings.append(time.perf_counter() - start_time)
+    return {
+        'unit_seconds': min(timings),
+        'rounds': rounds,
+        'calibrated_at': time.time(),
+    }
+
+def calibrate_machine(rounds: int = 7, recalibrate: bool = False) -> Dict[str, Any]:
+    # Measured once per process: the machine does not change between runs, and every
+    # run normalized by the same unit stays comparable with the others.
+    if recalibrate:
+        _calibrate_machine.cache_clear()
+    return dict(_calibrate_machine(rounds))
+
+def normalize(seconds: float, calibration: Dict[str, Any]) -> float:
+    # Machine-independent "calibration units": how many calibration rounds the same time buys.
+    return seconds / calibration['unit_seconds']
@@ -0,0 +1,88 @@
+import gc
+import os
+import random
+from contextlib import contextmanager
+from typing import Self, Any, List, Dict, Optional, Iterator
+
+
+class IsolationSettings:
+
+    GC_MODES = ('enabled', 'disabled', 'collect')
+
+    def __init__(
+            self: Self,
+            gc_mode: str = 'enabled',
+            cpu: Optional[int] = None,
+            shuffle: bool = False,
+            subprocess: bool = False,
+            seed: Optional[int] = None,
+    ) -> None:
+        if gc_mode not in self.GC_MODES:
+            raise ValueError(f"Unknown gc_mode '{gc_mode}', expected one of {', '.join(self.GC_MODES)}")
+        if cpu is not None:
+            if not hasattr(os, 'sched_setaffinity'):
+                raise ValueError("CPU pinning requires os.sched_setaffinity, which is not available on this platform")
+            if cpu not in os.sched_getaffinity(0):
+                raise ValueError(f"CPU {cpu} is not available to this process")
+
+        self.gc_mode = gc_mode
+        self.cpu = cpu
+        self.shuffle = shuffle
+        self.subprocess = subprocess
+        self.seed = seed
+        self.orders: List[List[str]] = []
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_dict(cls, settings: Dict[str, Any]) -> 'IsolationSettings':
+        return cls(
+            gc_mode=settings.get('gc_mode', 'enabled'),
+            cpu=settings.get('cpu'),
+            shuffle=settings.get('shuffle', False),
+            subprocess=settings.get('subprocess', False),
+            seed=settings.get('seed'),
+        )
+
+    def framework_order(self: Self, frameworks: List[str]) -> List[str]:
+        order = list(frameworks)
+        if self.shuffle:
+            self._random.shuffle(order)
+        self.orders.append(order)
+        return order
+
+    def between_phases(self: Self) -> None:
+        if self.gc_mode == 'collect':
+            gc.collect()
+
+    def between_iterations(self: Self) -> None:
+        # With GC disabled nothing reclaims cycles, so clean up outside the timed spans:
+        if self.gc_mode in ('disabled', 'collect'):
+            gc.collect()
+
+    @contextmanager
+    def applied(self: Self) -> Iterator[None]:
+        previous_affinity = None
+        gc_was_enabled = gc.isenabled()
+        try:
+            if self.cpu is not None:
+                previous_affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {self.cpu})
+            if self.gc_mode == 'disabled':
+                gc.collect()
+                gc.disable()
+            yield
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+
+    def to_dict(self: Self) -> Dict[str, Any]:
+        return {
+            'gc_mode': self.gc_mode,
+            'cpu': self.cpu,
+            'shuffle': self.shuffle,
+            'subprocess': self.subprocess,
+            'seed': self.seed,
+            'orders': self.orders,
+        }
@@ -0,0 +1,111 @@
+import math
+import time
+from array import array
+from statistics import median
+from typing import Self, Any, List, Dict, Callable, Sequence, Tuple
+
+
+class LatencyHistogram:
+
+    # HDR-style layout: values below 2**SUB_BUCKET_BITS get exact buckets, every
+    # power of two above that is split into 2**(SUB_BUCKET_BITS - 1) linear
+    # sub-buckets, which bounds the relative error to ~1/64.
+    SUB_BUCKET_BITS = 7
+    MAX_VALUE_BITS = 40  # ~18 minutes in nanoseconds
+    PERCENTILES = {'p50': 0.50, 'p90': 0.90, 'p99': 0.99, 'p999': 0.999}
+    # Raw samples kept in record order for the time series; past this many the series is
+    # thinned to every other point, so it stays evenly spaced over all records.
+    MAX_SERIES_POINTS = 100_000
+
+    _SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    _SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+    _BUCKET_COUNT = _SUB_BUCKET_COUNT + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * _SUB_BUCKET_HALF
+
+    def __init__(self: Self) -> None:
+        self.counts = array('Q', bytes(8 * self._BUCKET_COUNT))
+        self.total_count = 0
+        self.max_value = 0
+        self.series = array('q')
+        self.series_stride = 1
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls._SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        index = cls._SUB_BUCKET_COUNT + (shift - 1) * cls._SUB_BUCKET_HALF + (value >> shift) - cls._SUB_BUCKET_HALF
+        return min(index, cls._BUCKET_COUNT - 1)
+
+    @classmethod
+    def _bucket_midpoint(cls, index: int) -> float:
+        if index < cls._SUB_BUCKET_COUNT:
+            return float(index)
+        shift, offset = divmod(index - cls._SUB_BUCKET_COUNT, cls._SUB_BUCKET_HALF)
+        top = offset + cls._SUB_BUCKET_HALF
+        return ((top << (shift + 1)) + ((top + 1) << (shift + 1))) / 2
+
+    def record(self: Self, value_ns: int) -> None:
+        value_ns = max(value_ns, 0)
+        if self.total_count % self.series_stride == 0:
+            self.series.append(value_ns)
+            if len(self.series) >= self.MAX_SERIES_POINTS:
+                self.series = self.series[::2]
+                self.series_stride *= 2
+        self.counts[self._index(value_ns)] += 1
+        self.total_count += 1
+        if value_ns > self.max_value:
+            self.max_value = value_ns
+
+    def buckets(self: Self) -> List[Tuple[float, int]]:
+        # (bucket midpoint in ns, count) for every non-empty bucket, in increasing order.
+        return [
+            (min(self._bucket_midpoint(index), float(self.max_value)), count)
+            for index, count in enumerate(self.counts)
+            if count
+        ]
+
+    def get_percentile(self: Self, percentile: float) -> float:
+        if not self.total_count:
+            return 0.0
+        target = max(1, math.ceil(percentile * self.total_count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._bucket_midpoint(index), float(self.max_value))
+        return float(self.max_value)
+
+    def to_dict(self: Self) -> Dict[str, Any]:
+        return {
+            'samples': self.total_count,
+            'max_ns': self.max_value,
+            **{f'{name}_ns': self.get_percentile(value) for name, value in self.PERCENTILES.items()},
+        }
+
+
+def calibrate_timer_overhead(rounds: int = 1_000) -> int:
+    clock = time.perf_counter_ns
+    deltas = []
+    for _ in range(rounds):
+        start = clock()
+        deltas.append(clock() - start)
+    return int(median(deltas))
+
+def sampled_map(
+        function: Callable,
+        items: Sequence[Any],
+        sample_every: int,
+        histogram: LatencyHistogram,
+        timer_overhead_ns: int = 0,
+) -> List[Any]:
+
+    # Only the first record of every stride is timed; the rest go through the
+    # same untimed fast path as the regular list comprehension.
+    clock = time.perf_counter_ns
+    outputs = []
+    for start in range(0, len(items), sample_every):
+        begin = clock()
+        outputs.append(function(items[start]))
+        histogram.record(clock() - begin - timer_overhead_ns)
+        outputs.extend(map(function, items[start + 1:start + sample_every]))
+    return outputs
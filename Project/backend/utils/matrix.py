@@ -0,0 +1,78 @@
+import re
+import time
+from typing import Self, Any, Callable, Dict, List, Optional, Tuple
+
+from models.wide_model import Schema, wide_functions
+from utils.data_generator import GeneratorWideRecord, generate_users_batch, generate_wide_batch
+
+
+SHAPE_PATTERN = re.compile(r'^(user|wide_(\d+))$')
+MAX_WIDE_FIELDS = 400
+
+# operation -> (function key in a FRAMEWORKS-style registry, prepared input it consumes)
+OPERATIONS: Dict[str, Tuple[str, str]] = {
+    'instantiation': ('function_instantiate', 'raw'),
+    'serialization': ('function_encode', 'instances'),
+    'deserialization': ('function_decode', 'encoded'),
+}
+
+
+def parse_shape(shape: str) -> Optional[Schema]:
+    # 'user' is the regular five-field user, 'wide_<n>' a generated record of n mixed-type fields.
+    match = SHAPE_PATTERN.match(shape)
+    if not match:
+        raise ValueError(f"Unknown shape '{shape}', expected 'user' or 'wide_<fields>'")
+    if match.group(2) is None:
+        return None
+    field_count = int(match.group(2))
+    if not 1 <= field_count <= MAX_WIDE_FIELDS:
+        raise ValueError(f"Shape '{shape}' needs between 1 and {MAX_WIDE_FIELDS} fields")
+    return GeneratorWideRecord.schema(field_count)
+
+
+class MatrixDatasets:
+
+    def __init__(self: Self, frameworks: Dict[str, Dict[str, Callable]], max_batch_size: int) -> None:
+        self.frameworks = frameworks
+        self.max_batch_size = max_batch_size
+        self.setup_time = 0.0
+        self._raw: Dict[str, List[Any]] = {}
+        self._prepared: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def functions(self: Self, framework: str, shape: str) -> Dict[str, Callable]:
+        schema = parse_shape(shape)
+        return self.frameworks[framework] if schema is None else wide_functions(framework, schema)
+
+    def raw(self: Self, shape: str) -> List[Any]:
+        # One dataset per shape, at the largest batch size: smaller batches are its prefixes.
+        if shape not in self._raw:
+            start_time = time.perf_counter()
+            schema = parse_shape(shape)
+            self._raw[shape] = (
+                generate_users_batch(batch_size=self.max_batch_size) if schema is None
+                else generate_wide_batch(batch_size=self.max_batch_size, schema=schema)
+            )
+            self.setup_time += time.perf_counter() - start_time
+        return self._raw[shape]
+
+    def prepared(self: Self, framework: str, shape: str) -> Dict[str, Any]:
+        # Instances and encoded payloads are built once per framework and shape, outside the timed samples.
+        key = (framework, shape)
+        if key not in self._prepared:
+            raw = self.raw(shape)
+            start_time = time.perf_counter()
+            functions = self.functions(framework, shape)
+            instances = [functions['function_instantiate'](item) for item in raw]
+            self._prepared[key] = {
+                'functions': functions,
+                'raw': raw,
+                'instances': instances,
+                'encoded': [functions['function_encode'](instance) for instance in instances],
+            }
+            self.setup_time += time.perf_counter() - start_time
+        return self._prepared[key]
+
+    def cell(self: Self, framework: str, shape: str, operation: str, batch_size: int) -> Tuple[Callable, List[Any]]:
+        function_key, input_key = OPERATIONS[operation]
+        prepared = self.prepared(framework, shape)
+        return prepared['functions'][function_key], prepared[input_key][:batch_size]
@@ -0,0 +1,237 @@
+import time
+import asyncio
+from bisect import bisect_left
+from typing import Self, Any, List, Dict, Tuple, Callable, Optional, Sequence
+
+import psutil
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+
+    TYPE = 'untyped'
+
+    def __init__(self: Self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self: Self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+    def render(self: Self) -> List[str]:
+        raise NotImplementedError
+
+    def _render_samples(self: Self, values: Dict[Tuple[str, ...], float]) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values.items()
+        ]
+
+
+class Counter(Metric):
+
+    TYPE = 'counter'
+
+    def __init__(self: Self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self: Self, *labelvalues: str, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} can only increase, got {amount}")
+        self.values[labelvalues] = self.values.get(labelvalues, 0.0) + amount
+
+    def set_total(self: Self, *labelvalues: str, value: float) -> None:
+        # For totals accumulated elsewhere (e.g. by the OS) and copied in on scrape.
+        self.values[labelvalues] = value
+
+    def render(self: Self) -> List[str]:
+        return self._render_samples(self.values)
+
+
+class Gauge(Metric):
+
+    TYPE = 'gauge'
+
+    def __init__(self: Self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self: Self, *labelvalues: str, value: float) -> None:
+        self.values[labelvalues] = value
+
+    def inc(self: Self, *labelvalues: str, amount: float = 1.0) -> None:
+        self.values[labelvalues] = self.values.get(labelvalues, 0.0) + amount
+
+    def dec(self: Self, *labelvalues: str, amount: float = 1.0) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def render(self: Self) -> List[str]:
+        return self._render_samples(self.values)
+
+
+class Histogram(Metric):
+
+    TYPE = 'histogram'
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(
+            self: Self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self.values: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self: Self, *labelvalues: str, value: float) -> None:
+        series = self.values.get(labelvalues)
+        if series is None:
+            series = self.values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self: Self) -> List[str]:
+        lines = self.header()
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self: Self) -> None:
+        self.metrics: List[Metric] = []
+        self.collectors: List[Callable[[], None]] = []
+
+    def register(self: Self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self: Self, collector: Callable[[], None]) -> None:
+        self.collectors.append(collector)
+
+    def render(self: Self) -> str:
+        for collector in self.collectors:
+            collector()
+        return '\n'.join(line for metric in self.metrics for line in metric.render()) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    'http_requests_total', 'HTTP requests by method, route template and status code', ('method', 'route', 'status'),
+))
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    'http_request_duration_seconds', 'HTTP request latency by method and route template', ('method', 'route'),
+))
+BENCHMARK_PHASE_DURATION = REGISTRY.register(Histogram(
+    'benchmark_phase_duration_seconds', 'Duration of one benchmark phase over a whole batch', ('framework', 'phase'),
+))
+BENCHMARK_RUNS = REGISTRY.register(Counter(
+    'benchmark_runs_total', 'Completed benchmark runs by outcome', ('outcome',),
+))
+BENCHMARK_RUNS_IN_FLIGHT = REGISTRY.register(Gauge(
+    'benchmark_runs_in_flight', 'Benchmark runs currently executing',
+))
+EVENT_LOOP_LAG = REGISTRY.register(Gauge(
+    'event_loop_lag_seconds', 'Most recent event-loop lag measured by the background probe',
+))
+EVENT_LOOP_LAG_HISTOGRAM = REGISTRY.register(Histogram(
+    'event_loop_lag_distribution_seconds', 'Event-loop lag measured by the background probe',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+))
+PROCESS_RSS = REGISTRY.register(Gauge(
+    'process_resident_memory_bytes', 'Resident set size of the backend process',
+))
+PROCESS_CPU = REGISTRY.register(Counter(
+    'process_cpu_seconds_total', 'User and system CPU time consumed by the backend process',
+))
+PROCESS_THREADS = REGISTRY.register(Gauge(
+    'process_threads', 'Threads in the backend process',
+))
+
+BENCHMARK_RUNS_IN_FLIGHT.set(value=0)
+EVENT_LOOP_LAG.set(value=0.0)
+
+_process = psutil.Process()
+
+def _collect_process_metrics() -> None:
+    # Sampled on scrape only, so the benchmark never pays for it.
+    with _process.oneshot():
+        cpu_times = _process.cpu_times()
+        PROCESS_RSS.set(value=_process.memory_info().rss)
+        PROCESS_CPU.set_total(value=cpu_times.user + cpu_times.system)
+        PROCESS_THREADS.set(value=_process.num_threads())
+
+REGISTRY.add_collector(_collect_process_metrics)
+
+
+def observe_benchmark_results(results: Dict[str, Any]) -> None:
+    # Recorded after the run from the timings already collected, never inside a timed span.
+    for framework, result in results.items():
+        for phase in result.PHASES:
+            for duration in result.get_phase_samples(phase):
+                BENCHMARK_PHASE_DURATION.observe(framework, phase, value=duration)
+
+async def probe_event_loop_lag(interval: float = 0.5) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - start - interval, 0.0)
+        EVENT_LOOP_LAG.set(value=lag)
+        EVENT_LOOP_LAG_HISTOGRAM.observe(value=lag)
+
+
+class MetricsMiddleware:
+
+    def __init__(self: Self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self: Self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = ['500']
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            if message['type'] == 'http.response.start':
+                status[0] = str(message['status'])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The route template (not the raw path) keeps label cardinality bounded.
+            route = getattr(scope.get('route'), 'path', 'unmatched')
+            HTTP_REQUESTS.inc(scope['method'], route, status[0])
+            HTTP_REQUEST_DURATION.observe(scope['method'], route, value=time.perf_counter() - start)
@@ -0,0 +1,211 @@
+import os
+import sys
+import pstats
+import cProfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from types import CodeType
+from typing import Self, Any, List, Dict, Tuple, Hashable, Iterator, Optional
+
+
+FunctionKey = Tuple[str, int, str]
+
+
+def frame_label(filename: str, line: int, name: str) -> str:
+    # ';' separates frames in the collapsed format, so it must never appear inside one:
+    if filename == '~':
+        return name.replace(';', ',')
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(';', ',')
+
+def _code_label(code: CodeType) -> str:
+    return frame_label(code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class StackSampler:
+
+    # Below this many samples per phase the top functions are mostly noise.
+    MIN_SAMPLES = 100
+
+    def __init__(self: Self, thread_id: int, interval: float = 0.001, stack_root: str = 'benchmark') -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stack_root = stack_root
+        # Samples are attributed to whatever label is active, so one sampler serves every framework/phase:
+        self.label: Optional[Hashable] = None
+        self.stacks: Dict[Hashable, Counter] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def running(self: Self) -> bool:
+        return self._thread is not None
+
+    def start(self: Self) -> None:
+        # The sampler only runs when the profiled thread releases the GIL, so
+        # hand it over at least as often as we want to sample.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.interval, self._switch_interval))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self: Self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self: Self) -> None:
+        while not self._stop.wait(self.interval):
+            label = self.label
+            if label is None:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                if frame.f_code.co_name == self.stack_root:
+                    break
+                frame = frame.f_back
+            if stack:
+                self.stacks.setdefault(label, Counter())[tuple(reversed(stack))] += 1
+
+    def report(self: Self, label: Hashable, top: int = 20) -> Dict[str, Any]:
+        stacks = self.stacks.get(label, Counter())
+        total = sum(stacks.values())
+        self_samples: Counter = Counter()
+        total_samples: Counter = Counter()
+        for stack, count in stacks.items():
+            self_samples[stack[-1]] += count
+            for code in set(stack):
+                total_samples[code] += count
+
+        return {
+            'profiler': 'sampling',
+            'interval': self.interval,
+            'samples': total,
+            'insufficient_samples': total < self.MIN_SAMPLES,
+            'top_functions': [
+                {
+                    'function': _code_label(code),
+                    'self_samples': count,
+                    'total_samples': total_samples[code],
+                    'self_fraction': count / total if total else 0.0,
+                }
+                for code, count in self_samples.most_common(top)
+            ],
+            'collapsed': '\n'.join(
+                f"{';'.join(_code_label(code) for code in stack)} {count}"
+                for stack, count in sorted(stacks.items(), key=lambda item: -item[1])
+            ),
+        }
+
+
+class PhaseProfiler:
+
+    MODES = ('cprofile', 'sampling')
+    MAX_STACK_DEPTH = 64
+
+    def __init__(self: Self, mode: str = 'cprofile', top: int = 20, interval: float = 0.001) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiler '{mode}', expected one of {', '.join(self.MODES)}")
+        self.mode = mode
+        self.top = top
+        self.interval = interval
+        # One profiler per framework/phase, re-enabled on every iteration so the data accumulates:
+        self._profilers: Dict[Tuple[str, str], Any] = {}
+        self._sampler = StackSampler(threading.get_ident(), interval=interval)
+
+    @contextmanager
+    def phase(self: Self, framework: str, phase: str) -> Iterator[None]:
+        key = (framework, phase)
+        if self.mode == 'cprofile':
+            profiler = self._profilers.setdefault(key, cProfile.Profile())
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+        else:
+            # A single sampler thread is kept for the whole run and only relabelled per phase:
+            if not self._sampler.running():
+                self._sampler.start()
+            self._sampler.thread_id = threading.get_ident()
+            self._sampler.label = key
+            self._profilers[key] = self._sampler
+            try:
+                yield
+            finally:
+                self._sampler.label = None
+
+    @contextmanager
+    def profiling(self: Self) -> Iterator[None]:
+        try:
+            yield
+        finally:
+            if self._sampler.running():
+                self._sampler.stop()
+
+    def reports(self: Self, framework: str) -> Dict[str, Dict[str, Any]]:
+        return {
+            phase: self._cprofile_report(profiler) if self.mode == 'cprofile' else profiler.report((profiled_framework, phase), top=self.top)
+            for (profiled_framework, phase), profiler in self._profilers.items()
+            if profiled_framework == framework
+        }
+
+    def _cprofile_report(self: Self, profiler: cProfile.Profile) -> Dict[str, Any]:
+        stats: Dict[FunctionKey, tuple] = pstats.Stats(profiler).stats
+        # The profiler's own disable() call is recorded as well; it is not part of the phase.
+        stats = {key: value for key, value in stats.items() if "_lsprof.Profiler" not in key[2]}
+
+        top_functions = [
+            {
+                'function': frame_label(*key),
+                'calls': calls,
+                'self_time': self_time,
+                'cumulative_time': cumulative_time,
+            }
+            for key, (_, calls, self_time, cumulative_time, _) in sorted(stats.items(), key=lambda item: -item[1][2])[:self.top]
+        ]
+
+        return {
+            'profiler': 'cprofile',
+            'total_time': sum(value[2] for value in stats.values()),
+            'top_functions': top_functions,
+            'collapsed': self._collapse(stats),
+        }
+
+    def _collapse(self: Self, stats: Dict[FunctionKey, tuple]) -> str:
+        # cProfile only records caller -> callee edges, so full stacks are rebuilt
+        # by walking the call graph from the roots and splitting each function's
+        # time between its callers proportionally to the edge's cumulative time.
+        callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+        for callee, (_, _, _, _, callers) in stats.items():
+            for caller, (_, _, _, edge_cumulative) in callers.items():
+                if caller in stats:
+                    callees.setdefault(caller, []).append((callee, edge_cumulative))
+
+        roots = [key for key, value in stats.items() if not any(caller in stats for caller in value[4])]
+        lines: Counter = Counter()
+
+        def walk(key: FunctionKey, path: List[FunctionKey], scale: float) -> None:
+            _, _, self_time, cumulative_time, _ = stats[key]
+            path = path + [key]
+            weight = round(self_time * scale * 1e6)
+            if weight:
+                lines[';'.join(frame_label(*frame) for frame in path)] += weight
+            if len(path) >= self.MAX_STACK_DEPTH:
+                return
+            for callee, edge_cumulative in callees.get(key, []):
+                callee_cumulative = stats[callee][3]
+                if callee in path or not callee_cumulative:
+                    continue
+                walk(callee, path, scale * edge_cumulative / callee_cumulative)
+
+        for root in roots:
+            walk(root, [], 1.0)
+
+        # Weights are microseconds of self time.
+        return '\n'.join(f"{stack} {weight}" for stack, weight in lines.most_common())
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class RunOptions(BaseModel):
+    # Query parameters shared by /run and /run-parallel, declared once and passed around as one object.
+    batch_size: int = Field(default=1_000, ge=1, le=100_000, description="Number of objects to benchmark")
+    iterations: int = Field(default=10, ge=1, le=20, description="Number of iterations for averaging")
+    distributions: bool = Field(default=False, description="Return per-record histogram, ECDF and downsampled series per framework and phase (times every record unless sample_every is set), plus per-iteration totals")
+    histogram_bins: int = Field(default=50, ge=1, le=500, description="Number of histogram bins per distribution")
+    max_points: int = Field(default=1_000, ge=10, le=10_000, description="Maximum points per ECDF and downsampled series")
+    sample_every: int = Field(default=0, ge=0, le=100_000, description="Time every k-th record individually for p50/p90/p99/p999 (0 disables)")
+    gc_mode: str = Field(default='enabled', pattern="^(enabled|disabled|collect)$", description="GC policy: leave enabled, disable during the run, or collect before every phase")
+    cpu: Optional[int] = Field(default=None, ge=0, description="Pin the process to this CPU via os.sched_setaffinity")
+    shuffle: bool = Field(default=False, description="Randomize the framework order on every iteration")
+    seed: Optional[int] = Field(default=None, description="Seed for the framework order randomization")
+    subprocess: bool = Field(default=False, description="Run each framework in a fresh subprocess")
+    profile: bool = Field(default=False, description="Profile every framework/phase and return top functions and collapsed stacks")
+    profiler: str = Field(default='cprofile', pattern="^(cprofile|sampling)$", description="Deterministic cProfile or the stdlib sampling profiler")
+    profile_top: int = Field(default=20, ge=1, le=200, description="Number of top functions reported per phase")
+    trace_allocations: bool = Field(default=False, description="Take tracemalloc snapshots around every phase and report allocation counts, sizes, peak and top sites")
+    allocation_top: int = Field(default=10, ge=1, le=100, description="Number of top allocation sites (file:line) reported per phase")
+    adaptive: bool = Field(default=False, description="Ignore `iterations`: run each framework until every phase's 95% CI half-width is within `target_precision` of its mean")
+    target_precision: float = Field(default=0.02, gt=0, lt=1, description="Relative CI half-width at which a framework stops (0.02 = ±2%)")
+    time_budget: float = Field(default=60.0, gt=0, le=3_600, description="Seconds after which adaptive runs stop whether converged or not")
+    min_iterations: int = Field(default=3, ge=2, le=100, description="Iterations every framework runs before the stopping rule applies")
+    max_iterations: int = Field(default=1_000, ge=2, le=100_000, description="Iterations after which a framework stops without converging")
+    recalibrate: bool = Field(default=False, description="Re-measure the calibration unit instead of reusing this process's cached one")
@@ -0,0 +1,87 @@
+import json
+import struct
+from typing import Self, Any, List, Dict, Iterator
+
+import msgspec
+
+from utils.data_generator import generate_users_batch
+
+
+LENGTH_PREFIX = struct.Struct('>I')
+MAX_RECORD_BYTES = 16 * 1024 * 1024
+
+
+class NdjsonSplitter:
+
+    def __init__(self: Self) -> None:
+        self._tail = b''
+
+    def feed(self: Self, chunk: bytes) -> List[bytes]:
+        # A record may straddle chunks: everything after the last newline waits for the next one.
+        lines = (self._tail + chunk).split(b'\n')
+        self._tail = lines.pop()
+        if len(self._tail) > MAX_RECORD_BYTES:
+            raise ValueError(f"NDJSON record exceeds {MAX_RECORD_BYTES} bytes")
+        return [line for line in lines if line]
+
+    def close(self: Self) -> List[bytes]:
+        tail, self._tail = self._tail, b''
+        return [tail] if tail.strip() else []
+
+
+class LengthPrefixedSplitter:
+
+    def __init__(self: Self) -> None:
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def feed(self: Self, chunk: bytes) -> List[bytes]:
+        self._buffer += chunk
+        records = []
+        while len(self._buffer) - self._offset >= LENGTH_PREFIX.size:
+            (length,) = LENGTH_PREFIX.unpack_from(self._buffer, self._offset)
+            if length > MAX_RECORD_BYTES:
+                raise ValueError(f"Length-prefixed record of {length} bytes exceeds {MAX_RECORD_BYTES}")
+            start = self._offset + LENGTH_PREFIX.size
+            if len(self._buffer) - start < length:
+                break
+            records.append(bytes(self._buffer[start:start + length]))
+            self._offset = start + length
+        # Drop consumed bytes once per chunk rather than once per record:
+        del self._buffer[:self._offset]
+        self._offset = 0
+        return records
+
+    def close(self: Self) -> List[bytes]:
+        if self._buffer:
+            raise ValueError(f"Upload ended inside a length-prefixed record ({len(self._buffer)} bytes left)")
+        return []
+
+
+SPLITTERS = {
+    'ndjson': NdjsonSplitter,
+    'msgpack': LengthPrefixedSplitter,
+}
+
+
+def frame_record(payload: bytes, format: str) -> bytes:
+    if format == 'ndjson':
+        return payload + b'\n'
+    return LENGTH_PREFIX.pack(len(payload)) + payload
+
+def encode_record(record: Dict[str, Any], format: str) -> bytes:
+    if format == 'ndjson':
+        return frame_record(json.dumps(record).encode(), format)
+    return frame_record(msgspec.msgpack.encode(record), format)
+
+def iter_payload(records: int, format: str, chunk_size: int = 64 * 1024, generate_batch: int = 1_000) -> Iterator[bytes]:
+    # Generated and framed lazily, so the client's memory does not grow with the upload size.
+    pending = bytearray()
+    for start in range(0, records, generate_batch):
+        for record in generate_users_batch(batch_size=min(generate_batch, records - start), start_id=start + 1):
+            pending += encode_record(record, format)
+        while len(pending) >= chunk_size:
+            yield bytes(pending[:chunk_size])
+            del pending[:chunk_size]
+    if pending:
+        yield bytes(pending)
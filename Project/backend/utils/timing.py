@@ -0,0 +1,138 @@
+import time
+import functools
+import itertools
+import statistics
+from dataclasses import dataclass, asdict
+from typing import Callable, Any, TypeVar, Tuple, List, Dict, Optional
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TimingSamples:
+    loops: int
+    samples_ns: List[float]
+    loop_overhead_ns: float
+    clock_overhead_ns: float
+
+    @property
+    def best_ns(self) -> float:
+        return min(self.samples_ns)
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        return statistics.fmean(self.samples_ns)
+
+    @property
+    def stdev_ns(self) -> float:
+        return statistics.stdev(self.samples_ns) if len(self.samples_ns) > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            'best_ns': self.best_ns,
+            'median_ns': self.median_ns,
+            'mean_ns': self.mean_ns,
+            'stdev_ns': self.stdev_ns,
+        }
+
+
+def _loop_ns(func: Callable[..., Any], args: tuple, kwargs: dict, loops: int) -> int:
+    clock = time.perf_counter_ns
+    iterator = itertools.repeat(None, loops)
+    # An empty **kwargs still costs a dict per call, which would be billed to func:
+    if kwargs:
+        start = clock()
+        for _ in iterator:
+            func(*args, **kwargs)
+        return clock() - start
+    start = clock()
+    for _ in iterator:
+        func(*args)
+    return clock() - start
+
+@functools.lru_cache(maxsize=1)
+def calibrate_clock(rounds: int = 10_000) -> float:
+    # Cost of one back-to-back perf_counter_ns() pair, best of many:
+    clock = time.perf_counter_ns
+    return float(min(-clock() + clock() for _ in range(rounds)))
+
+def calibrate_loop(loops: int = 100_000, repeat: int = 5) -> float:
+    # Cost of one empty iteration of the timing loop. The call itself is part of what is
+    # measured, so unlike a no-op calibration this never eats into sub-µs results.
+    clock = time.perf_counter_ns
+    timings = []
+    for _ in range(repeat):
+        iterator = itertools.repeat(None, loops)
+        start = clock()
+        for _ in iterator:
+            pass
+        timings.append(clock() - start)
+    return min(timings) / loops
+
+def autorange(func: Callable[..., Any], *args: Any, min_duration: float = 0.2, **kwargs: Any) -> int:
+    # Same progression as timeit.Timer.autorange: 1, 2, 5, 10, 20, 50, ...
+    min_duration_ns = min_duration * 1e9
+    base = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            loops = base * multiplier
+            if _loop_ns(func, args, kwargs, loops) >= min_duration_ns:
+                return loops
+        base *= 10
+
+def measure(
+        func: Callable[..., Any],
+        *args: Any,
+        repeat: int = 5,
+        min_duration: float = 0.2,
+        **kwargs: Any,
+) -> TimingSamples:
+    clock_overhead_ns = calibrate_clock()
+    loop_overhead_ns = calibrate_loop()
+    loops = autorange(func, *args, min_duration=min_duration, **kwargs)
+
+    samples_ns = []
+    for _ in range(repeat):
+        elapsed_ns = _loop_ns(func, args, kwargs, loops) - clock_overhead_ns
+        samples_ns.append(max(elapsed_ns / loops - loop_overhead_ns, 0.0))
+
+    return TimingSamples(
+        loops=loops,
+        samples_ns=samples_ns,
+        loop_overhead_ns=loop_overhead_ns,
+        clock_overhead_ns=clock_overhead_ns,
+    )
+
+def timed(func: Callable[..., T]) -> Callable[..., Tuple[T, float]]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Tuple[T, float]:
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter_ns() - start - calibrate_clock()
+        return result, max(elapsed, 0.0) / 1e9
+    return wrapper
+
+def repeat_times(
+        func: Callable[..., Any],
+        *args: Any,
+        iterations: int,
+        warmup: int = 1,
+        **kwargs: Any,
+) -> List[float]:
+    # Untimed calls first, so lazily built validators, codec caches and cold
+    # branches are not billed to the first sample.
+    for _ in range(warmup):
+        func(*args, **kwargs)
+
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return times
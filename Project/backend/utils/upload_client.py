@@ -0,0 +1,44 @@
+import json
+import time
+import argparse
+from typing import Any, Dict
+
+import httpx
+
+from utils.streaming import SPLITTERS, iter_payload
+
+
+# Run as `python -m utils.upload_client --records 1000000` from the backend directory.
+def upload(url: str, framework: str, format: str, mode: str, records: int, chunk_size: int, timeout: float) -> Dict[str, Any]:
+    start_time = time.perf_counter()
+    response = httpx.post(
+        f"{url.rstrip('/')}/api/workloads/ingest",
+        params={'framework': framework, 'format': format, 'mode': mode},
+        content=iter_payload(records=records, format=format, chunk_size=chunk_size),
+        headers={'Content-Type': 'application/x-ndjson' if format == 'ndjson' else 'application/octet-stream'},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return {**response.json(), 'client_elapsed': time.perf_counter() - start_time}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Upload generated users to /api/workloads/ingest, streamed and buffered")
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--framework', choices=('dataclass', 'pydantic', 'msgspec'), default='msgspec')
+    parser.add_argument('--format', choices=tuple(SPLITTERS), default='ndjson')
+    parser.add_argument('--mode', choices=('stream', 'buffered', 'both'), default='both')
+    parser.add_argument('--records', type=int, default=100_000)
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024)
+    parser.add_argument('--timeout', type=float, default=600.0)
+    arguments = parser.parse_args()
+
+    modes = ('stream', 'buffered') if arguments.mode == 'both' else (arguments.mode,)
+    results = {
+        mode: upload(arguments.url, arguments.framework, arguments.format, mode, arguments.records, arguments.chunk_size, arguments.timeout)
+        for mode in modes
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,74 @@
 import json
+import time
 import requests
 import streamlit as st
-from typing import Self, List, Dict, Any, Optional 
+from typing import Self, List, Dict, Any, Optional, Tuple
 
 
 class BenchmarkUI:
 
+    CACHE_KEY = 'results_cache'
+
     def __init__(self: Self, api_url: str) -> None:
         self.api_url = api_url.rstrip('/')
+        if self.CACHE_KEY not in st.session_state:
+            st.session_state[self.CACHE_KEY] = {}
+
+    @staticmethod
+    def cache_key(
+        endpoint: str,
+        batch_size: int,
+        iterations: int,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, int, int, str]:
+        return (endpoint, batch_size, iterations, json.dumps(options or {}, sort_keys=True))
+
+    def get_cached(self: Self, key: Tuple[str, int, int, str]) -> Optional[Dict[str, Any]]:
+        entry = st.session_state[self.CACHE_KEY].get(key)
+        return entry['results'] if entry else None
+
+    def store_cached(self: Self, key: Tuple[str, int, int, str], results: Dict[str, Any]) -> None:
+        endpoint, batch_size, iterations, options = key
+        label = f"{endpoint}: {batch_size} objects × {iterations} iterations"
+        if options != '{}':
+            label += f" {options}"
+        environment: dict = results.get('environment', {})
+        if environment:
+            calibration: dict = environment.get('calibration') or {}
+            label += f" on {environment.get('hostname', '?')}"
+            if calibration:
+                label += f" (unit {calibration['unit_seconds'] * 1e3:.2f} ms)"
+        st.session_state[self.CACHE_KEY][key] = {
+            'label': f"{label} @ {time.strftime('%H:%M:%S')}",
+            'results': results,
+        }
+
+    def cached_runs(self: Self) -> Dict[Tuple[str, int, int, str], Dict[str, Any]]:
+        return st.session_state[self.CACHE_KEY]
+
+    def clear_cache(self: Self) -> None:
+        st.session_state[self.CACHE_KEY] = {}
 
     def run_benchmark(
         self: Self,
         batch_size: int,
         iterations: int,
-        timeout: int = 240
+        timeout: int = 240,
+        options: Optional[Dict[str, Any]] = None,
+        force: bool = False,
     ) -> Optional[Dict[str, Any]]:
+        key = self.cache_key('run', batch_size, iterations, options)
+        if not force and (cached := self.get_cached(key)) is not None:
+            st.info(f"♻️ Using cached results for {batch_size} objects × {iterations} iterations. Press Re-run to refresh.")
+            return cached
+
         try:
             st.info(f"🚀 Starting benchmark: {batch_size} objects × {iterations} iterations...")
 
             response = requests.post(
                 url=f"{self.api_url}/api/benchmark/run",
                 params={
+                    **(options or {}),
                     'batch_size': batch_size,
                     'iterations': iterations
                 },
@@ -28,7 +76,9 @@ class BenchmarkUI:
             )
 
             if response.status_code == 200:
-                return response.json()
+                results = response.json()
+                self.store_cached(key, results)
+                return results
             else:
                 response_dict: dict = response.json()
                 error_detail = response_dict.get('detail', 'Unknown error') if response.content else 'No response from server'
@@ -49,8 +99,14 @@ class BenchmarkUI:
         self: Self,
         batch_size: int,
         iterations: int,
-        timeout: int = 300
+        timeout: int = 300,
+        options: Optional[Dict[str, Any]] = None,
+        force: bool = False,
     ) -> Optional[Dict[str, Any]]:
+        key = self.cache_key('run-parallel', batch_size, iterations, options)
+        if not force and (cached := self.get_cached(key)) is not None:
+            st.info(f"♻️ Using cached parallel results for {batch_size} objects × {iterations} iterations. Press Re-run to refresh.")
+            return cached
 
         try:
             st.info(f"🚀 Starting parallel benchmark: {batch_size} objects × {iterations} iterations...")
@@ -58,6 +114,7 @@ class BenchmarkUI:
             response = requests.post(
                 url=f"{self.api_url}/api/benchmark/run-parallel",
                 params={
+                    **(options or {}),
                     'batch_size': batch_size,
                     'iterations': iterations
                 },
@@ -65,7 +122,9 @@ class BenchmarkUI:
             )
 
             if response.status_code == 200:
-                return response.json()
+                results = response.json()
+                self.store_cached(key, results)
+                return results
             else:
                 response_dict: dict = response.json()
                 error_detail = response_dict.get('detail', 'Unknown error') if response.content else 'No response from server'
@@ -82,14 +141,21 @@ class BenchmarkUI:
             st.error(f"💥 Unexpected error: {str(e)}")
             return None
         
-    def run_quick_benchmark(self: Self, timeout: int = 60) -> Optional[Dict[str, Any]]:
+    def run_quick_benchmark(self: Self, timeout: int = 60, force: bool = False) -> Optional[Dict[str, Any]]:
+        key = self.cache_key('quick', 100, 5)
+        if not force and (cached := self.get_cached(key)) is not None:
+            st.info("♻️ Using cached quick benchmark results. Press Re-run to refresh.")
+            return cached
+
         try:
             st.info("⚡ Running quick benchmark with 100 objects and 5 iterations...")
             
             response = requests.get(f"{self.api_url}/api/benchmark/quick", timeout=timeout)
             
             if response.status_code == 200:
-                return response.json()
+                results = response.json()
+                self.store_cached(key, results)
+                return results
             else:
                 response_dict: dict = response.json()
                 error_detail = response_dict.get('detail', 'Unknown error') if response.content else 'No response from server'
@@ -106,6 +172,28 @@ class BenchmarkUI:
             st.error(f"💥 Unexpected error: {str(e)}")
             return None
         
+    def run_matrix(self: Self, params: Dict[str, Any], timeout: int = 600) -> Optional[Dict[str, Any]]:
+        try:
+            response = requests.post(f"{self.api_url}/api/benchmark/matrix", params=params, timeout=timeout)
+
+            if response.status_code == 200:
+                return response.json()
+            else:
+                response_dict: dict = response.json()
+                error_detail = response_dict.get('detail', 'Unknown error') if response.content else 'No response from server'
+                st.error(f"❌ Matrix benchmark failed: {error_detail}")
+                return None
+
+        except requests.exceptions.Timeout:
+            st.error("⏰ Matrix benchmark timed out. Try fewer cells or iterations.")
+            return None
+        except requests.exceptions.ConnectionError:
+            st.error("🔌 Connection failed. Please check if the backend is running.")
+            return None
+        except Exception as e:
+            st.error(f"💥 Unexpected error: {str(e)}")
+            return None
+
     def get_frameworks(self: Self, timeout: int = 30) -> Optional[List[str]]:
         try:
             response = requests.get(f"{self.api_url}/api/benchmark/frameworks", timeout=timeout)
@@ -1,17 +1,48 @@
 import json
+import hashlib
 import requests
 import pandas as pd
 import streamlit as st
-from typing import Self, List, Dict, Any, Optional
+from typing import Self, List, Dict, Any, Optional, Callable, Tuple
 
 import plotly.express as px
 import plotly.graph_objects as go
 
 
 class ResultsViz:
+
+    FIGURE_CACHE_KEY = 'figure_cache'
+    FIGURE_CACHE_SIZE = 64
+    DIFF_METRICS = {
+        'avg_instantiation_time': ('Instantiation (ms)', 1000),
+        'avg_serialization_time': ('Serialization (ms)', 1000),
+        'avg_deserialization_time': ('Deserialization (ms)', 1000),
+        'avg_memory_usage': ('Memory (KB)', 1 / 1024),
+    }
+    # Times divided by the run's calibration round, comparable across machines:
+    NORMALIZED_DIFF_METRICS = {
+        'avg_instantiation_time': ('Instantiation (cu)', 1),
+        'avg_serialization_time': ('Serialization (cu)', 1),
+        'avg_deserialization_time': ('Deserialization (cu)', 1),
+        'avg_memory_usage': ('Memory (KB)', 1 / 1024),
+    }
     
     def __init__(self: Self) -> None:
-        pass
+        if self.FIGURE_CACHE_KEY not in st.session_state:
+            st.session_state[self.FIGURE_CACHE_KEY] = {}
+
+    @staticmethod
+    def result_hash(results: Dict[str, Any]) -> str:
+        return hashlib.sha1(json.dumps(results, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _memoized_figure(self: Self, results_hash: str, name: str, builder: Callable[[], go.Figure]) -> go.Figure:
+        cache: dict = st.session_state[self.FIGURE_CACHE_KEY]
+        key = (results_hash, name)
+        if key not in cache:
+            if len(cache) >= self.FIGURE_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = builder()
+        return cache[key]
 
     def display_results(self: Self, results: Dict[str, Any], key_prefix: str = "") -> None:
 
@@ -27,15 +58,51 @@ class ResultsViz:
             st.metric("Objects", value=params.get('batch_size', 'N/A'))
         with col2:
             st.metric("Iterations", value=params.get('iterations', 'N/A'))
+
+        isolation: dict = params.get('isolation', {})
+        if isolation:
+            st.caption(
+                f"Isolation: GC {isolation.get('gc_mode', 'enabled')} · "
+                f"CPU {isolation.get('cpu') if isolation.get('cpu') is not None else 'any'} · "
+                f"order {'randomized' if isolation.get('shuffle') else 'fixed'} · "
+                f"{'subprocess per framework' if isolation.get('subprocess') else 'single process'}"
+            )
+        adaptive: dict = params.get('adaptive') or {}
+        if adaptive:
+            st.caption(
+                f"Adaptive: target ±{adaptive.get('target_precision', 0.0):.1%} · "
+                f"budget {adaptive.get('time_budget', 0.0):.0f}s · "
+                f"took {adaptive.get('elapsed', 0.0):.1f}s · "
+                + ", ".join(f"{framework} {count} iterations" for framework, count in adaptive.get('iterations', {}).items())
+            )
+        environment: dict = results.get('environment', {})
+        if environment:
+            st.caption(self.environment_caption(environment))
         st.markdown("---")
 
         self._create_performance_charts(results=results.get('results', {}), key_prefix=key_prefix)
 
+        if any('adaptive' in data for data in results.get('results', {}).values()):
+            self._display_adaptive(results=results['results'])
+
+        if any('latency' in data for data in results.get('results', {}).values()):
+            self._display_latency(results=results['results'])
+
+        if any('profile' in data for data in results.get('results', {}).values()):
+            self._display_profiles(results=results['results'], key_prefix=key_prefix)
+
+        if any('allocations' in data for data in results.get('results', {}).values()):
+            self._display_allocations(results=results['results'], key_prefix=key_prefix)
+
+        if results.get('distributions'):
+            self._create_distribution_charts(distributions=results['distributions'], key_prefix=key_prefix)
+
         self._display_summary(summary=results.get('summary', {}))
 
     def _create_performance_charts(self: Self, results: Dict[str, Any], key_prefix: str = "") -> None:
 
         try:
+            results_hash = self.result_hash(results)
             frameworks = list(results.keys())
             serialization_times = [results[fw]['avg_serialization_time']*1000 for fw in frameworks]  # ms
             deserialization_times = [results[fw]['avg_deserialization_time']*1000 for fw in frameworks]  # ms
@@ -44,38 +111,29 @@ class ResultsViz:
             col1, col2= st.columns(2)
 
             with col1:
-                fig_ser = px.bar(
-                    x=frameworks,
-                    y=serialization_times,
-                    color=serialization_times,
-                    color_continuous_scale='RdYlBu_r',
+                fig_ser = self._memoized_figure(results_hash, 'serialization', lambda: self._bar_figure(
+                    frameworks=frameworks,
+                    values=serialization_times,
                     title='Average Serialization Time by Framework',
-                    labels={'x': 'Framework', 'y': 'Avg Serialization Time (ms)'},
-                )
-                fig_ser.update_layout(showlegend=False, height=400)
+                    y_label='Avg Serialization Time (ms)',
+                ))
                 st.plotly_chart(fig_ser, use_container_width=True, key=f"{key_prefix}serialization_chart")
 
             with col2:
-                fig_deser = px.bar(
-                    x=frameworks,
-                    y=deserialization_times,
-                    color=deserialization_times,
-                    color_continuous_scale='RdYlBu_r',
+                fig_deser = self._memoized_figure(results_hash, 'deserialization', lambda: self._bar_figure(
+                    frameworks=frameworks,
+                    values=deserialization_times,
                     title='Average Deserialization Time by Framework',
-                    labels={'x': 'Framework', 'y': 'Avg Deserialization Time (ms)'},
-                )
-                fig_deser.update_layout(showlegend=False, height=400)
+                    y_label='Avg Deserialization Time (ms)',
+                ))
                 st.plotly_chart(fig_deser, use_container_width=True, key=f"{key_prefix}deserialization_chart")
 
-            fig_mem = px.bar(
-                x=frameworks,
-                y=memory_usages,
-                color=memory_usages,
-                color_continuous_scale='RdYlBu_r',
+            fig_mem = self._memoized_figure(results_hash, 'memory', lambda: self._bar_figure(
+                frameworks=frameworks,
+                values=memory_usages,
                 title='Average Memory Usage by Framework',
-                labels={'x': 'Framework', 'y': 'Avg Memory Usage (KB)'},
-            )
-            fig_mem.update_layout(showlegend=False, height=400)
+                y_label='Avg Memory Usage (KB)',
+            ))
             st.plotly_chart(fig_mem, use_container_width=True, key=f"{key_prefix}memory_chart")
 
             self._create_radar_chart(
@@ -83,6 +141,7 @@ class ResultsViz:
                 memory_usages=memory_usages,
                 serialization_times=serialization_times,
                 deserialization_times=deserialization_times,
+                results_hash=results_hash,
                 key_prefix=key_prefix,
             )
 
@@ -98,51 +157,301 @@ class ResultsViz:
                 with col3:
                     st.metric(f"{fw} - Memory (KB)", f"{data['avg_memory_usage']/1024:.1f}")
 
+    @staticmethod
+    def _bar_figure(frameworks: List[str], values: List[float], title: str, y_label: str) -> go.Figure:
+        fig = px.bar(
+            x=frameworks,
+            y=values,
+            color=values,
+            color_continuous_scale='RdYlBu_r',
+            title=title,
+            labels={'x': 'Framework', 'y': y_label},
+        )
+        fig.update_layout(showlegend=False, height=400)
+        return fig
+
     def _create_radar_chart(
         self: Self,
         frameworks: List[str],
         serialization_times: List[float],
         deserialization_times: List[float],
         memory_usages: List[float],
+        results_hash: str = "",
         key_prefix: str = "",
     ) -> None:
         
         try:
-            # Normalize data for radar chart:
-            max_ser = max(serialization_times) if serialization_times else 1
-            max_deser = max(deserialization_times) if deserialization_times else 1
-            max_mem = max(memory_usages) if memory_usages else 1
-
-            fig = go.Figure()
-
-            for i, framework in enumerate(frameworks):
-                fig.add_trace(go.Scatterpolar(
-                    r=[
-                        (max_ser - serialization_times[i]) / max_ser * 100,
-                        (max_deser - deserialization_times[i]) / max_deser * 100,
-                        (max_mem - memory_usages[i]) / max_mem * 100 if memory_usages[i] > 0 else 100,
-                    ],
-                    theta=['Serialization Time', 'Deserialization Time', 'Memory Usage'],
-                    fill='toself',
-                    name=framework.title(),
-                ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True, 
-                        range=[0, 100],
-                    )
-                ),
-                height=400,
-                showlegend=True,
-                title="🎯 Overall Framework Performance Comparison (Higher is Better)",
-            )
+            fig = self._memoized_figure(results_hash, 'radar', lambda: self._radar_figure(
+                frameworks=frameworks,
+                memory_usages=memory_usages,
+                serialization_times=serialization_times,
+                deserialization_times=deserialization_times,
+            ))
             st.plotly_chart(fig, use_container_width=True, key=f"{key_prefix}radar_chart")
 
         except Exception as e:
             st.warning(f"Could not create radar chart: {str(e)}")
 
+    @staticmethod
+    def _radar_figure(
+        frameworks: List[str],
+        serialization_times: List[float],
+        deserialization_times: List[float],
+        memory_usages: List[float],
+    ) -> go.Figure:
+
+        # Normalize data for radar chart:
+        max_ser = max(serialization_times) if serialization_times else 1
+        max_deser = max(deserialization_times) if deserialization_times else 1
+        max_mem = max(memory_usages) if memory_usages else 1
+
+        fig = go.Figure()
+
+        for i, framework in enumerate(frameworks):
+            fig.add_trace(go.Scatterpolar(
+                r=[
+                    (max_ser - serialization_times[i]) / max_ser * 100,
+                    (max_deser - deserialization_times[i]) / max_deser * 100,
+                    (max_mem - memory_usages[i]) / max_mem * 100 if memory_usages[i] > 0 else 100,
+                ],
+                theta=['Serialization Time', 'Deserialization Time', 'Memory Usage'],
+                fill='toself',
+                name=framework.title(),
+            ))
+        
+        fig.update_layout(
+            polar=dict(
+                radialaxis=dict(
+                    visible=True, 
+                    range=[0, 100],
+                )
+            ),
+            height=400,
+            showlegend=True,
+            title="🎯 Overall Framework Performance Comparison (Higher is Better)",
+        )
+        return fig
+
+    def display_matrix(self: Self, results: Dict[str, Any]) -> None:
+
+        timing: dict = results.get('timing', {})
+        st.caption(
+            f"{results.get('parameters', {}).get('cells', 0)} cells in {timing.get('elapsed', 0.0):.1f}s · "
+            f"{timing.get('datasets', 0)} datasets prepared in {timing.get('setup_time', 0.0):.1f}s · "
+            f"{timing.get('measured_time', 0.0):.1f}s measured"
+        )
+        cells = pd.DataFrame(results.get('cells', []))
+        if cells.empty:
+            st.info("The matrix returned no cells.")
+            return
+
+        dimensions = ['framework', 'shape', 'batch_size', 'operation']
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            rows = st.multiselect("Rows", options=dimensions, default=['shape', 'operation'], key="matrix_rows")
+        with col2:
+            columns = st.multiselect("Columns", options=[dimension for dimension in dimensions if dimension not in rows], default=['framework'], key="matrix_columns")
+        with col3:
+            value = st.selectbox("Value", options=['ns_per_record', 'median_seconds', 'mean_seconds', 'stdev_seconds'], key="matrix_value")
+
+        if rows and columns:
+            st.dataframe(cells.pivot_table(index=rows, columns=columns, values=value, aggfunc='mean'), use_container_width=True)
+        else:
+            st.dataframe(cells, use_container_width=True)
+
+        samples = pd.DataFrame(results.get('samples', []))
+        st.download_button(
+            label="⬇️ Samples (long format CSV)",
+            data=(samples if not samples.empty else cells).to_csv(index=False),
+            file_name="benchmark_matrix.csv",
+            mime="text/csv",
+            key="matrix_csv",
+        )
+
+    def _display_adaptive(self: Self, results: Dict[str, Any]) -> None:
+
+        st.subheader("🎯 Iterations Needed")
+        rows = []
+        for framework, data in results.items():
+            adaptive: dict = data.get('adaptive', {})
+            for phase, state in adaptive.get('phases', {}).items():
+                half_width = state.get('relative_half_width')
+                rows.append({
+                    'Framework': framework,
+                    'Phase': phase,
+                    'Iterations': adaptive.get('iterations', 0),
+                    'Stopped by': adaptive.get('stop_reason'),
+                    'CI half-width (%)': half_width * 100 if half_width is not None else None,
+                    'Within target at': state.get('converged_at'),
+                })
+        st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+    def _display_latency(self: Self, results: Dict[str, Any]) -> None:
+
+        st.subheader("⏱️ Per-Record Latency (sampled)")
+        rows = []
+        for framework, data in results.items():
+            for phase, latency in data.get('latency', {}).items():
+                rows.append({
+                    'Framework': framework,
+                    'Phase': phase,
+                    'Samples': latency.get('samples', 0),
+                    **{
+                        f"{name} (µs)": latency.get(f'{name}_ns', 0.0) / 1000
+                        for name in ('p50', 'p90', 'p99', 'p999')
+                    },
+                })
+        st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+    def _display_profiles(self: Self, results: Dict[str, Any], key_prefix: str = "") -> None:
+
+        st.subheader("🔥 Profiles per Phase")
+        for framework, data in results.items():
+            profiles: dict = data.get('profile', {})
+            if not profiles:
+                continue
+            with st.expander(f"{framework.title()} ({next(iter(profiles.values())).get('profiler', '')})"):
+                phase = st.selectbox("Phase", options=list(profiles), key=f"{key_prefix}{framework}_profile_phase")
+                report: dict = profiles[phase]
+                if report.get('insufficient_samples'):
+                    st.warning(f"Only {report.get('samples', 0)} samples for this phase: raise the batch size or iterations before trusting the ranking")
+                st.dataframe(pd.DataFrame(report.get('top_functions', [])), use_container_width=True)
+                st.download_button(
+                    label="⬇️ Collapsed stacks (flamegraph input)",
+                    data=report.get('collapsed', ''),
+                    file_name=f"{framework}_{phase}.collapsed.txt",
+                    mime="text/plain",
+                    key=f"{key_prefix}{framework}_{phase}_collapsed",
+                )
+
+    def _display_allocations(self: Self, results: Dict[str, Any], key_prefix: str = "") -> None:
+
+        st.subheader("🧠 Allocations per Phase")
+        rows = []
+        for framework, data in results.items():
+            for phase, report in data.get('allocations', {}).items():
+                rows.append({
+                    'Framework': framework,
+                    'Phase': phase,
+                    'Retained blocks / object': report.get('retained_blocks_per_object', 0.0),
+                    'Retained bytes / object': report.get('retained_bytes_per_object', 0.0),
+                    'Peak bytes / object': report.get('peak_bytes_per_object', 0.0),
+                    'Transient peak (KB)': report.get('transient_peak_bytes', 0.0) / 1024,
+                })
+        st.dataframe(pd.DataFrame(rows), use_container_width=True)
+        st.caption("Retained: memory still held when the phase ends (its outputs). Temporaries freed inside the phase only count towards the peak and have no sites.")
+
+        for framework, data in results.items():
+            allocations: dict = data.get('allocations', {})
+            if not allocations:
+                continue
+            with st.expander(f"Top retained allocation sites: {framework.title()}"):
+                phase = st.selectbox("Phase", options=list(allocations), key=f"{key_prefix}{framework}_allocation_phase")
+                st.dataframe(pd.DataFrame(allocations[phase].get('top_retained_sites', [])), use_container_width=True)
+
+    def _create_distribution_charts(self: Self, distributions: Dict[str, Any], key_prefix: str = "") -> None:
+
+        try:
+            st.subheader("📉 Timing Distributions")
+            phases = sorted({phase for phases in distributions.values() for phase in phases})
+            phase = st.selectbox("Phase", options=phases, key=f"{key_prefix}distribution_phase")
+            results_hash = self.result_hash(distributions)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig_hist = self._memoized_figure(results_hash, f'histogram:{phase}', lambda: self._histogram_figure(distributions, phase))
+                st.plotly_chart(fig_hist, use_container_width=True, key=f"{key_prefix}histogram_chart")
+
+            with col2:
+                fig_ecdf = self._memoized_figure(results_hash, f'ecdf:{phase}', lambda: self._ecdf_figure(distributions, phase))
+                st.plotly_chart(fig_ecdf, use_container_width=True, key=f"{key_prefix}ecdf_chart")
+
+            fig_series = self._memoized_figure(results_hash, f'series:{phase}', lambda: self._series_figure(distributions, phase))
+            st.plotly_chart(fig_series, use_container_width=True, key=f"{key_prefix}series_chart")
+
+            fig_iterations = self._memoized_figure(results_hash, f'iterations:{phase}', lambda: self._series_figure(distributions, phase, iterations=True))
+            st.plotly_chart(fig_iterations, use_container_width=True, key=f"{key_prefix}iterations_chart")
+
+        except Exception as e:
+            st.warning(f"Could not create distribution charts: {str(e)}")
+
+    @staticmethod
+    def _time_scale(distributions: Dict[str, Any], phase: str) -> Tuple[float, str]:
+        # Per-record timings are microseconds, per-iteration totals milliseconds.
+        sources = {phases.get(phase, {}).get('source') for phases in distributions.values()}
+        return (1e6, 'µs') if sources == {'records'} else (1e3, 'ms')
+
+    @staticmethod
+    def _histogram_figure(distributions: Dict[str, Any], phase: str) -> go.Figure:
+        scale, unit = ResultsViz._time_scale(distributions, phase)
+        fig = go.Figure()
+        for framework, phases in distributions.items():
+            hist = phases.get(phase, {}).get('histogram', {})
+            edges, counts = hist.get('edges', []), hist.get('counts', [])
+            if not counts:
+                continue
+            fig.add_trace(go.Bar(
+                x=[(edges[i] + edges[i + 1]) / 2 * scale for i in range(len(counts))],
+                y=counts,
+                width=[(edges[i + 1] - edges[i]) * scale for i in range(len(counts))],
+                name=framework.title(),
+                opacity=0.6,
+            ))
+        fig.update_layout(
+            barmode='overlay',
+            height=400,
+            title=f'{phase.title()} Time Histogram',
+            xaxis_title=f'Time ({unit})',
+            yaxis_title='Count',
+        )
+        return fig
+
+    @staticmethod
+    def _ecdf_figure(distributions: Dict[str, Any], phase: str) -> go.Figure:
+        scale, unit = ResultsViz._time_scale(distributions, phase)
+        fig = go.Figure()
+        for framework, phases in distributions.items():
+            points = phases.get(phase, {}).get('ecdf', {})
+            fig.add_trace(go.Scattergl(
+                x=[x * scale for x in points.get('x', [])],
+                y=points.get('y', []),
+                mode='lines',
+                line_shape='hv',
+                name=framework.title(),
+            ))
+        fig.update_layout(
+            height=400,
+            title=f'{phase.title()} Time ECDF',
+            xaxis_title=f'Time ({unit})',
+            yaxis_title='Fraction of samples',
+        )
+        return fig
+
+    @staticmethod
+    def _series_figure(distributions: Dict[str, Any], phase: str, iterations: bool = False) -> go.Figure:
+        fig = go.Figure()
+        for framework, phases in distributions.items():
+            summary: dict = phases.get(phase, {})
+            if iterations:
+                summary = summary.get('iterations', {})
+            scale, unit = (1e6, 'µs') if summary.get('source') == 'records' else (1e3, 'ms')
+            series = summary.get('series', {})
+            fig.add_trace(go.Scattergl(
+                x=series.get('x', []),
+                y=[y * scale for y in series.get('y', [])],
+                mode='lines+markers',
+                marker=dict(size=4),
+                name=framework.title(),
+            ))
+        fig.update_layout(
+            height=400,
+            title=f'{phase.title()} Time per {"Iteration" if iterations else "Record"} (downsampled)',
+            xaxis_title='Iteration' if iterations else 'Record',
+            yaxis_title=f'Time ({unit})',
+        )
+        return fig
+
     def _display_summary(
         self: Self,
         summary: Dict[str, str]
@@ -180,4 +489,110 @@ class ResultsViz:
                 help="Framework with the lowest memory usage",
             )
 
+    def display_diff(
+        self: Self,
+        run_a: Dict[str, Any],
+        run_b: Dict[str, Any],
+        label_a: str = "Run A",
+        label_b: str = "Run B",
+        key_prefix: str = "",
+    ) -> None:
+
+        results_a: dict = run_a.get('results', {})
+        results_b: dict = run_b.get('results', {})
+        if not results_a or not results_b:
+            st.error("Both runs need results to compare.")
+            return
+
+        normalized = self._is_normalized(results_a) and self._is_normalized(results_b)
+        metrics = self.NORMALIZED_DIFF_METRICS if normalized else self.DIFF_METRICS
+        environment_a: dict = run_a.get('environment', {})
+        environment_b: dict = run_b.get('environment', {})
+        if normalized:
+            st.caption("Times are in calibration units (cu): seconds divided by each run's calibration round, so runs from different machines are comparable.")
+        elif environment_a.get('id') != environment_b.get('id'):
+            st.warning("These runs come from different environments and at least one has no calibration; raw times are not comparable.")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"**{label_a}**")
+            if environment_a:
+                st.caption(self.environment_caption(environment_a))
+            st.dataframe(self._metrics_frame(results_a, normalized), use_container_width=True)
+        with col2:
+            st.markdown(f"**{label_b}**")
+            if environment_b:
+                st.caption(self.environment_caption(environment_b))
+            st.dataframe(self._metrics_frame(results_b, normalized), use_container_width=True)
+
+        rows = []
+        for framework in [fw for fw in results_a if fw in results_b]:
+            for metric, (label, scale) in metrics.items():
+                value_a = self._metric_value(results_a[framework], metric, normalized) * scale
+                value_b = self._metric_value(results_b[framework], metric, normalized) * scale
+                rows.append({
+                    'Framework': framework,
+                    'Metric': label,
+                    'Run A': value_a,
+                    'Run B': value_b,
+                    'Change (%)': (value_b - value_a) / value_a * 100 if value_a else 0.0,
+                })
+
+        if not rows:
+            st.info("The selected runs have no frameworks in common.")
+            return
+
+        diff = pd.DataFrame(rows)
+        st.subheader("🔀 Difference (B vs A)")
+        st.dataframe(diff, use_container_width=True)
+
+        fig = self._memoized_figure(
+            f"{self.result_hash(run_a)}:{self.result_hash(run_b)}",
+            'diff',
+            lambda: self._diff_figure(diff),
+        )
+        st.plotly_chart(fig, use_container_width=True, key=f"{key_prefix}diff_chart")
+
+    def _metrics_frame(self: Self, results: Dict[str, Any], normalized: bool = False) -> pd.DataFrame:
+        metrics = self.NORMALIZED_DIFF_METRICS if normalized else self.DIFF_METRICS
+        return pd.DataFrame({
+            label: {fw: self._metric_value(data, metric, normalized) * scale for fw, data in results.items()}
+            for metric, (label, scale) in metrics.items()
+        })
+
+    @staticmethod
+    def _is_normalized(results: Dict[str, Any]) -> bool:
+        return all('normalized' in data for data in results.values())
+
+    @staticmethod
+    def _metric_value(data: Dict[str, Any], metric: str, normalized: bool) -> float:
+        if normalized and metric in data.get('normalized', {}):
+            return data['normalized'][metric]
+        return data.get(metric, 0.0)
+
+    @staticmethod
+    def environment_caption(environment: Dict[str, Any]) -> str:
+        libraries: dict = environment.get('libraries', {})
+        calibration: dict = environment.get('calibration') or {}
+        caption = (
+            f"{environment.get('hostname', '?')} · {environment.get('cpu_model') or 'unknown CPU'} "
+            f"× {environment.get('cpu_available', '?')} · Python {environment.get('python_version', '?')} · "
+            f"pydantic {libraries.get('pydantic', '?')} · msgspec {libraries.get('msgspec', '?')}"
+        )
+        if calibration:
+            caption += f" · calibration unit {calibration['unit_seconds'] * 1e3:.2f} ms"
+        return caption + f" · fingerprint {environment.get('id', '?')}"
 
+    @staticmethod
+    def _diff_figure(diff: pd.DataFrame) -> go.Figure:
+        fig = px.bar(
+            diff,
+            x='Metric',
+            y='Change (%)',
+            color='Framework',
+            barmode='group',
+            title='Relative Change per Metric (negative is faster / smaller)',
+        )
+        fig.update_layout(height=400)
+        return fig
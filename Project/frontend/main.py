@@ -18,6 +18,10 @@ if 'api_connected' not in st.session_state:
     st.session_state.api_connected = False
 if 'benchmark_running' not in st.session_state:
     st.session_state.benchmark_running = False
+if 'last_run_kind' not in st.session_state:
+    st.session_state.last_run_kind = 'run'
+if 'matrix_results' not in st.session_state:
+    st.session_state.matrix_results = None
 if 'api_url' not in st.session_state:
     # Use Docker service name if running in Docker, otherwise localhost
     import os
@@ -75,12 +79,51 @@ else:
     st.info("💡 **Troubleshooting:**\n- Check if the backend is running\n- Try refreshing the page\n- Verify the API URL is correct")
     st.stop()
 
+# Extra run options (part of the results cache key)
+run_options = {}
+if st.sidebar.checkbox("Include timing distributions", value=False, help="Server-side histograms, ECDF and downsampled series"):
+    run_options['distributions'] = True
+sample_every = st.sidebar.number_input(
+    "Per-record latency: time every k-th record",
+    min_value=0,
+    max_value=100_000,
+    value=0,
+    help="0 disables sampling; otherwise p50/p90/p99/p999 are reported per framework and phase",
+)
+if sample_every:
+    run_options['sample_every'] = int(sample_every)
+
+with st.sidebar.expander("🧪 Measurement isolation"):
+    gc_mode = st.selectbox("GC policy", options=["enabled", "disabled", "collect"], help="'collect' runs gc.collect() before every phase")
+    if gc_mode != "enabled":
+        run_options['gc_mode'] = gc_mode
+    if st.checkbox("Randomize framework order", value=False):
+        run_options['shuffle'] = True
+    if st.checkbox("Fresh subprocess per framework", value=False):
+        run_options['subprocess'] = True
+    pin_cpu = st.number_input("Pin to CPU (-1 disables)", min_value=-1, max_value=1023, value=-1)
+    if pin_cpu >= 0:
+        run_options['cpu'] = int(pin_cpu)
+
+with st.sidebar.expander("⏱️ Adaptive iterations"):
+    if st.checkbox("Stop when results settle", value=False, help="Replaces the Iterations slider: each framework runs until every phase's 95% confidence interval is within the target"):
+        run_options['adaptive'] = True
+        run_options['target_precision'] = st.slider("Target CI half-width (%)", min_value=1, max_value=20, value=2) / 100
+        run_options['time_budget'] = float(st.number_input("Time budget (s)", min_value=5, max_value=180, value=60))
+
+with st.sidebar.expander("🔥 Profiling"):
+    if st.checkbox("Profile every phase", value=False):
+        run_options['profile'] = True
+        run_options['profiler'] = st.selectbox("Profiler", options=["cprofile", "sampling"])
+    if st.checkbox("Trace allocations (tracemalloc)", value=False):
+        run_options['trace_allocations'] = True
+
 # Initialize components
 benchmark_ui = BenchmarkUI(api_url)
 results_viz = ResultsViz()
 
 # Main tabs
-tab1, tab2 = st.tabs(["🚀 Benchmark", "📈 Results Analysis"])
+tab1, tab2, tab3, tab4 = st.tabs(["🚀 Benchmark", "📈 Results Analysis", "🔀 Compare Runs", "🧮 Matrix"])
 
 with tab1:
     st.header("🚀 Run Benchmarks")
@@ -108,7 +151,7 @@ with tab1:
         )
     
     # Benchmark buttons
-    col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
         if st.button("⚡ Quick Benchmark", disabled=st.session_state.benchmark_running, width="stretch"):
@@ -118,6 +161,7 @@ with tab1:
                     results = benchmark_ui.run_quick_benchmark()
                     if results:
                         st.session_state.last_results = results
+                        st.session_state.last_run_kind = 'quick'
                         st.success("✅ Quick benchmark completed!")
                     else:
                         st.error("❌ Quick benchmark failed")
@@ -129,9 +173,10 @@ with tab1:
             if not st.session_state.benchmark_running:
                 st.session_state.benchmark_running = True
                 with st.spinner(f"Running full benchmark with {batch_size} objects..."):
-                    results = benchmark_ui.run_benchmark(batch_size, iterations)
+                    results = benchmark_ui.run_benchmark(batch_size, iterations, options=run_options)
                     if results:
                         st.session_state.last_results = results
+                        st.session_state.last_run_kind = 'run'
                         st.success("✅ Full benchmark completed!")
                     else:
                         st.error("❌ Full benchmark failed")
@@ -143,9 +188,10 @@ with tab1:
             if not st.session_state.benchmark_running:
                 st.session_state.benchmark_running = True
                 with st.spinner(f"Running parallel benchmark with {batch_size} objects..."):
-                    results = benchmark_ui.run_benchmark_parallel(batch_size, iterations)
+                    results = benchmark_ui.run_benchmark_parallel(batch_size, iterations, options=run_options)
                     if results:
                         st.session_state.last_results = results
+                        st.session_state.last_run_kind = 'run-parallel'
                         st.success("✅ Parallel benchmark completed!")
                     else:
                         st.error("❌ Parallel benchmark failed")
@@ -153,7 +199,27 @@ with tab1:
                 st.rerun()
     
     with col4:
+        if st.button("🔁 Re-run", disabled=st.session_state.benchmark_running, width="stretch", help="Run again, bypassing cached results"):
+            if not st.session_state.benchmark_running:
+                st.session_state.benchmark_running = True
+                with st.spinner("Re-running benchmark..."):
+                    if st.session_state.last_run_kind == 'quick':
+                        results = benchmark_ui.run_quick_benchmark(force=True)
+                    elif st.session_state.last_run_kind == 'run-parallel':
+                        results = benchmark_ui.run_benchmark_parallel(batch_size, iterations, options=run_options, force=True)
+                    else:
+                        results = benchmark_ui.run_benchmark(batch_size, iterations, options=run_options, force=True)
+                    if results:
+                        st.session_state.last_results = results
+                        st.success("✅ Benchmark re-run completed!")
+                    else:
+                        st.error("❌ Benchmark re-run failed")
+                st.session_state.benchmark_running = False
+                st.rerun()
+
+    with col5:
         if st.button("🗑️ Clear Results", width="stretch"):
+            benchmark_ui.clear_cache()
             if 'last_results' in st.session_state:
                 del st.session_state.last_results
                 st.success("✅ Results cleared!")
@@ -200,6 +266,72 @@ with tab2:
             - **Best for**: High-performance applications requiring fast serialization
             """)
 
+with tab3:
+    st.header("🔀 Compare Runs")
+
+    cached_runs = benchmark_ui.cached_runs()
+    if len(cached_runs) < 2:
+        st.info("🎯 Run at least two benchmarks with different parameters to compare them here!")
+    else:
+        run_keys = list(cached_runs.keys())
+        col1, col2 = st.columns(2)
+
+        with col1:
+            key_a = st.selectbox(
+                "Run A",
+                options=run_keys,
+                index=0,
+                format_func=lambda key: cached_runs[key]['label'],
+                key="diff_run_a",
+            )
+        with col2:
+            key_b = st.selectbox(
+                "Run B",
+                options=run_keys,
+                index=len(run_keys) - 1,
+                format_func=lambda key: cached_runs[key]['label'],
+                key="diff_run_b",
+            )
+
+        results_viz.display_diff(
+            run_a=cached_runs[key_a]['results'],
+            run_b=cached_runs[key_b]['results'],
+            label_a=cached_runs[key_a]['label'],
+            label_b=cached_runs[key_b]['label'],
+            key_prefix="diff_",
+        )
+
+with tab4:
+    st.header("🧮 Benchmark Matrix")
+    st.caption("Every combination below is one cell; each shape's data is generated once and shared by all of its cells.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        matrix_frameworks = st.multiselect("Frameworks", options=["dataclass", "pydantic", "msgspec"], default=["dataclass", "pydantic", "msgspec"])
+        matrix_operations = st.multiselect("Operations", options=["instantiation", "serialization", "deserialization"], default=["instantiation", "serialization", "deserialization"])
+        matrix_iterations = st.slider("Samples per cell", min_value=1, max_value=50, value=5)
+    with col2:
+        matrix_batch_sizes = st.multiselect("Batch sizes", options=[10, 100, 1_000, 10_000, 100_000], default=[100, 1_000, 10_000])
+        matrix_shapes = st.text_input("Shapes", value="user, wide_20, wide_100", help="'user' or 'wide_<fields>', comma-separated")
+
+    shape_list = [shape.strip() for shape in matrix_shapes.split(",") if shape.strip()]
+    cell_count = len(matrix_frameworks) * len(matrix_operations) * len(matrix_batch_sizes) * len(shape_list)
+    if st.button(f"▶️ Run {cell_count} cells", disabled=cell_count == 0):
+        with st.spinner("Running matrix..."):
+            matrix_results = benchmark_ui.run_matrix(params={
+                'frameworks': matrix_frameworks,
+                'operations': matrix_operations,
+                'batch_sizes': matrix_batch_sizes,
+                'shapes': shape_list,
+                'iterations': matrix_iterations,
+                **{key: value for key, value in run_options.items() if key in ('gc_mode', 'shuffle')},
+            })
+        if matrix_results:
+            st.session_state.matrix_results = matrix_results
+
+    if st.session_state.matrix_results:
+        results_viz.display_matrix(st.session_state.matrix_results)
+
 # Footer
 st.divider()
 st.markdown("""